@@ -3,8 +3,8 @@ import warnings
 
 import numpy as np
 import pandas.util.testing as tm
-from pandas import (DataFrame, Series, MultiIndex, date_range, period_range,
-                    isnull, NaT)
+from pandas import (DataFrame, Series, MultiIndex, Categorical, date_range,
+                    period_range, isnull, NaT)
 
 from .pandas_vb_common import setup  # noqa
 
@@ -456,6 +456,27 @@ class SortValues(object):
         self.df.sort_values(by='A', ascending=ascending)
 
 
+class SortValuesMultiKey(object):
+
+    goal_time = 0.2
+    params = ['int', 'datetime', 'category']
+    param_names = ['dtype']
+
+    def setup(self, dtype):
+        N = 10**6
+        keys = {'int': np.random.randint(0, 1000, N),
+                'datetime': date_range('2000', periods=N, freq='s').values,
+                'category': Categorical(tm.makeStringIndex(1000).take(
+                    np.random.randint(0, 1000, N)))}
+        key = keys[dtype]
+        self.df = DataFrame({'key1': key,
+                             'key2': np.random.permutation(key),
+                             'value': np.random.randn(N)})
+
+    def time_frame_sort_values_multi_key(self, dtype):
+        self.df.sort_values(by=['key1', 'key2'])
+
+
 class SortIndexByColumns(object):
 
     goal_time = 0.2
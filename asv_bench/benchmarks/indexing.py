@@ -334,6 +334,37 @@ class AssignTimeseriesIndex(object):
         self.df['date'] = self.df.index
 
 
+class ScalarAccess(object):
+
+    goal_time = 0.2
+    params = [['int', 'string', 'datetime'], ['at', 'iat', 'loc', 'iloc']]
+    param_names = ['index', 'accessor']
+
+    def setup(self, index, accessor):
+        N = 10**5
+        indexes = {'int': Int64Index(np.arange(N) * 2),
+                   'string': tm.makeStringIndex(N),
+                   'datetime': date_range('2011-01-01', freq='S', periods=N)}
+        idx = indexes[index]
+        self.df = DataFrame(np.random.randn(N, 4), index=idx,
+                            columns=list('ABCD'))
+        self.df['E'] = date_range('2000-01-01', freq='D', periods=N)
+        self.s = self.df['A']
+        if accessor in ['iat', 'iloc']:
+            self.row, self.col, self.dt_col = N // 2, 2, 4
+        else:
+            self.row, self.col, self.dt_col = idx[N // 2], 'C', 'E'
+
+    def time_frame(self, index, accessor):
+        getattr(self.df, accessor)[self.row, self.col]
+
+    def time_frame_datetime_column(self, index, accessor):
+        getattr(self.df, accessor)[self.row, self.dt_col]
+
+    def time_series(self, index, accessor):
+        getattr(self.s, accessor)[self.row]
+
+
 class InsertColumns(object):
 
     goal_time = 0.2
@@ -352,3 +383,20 @@ class InsertColumns(object):
         np.random.seed(1234)
         for i in range(100):
             self.df[i] = np.random.randn(self.N)
+
+
+class InsertManyColumns(object):
+
+    goal_time = 0.2
+    params = ['block', 'columnar']
+    param_names = ['data_manager']
+
+    def setup(self, data_manager):
+        N = 10**3
+        self.df = DataFrame(index=range(N))._as_manager(data_manager)
+        self.values = np.random.randn(N)
+
+    def time_assign_with_setitem(self, data_manager):
+        for i in range(1000):
+            self.df[i] = self.values
+        self.df.sum()
@@ -253,6 +253,43 @@ class I8Merge(object):
         merge(self.left, self.right, how=how)
 
 
+class MergeManyToOne(object):
+
+    goal_time = 0.2
+    params = [['inner', 'left'], ['int', 'object']]
+    param_names = ['how', 'dtype']
+
+    def setup(self, how, dtype):
+        n, nkeys = 10**6, 10**4
+        keys = np.arange(nkeys)
+        if dtype == 'object':
+            keys = tm.makeStringIndex(nkeys).values
+        self.left = DataFrame({'key': np.random.choice(keys, n),
+                               'lval': np.random.randn(n)})
+        self.right = DataFrame({'key': keys[::-1],
+                                'rval': np.random.randn(nkeys)})
+
+    def time_merge_many_to_one(self, how, dtype):
+        merge(self.left, self.right, on='key', how=how, validate='m:1')
+
+
+class MergeSortedKeys(object):
+
+    goal_time = 0.2
+    params = ['inner', 'left', 'outer']
+    param_names = ['how']
+
+    def setup(self, how):
+        n = 10**6
+        self.left = DataFrame({'key': np.sort(np.random.randint(0, n, n)),
+                               'lval': np.random.randn(n)})
+        self.right = DataFrame({'key': np.arange(0, n, 2),
+                                'rval': np.random.randn(n // 2)})
+
+    def time_merge_sorted_keys(self, how):
+        merge(self.left, self.right, on='key', how=how, sort=True)
+
+
 class MergeCategoricals(object):
 
     goal_time = 0.2
@@ -23,6 +23,24 @@ class Methods(object):
         getattr(self.roll, method)()
 
 
+class WideFrameMethods(object):
+
+    sample_time = 0.2
+    params = ([1, 4],
+              ['mean', 'sum', 'var', 'max'])
+    param_names = ['nthreads', 'method']
+
+    def setup(self, nthreads, method):
+        self.roll = pd.DataFrame(np.random.randn(10**4, 1000)).rolling(100)
+        pd.set_option('compute.rolling_threads', nthreads)
+
+    def teardown(self, nthreads, method):
+        pd.reset_option('compute.rolling_threads')
+
+    def time_rolling(self, nthreads, method):
+        getattr(self.roll, method)()
+
+
 class VariableWindowMethods(Methods):
     sample_time = 0.2
     params = (['DataFrame', 'Series'],
@@ -39,6 +57,67 @@ class VariableWindowMethods(Methods):
         self.roll = getattr(pd, constructor)(arr, index=index).rolling(window)
 
 
+class ForwardWindowMethods(object):
+
+    sample_time = 0.2
+    params = ([10, 1000],
+              ['mean', 'sum', 'max', 'median'])
+    param_names = ['window', 'method']
+
+    def setup(self, window, method):
+        from pandas.api.indexers import BaseIndexer
+
+        class ForwardIndexer(BaseIndexer):
+            def get_window_bounds(self, num_values=0, min_periods=None,
+                                  center=None, closed=None):
+                start = np.arange(num_values, dtype='int64')
+                end = np.minimum(start + self.window_size, num_values)
+                return start, end
+
+        arr = np.random.random(10**5)
+        self.roll = pd.Series(arr).rolling(ForwardIndexer(window_size=window))
+
+    def time_rolling(self, window, method):
+        getattr(self.roll, method)()
+
+
+class GroupbyMethods(object):
+
+    sample_time = 0.2
+    params = (['rolling', 'expanding'],
+              ['mean', 'sum', 'std'])
+    param_names = ['window', 'method']
+
+    def setup(self, window, method):
+        N = 10**5
+        df = pd.DataFrame({'key': np.random.randint(0, N // 5, N),
+                           'value': np.random.randn(N)})
+        args = (5,) if window == 'rolling' else ()
+        self.window = getattr(df.groupby('key'), window)(*args)
+
+    def time_groupby(self, window, method):
+        getattr(self.window, method)()
+
+
+class OnlineMethods(object):
+
+    sample_time = 0.2
+    params = ['mean', 'std', 'median', 'ewm']
+    param_names = ['method']
+
+    def setup(self, method):
+        N = 10**6
+        s = pd.Series(np.random.randn(N))
+        if method == 'ewm':
+            self.online = s.ewm(halflife=100).online()
+        else:
+            self.online = s.rolling(1000).online(method)
+        self.batch = pd.Series(np.random.randn(10), index=range(N, N + 10))
+
+    def time_update(self, method):
+        self.online.update(self.batch)
+
+
 class Pairwise(object):
 
     sample_time = 0.2
@@ -60,6 +139,21 @@ class Pairwise(object):
         getattr(r, method)(self.df, pairwise=pairwise)
 
 
+class PairwiseColumns(object):
+
+    sample_time = 0.2
+    params = ([10, 100],
+              ['corr', 'cov'])
+    param_names = ['ncols', 'method']
+
+    def setup(self, ncols, method):
+        N = 10**3
+        self.df = pd.DataFrame(np.random.random((N, ncols)))
+
+    def time_pairwise(self, ncols, method):
+        getattr(self.df.rolling(window=50), method)(pairwise=True)
+
+
 class Quantile(object):
     sample_time = 0.2
     params = (['DataFrame', 'Series'],
@@ -77,3 +171,24 @@ class Quantile(object):
     def time_quantile(self, constructor, window, dtype, percentile,
                       interpolation):
         self.roll.quantile(percentile, interpolation=interpolation)
+
+
+class Quantiles(object):
+    sample_time = 0.2
+    params = (['DataFrame', 'Series'],
+              [10, 1000],
+              ['rolling', 'expanding'])
+    param_names = ['constructor', 'window', 'method']
+
+    def setup(self, constructor, window, method):
+        N = 10 ** 5
+        arr = np.random.random(N)
+        obj = getattr(pd, constructor)(arr)
+        if method == 'rolling':
+            self.roll = obj.rolling(window)
+        else:
+            self.roll = obj.expanding()
+        self.quantiles = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+    def time_quantiles(self, constructor, window, method):
+        self.roll.quantile(self.quantiles)
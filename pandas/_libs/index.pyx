@@ -72,6 +72,25 @@ cpdef object get_value_box(ndarray arr, object loc):
 # Don't populate hash tables in monotonic indexes larger than this
 _SIZE_CUTOFF = 1000000
 
+# How the numeric engines map the values to their locations: 'hash' with a
+# hash table, 'sorted' with a sorted permutation of the values (see
+# SortedInt64Mapping), or 'auto' to use the latter for indexes of at least
+# _SORTED_SIZE_CUTOFF values, set by the 'compute.index_engine' option
+_ENGINE_MODE = 'hash'
+_SORTED_SIZE_CUTOFF = 10000000
+
+
+def set_engine_mode(mode):
+    global _ENGINE_MODE
+    if mode not in ('hash', 'sorted', 'auto'):
+        raise ValueError("engine mode must be 'hash', 'sorted' or 'auto'")
+    _ENGINE_MODE = mode
+
+
+cdef inline bint _use_sorted_mapping(Py_ssize_t n):
+    return (_ENGINE_MODE == 'sorted' or
+            (_ENGINE_MODE == 'auto' and n >= _SORTED_SIZE_CUTOFF))
+
 
 cdef class IndexEngine:
 
@@ -272,8 +291,11 @@ cdef class IndexEngine:
 
         self.need_unique_check = 0
 
-    cpdef _call_map_locations(self, values):
-        self.mapping.map_locations(values)
+    cpdef _call_map_locations(self, values, Py_ssize_t offset=0):
+        self.mapping.map_locations(values, offset)
+
+    cdef bint _can_extend_mapping(self, HashTable mapping):
+        return True
 
     def clear_mapping(self):
         self.mapping = None
@@ -284,6 +306,52 @@ cdef class IndexEngine:
         self.monotonic_inc = 0
         self.monotonic_dec = 0
 
+    def _extend_from(self, IndexEngine other, Py_ssize_t n):
+        """
+        Carry the state of the engine of an index over to the engine of an
+        index whose first n values are the values of the former, e.g. the
+        result of appending to it.
+
+        The mapping is taken over from the other engine and extended with
+        the appended values, the other engine repopulates its own on demand.
+        """
+        cdef object inc, dec
+
+        values = self._get_index_values()
+        if self.is_mapping_populated or len(values) < n:
+            return
+
+        if not other.need_monotonic_check and n > 0:
+            # the values are monotonic if the old ones are and the new ones,
+            # starting with the last old one, are
+            try:
+                inc, dec, _ = self._call_monotonic(values[n - 1:])
+            except TypeError:
+                inc = dec = 0
+            self.monotonic_inc = other.monotonic_inc and inc
+            self.monotonic_dec = other.monotonic_dec and dec
+            self.need_monotonic_check = 0
+
+        if (other.is_mapping_populated and
+                not _use_sorted_mapping(len(values)) and
+                self._can_extend_mapping(other.mapping)):
+            self.mapping = other.mapping
+            other.mapping = None
+            try:
+                self._call_map_locations(values[n:], n)
+            except TypeError:
+                # e.g. unhashable appended values; the table may hold some
+                # of them, so neither engine can use it, both rebuild their
+                # own mapping on demand as they would without this
+                self.mapping = None
+                return
+
+            self.unique = len(self.mapping) == len(values)
+            self.need_unique_check = 0
+        elif not other.need_unique_check and not other.unique:
+            self.unique = 0
+            self.need_unique_check = 0
+
     def get_indexer(self, values):
         self._ensure_mapping_populated()
         return self.mapping.lookup(values)
@@ -482,8 +550,9 @@ cdef class PeriodEngine(Int64Engine):
     cdef _get_index_values(self):
         return super(PeriodEngine, self).vgetter()
 
-    cpdef _call_map_locations(self, values):
-        super(PeriodEngine, self)._call_map_locations(values.view('i8'))
+    cpdef _call_map_locations(self, values, Py_ssize_t offset=0):
+        super(PeriodEngine, self)._call_map_locations(values.view('i8'),
+                                                      offset)
 
     def _call_monotonic(self, values):
         return super(PeriodEngine, self)._call_monotonic(values.view('i8'))
@@ -624,7 +693,7 @@ cdef class BaseMultiIndexCodesEngine:
 
         Parameters
         ----------
-        target : list-like of keys
+        target : MultiIndex or list-like of keys
             Each key is a tuple, with a label for each level of the index.
 
         Returns
@@ -633,8 +702,17 @@ cdef class BaseMultiIndexCodesEngine:
             Integers representing one combination each
         """
 
-        level_codes = [lev.get_indexer(codes) + 1 for lev, codes
-                       in zip(self.levels, zip(*target))]
+        if getattr(target, '_typ', None) == 'multiindex':
+            # recode the labels of the target for the levels, rather than
+            # looking up its tuples: NaN (-1) and the labels missing from the
+            # levels both map to 0, as for keys
+            level_codes = [np.append(lev.get_indexer(tlev), -1).take(tlab) + 1
+                           for lev, tlev, tlab in zip(self.levels,
+                                                      target.levels,
+                                                      target.labels)]
+        else:
+            level_codes = [lev.get_indexer(codes) + 1 for lev, codes
+                           in zip(self.levels, zip(*target))]
         return self._codes_to_ints(np.array(level_codes, dtype='uint64').T)
 
     def get_indexer(self, object target, object method=None,
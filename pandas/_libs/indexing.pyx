@@ -1,5 +1,14 @@
 # cython: profile=False
 
+cimport numpy as cnp
+from numpy cimport ndarray
+cnp.import_array()
+
+cimport util
+
+from pandas._libs.tslibs import Timestamp, Timedelta
+
+
 cdef class _NDFrameIndexerBase:
     """
     A base class for _NDFrameIndexer for fast instantiation and attribute
@@ -20,3 +29,184 @@ cdef class _NDFrameIndexerBase:
         if ndim is None:
             ndim = self._ndim = self.obj.ndim
         return ndim
+
+
+# ----------------------------------------------------------------------
+# Scalar lookups
+
+# How the scalar lookups box the values of a block
+cdef enum:
+    BOX_NONE = 0        # numpy scalar, or the object of an object array
+    BOX_DATETIME = 1    # Timestamp
+    BOX_TIMEDELTA = 2   # Timedelta
+    BOX_FALLBACK = 3    # values not in an ndarray, take the slow path
+
+# the boxing of the values of each block class, filled on first use
+cdef dict _box_kinds = {}
+
+cdef object _missing = object()
+
+
+cdef inline int _get_box_kind(object blk) except -1:
+    cdef:
+        object cls = type(blk)
+        object kind = _box_kinds.get(cls)
+
+    if kind is None:
+        if not cls._can_consolidate or cls.is_extension:
+            kind = BOX_FALLBACK
+        elif cls.is_datetime:
+            kind = BOX_DATETIME
+        elif cls.is_timedelta:
+            kind = BOX_TIMEDELTA
+        else:
+            kind = BOX_NONE
+        _box_kinds[cls] = kind
+    return kind
+
+
+cdef inline object _box(ndarray values, Py_ssize_t i, Py_ssize_t j,
+                        int kind):
+    """ the value at column j of row i (at j of 1-dimensional values) """
+    cdef:
+        void* ptr
+
+    if values.ndim == 2:
+        ptr = cnp.PyArray_GETPTR2(values, i, j)
+    else:
+        ptr = cnp.PyArray_GETPTR1(values, j)
+    value = cnp.PyArray_Scalar(ptr, values.descr, values)
+
+    if kind == BOX_DATETIME:
+        return Timestamp(value)
+    elif kind == BOX_TIMEDELTA:
+        return Timedelta(value)
+    return value
+
+
+cdef inline Py_ssize_t _position(object key, Py_ssize_t n):
+    """ the position key along an axis of length n, -1 if out of bounds """
+    cdef:
+        Py_ssize_t i
+
+    if not util.is_integer_object(key):
+        return -1
+    i = key
+    if i < 0:
+        i += n
+    if i < 0 or i >= n:
+        return -1
+    return i
+
+
+cdef inline Py_ssize_t _engine_loc(object engine, object key):
+    """ the unique location of key in an index, -1 if there is none """
+    try:
+        loc = engine.get_loc(key)
+    except Exception:
+        return -1
+    if not util.is_integer_object(loc):
+        return -1
+    return loc
+
+
+cdef object _series_value(object mgr, object key, bint takeable,
+                          bint check_index):
+    cdef:
+        object blk, values
+        int kind
+        Py_ssize_t loc
+
+    blk = mgr.blocks[0]
+    kind = _get_box_kind(blk)
+    values = blk.values
+    if kind == BOX_FALLBACK or not util.is_array(values):
+        return _missing
+
+    if takeable:
+        loc = _position(key, len(values))
+    else:
+        index = mgr.axes[0]
+        if check_index:
+            # indexes and keys that Index.get_value handles differently
+            if (not index._can_get_value_from_engine or
+                    util.is_float_object(key)):
+                return _missing
+        loc = _engine_loc(index._engine, key)
+
+    if loc == -1:
+        return _missing
+    return _box(values, 0, loc, kind)
+
+
+cdef object _frame_value(object obj, object mgr, object row, object col,
+                         bint takeable):
+    cdef:
+        object blk, values, series
+        Py_ssize_t i, j
+        int kind
+
+    if not takeable:
+        # the column from the item cache, like DataFrame._get_value
+        series = obj._item_cache.get(col)
+        if series is None:
+            series = obj._get_item_cache(col)
+        mgr = series._data
+        if len(mgr.axes) != 1:
+            # duplicate column labels
+            return _missing
+        # the rows by the engine of any index, as in DataFrame._get_value
+        return _series_value(mgr, row, False, False)
+
+    j = _position(col, len(mgr.axes[0]))
+    if j == -1:
+        return _missing
+    blk = mgr.blocks[mgr._blknos[j]]
+    kind = _get_box_kind(blk)
+    values = blk.values
+    if (kind == BOX_FALLBACK or not util.is_array(values) or
+            values.ndim != 2):
+        return _missing
+
+    i = _position(row, values.shape[1])
+    if i == -1:
+        return _missing
+    return _box(values, mgr._blklocs[j], i, kind)
+
+
+def get_scalar(object obj, object key, bint takeable):
+    """
+    Look up a single value of a Series or DataFrame, the fast path of
+    ``at``, ``iat`` and scalar ``loc`` and ``iloc``
+
+    Takes a label or position found once along each axis to the value in
+    the numpy array of its block, with the boxing of the values of the block
+    class cached. Falls back on ``obj._get_value`` in any other case, e.g.
+    duplicate labels, extension arrays or keys the engines do not take as
+    they are.
+
+    Parameters
+    ----------
+    obj : Series or DataFrame
+    key : sequence
+        A label, or a position if takeable, for each axis.
+    takeable : bool
+
+    Returns
+    -------
+    scalar
+    """
+    cdef:
+        object mgr = obj._data
+        object result = _missing
+        Py_ssize_t nkeys = len(key)
+
+    if nkeys == len(mgr.axes):
+        if nkeys == 1:
+            result = _series_value(mgr, key[0], takeable, True)
+        elif nkeys == 2:
+            result = _frame_value(obj, mgr, key[0], key[1], takeable)
+
+    if result is _missing:
+        return obj._get_value(*key, takeable=takeable)
+    return result
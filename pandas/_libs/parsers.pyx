@@ -6,6 +6,8 @@ import time
 import warnings
 
 from csv import QUOTE_MINIMAL, QUOTE_NONNUMERIC, QUOTE_NONE
+from functools import partial
+from multiprocessing.pool import ThreadPool
 
 from libc.stdlib cimport free
 from libc.string cimport strncpy, strlen, strcasecmp
@@ -284,9 +286,10 @@ cdef class TextReader:
         char *c_encoding
         kh_str_t *false_set
         kh_str_t *true_set
+        object pool
 
     cdef public:
-        int64_t leading_cols, table_width, skipfooter, buffer_lines
+        int64_t leading_cols, table_width, skipfooter, buffer_lines, nthreads
         object allow_leading_cols
         object delimiter, converters, delim_whitespace
         object na_values
@@ -354,7 +357,8 @@ cdef class TextReader:
                   mangle_dupe_cols=True,
                   tupleize_cols=False,
                   float_precision=None,
-                  skip_blank_lines=True):
+                  skip_blank_lines=True,
+                  nthreads=1):
 
         # set encoding for native Python and C library
         if encoding is not None:
@@ -474,6 +478,13 @@ cdef class TextReader:
 
         self.verbose = verbose
         self.low_memory = low_memory
+
+        if nthreads is None:
+            nthreads = 1
+        if nthreads < 1:
+            raise ValueError('nthreads must be a positive integer')
+        self.nthreads = nthreads
+
         self.parser.double_converter_nogil = xstrtod
         self.parser.double_converter_withgil = NULL
         if float_precision == 'high':
@@ -551,6 +562,15 @@ cdef class TextReader:
         pass
 
     def __dealloc__(self):
+        # the pool is closed and joined by close(), or when the Python
+        # wrapper is collected; joining threads here, where the reader is
+        # partly torn down or the interpreter shutting down, can hang
+        if self.pool is not None:
+            try:
+                self.pool.terminate()
+            except Exception:
+                pass
+            self.pool = None
         parser_free(self.parser)
         if self.true_set:
             kh_destroy_str(self.true_set)
@@ -568,6 +588,7 @@ cdef class TextReader:
                 self.handle.close()
             except:
                 pass
+        self.close_pool()
         # also preemptively free all allocated memory
         parser_free(self.parser)
         if self.true_set:
@@ -577,6 +598,13 @@ cdef class TextReader:
             kh_destroy_str(self.false_set)
             self.false_set = NULL
 
+    def close_pool(self):
+        """ stop the threads converting the columns, if any """
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
     def set_error_bad_lines(self, int status):
         self.parser.error_bad_lines = status
 
@@ -1002,10 +1030,9 @@ cdef class TextReader:
         cdef:
             int64_t i
             int nused
-            kh_str_t *na_hashset = NULL
             int64_t start, end
-            object name, na_flist, col_dtype = None
-            bint na_filter = 0
+            object name, na_list, na_flist, col_dtype = None
+            list columns
             int64_t num_cols
 
         start = self.parser_start
@@ -1030,7 +1057,10 @@ cdef class TextReader:
                 "Too many columns specified: expected %s and found %s" %
                 (self.table_width - self.leading_cols, num_cols))
 
-        results = {}
+        # Resolve the per-column conversion options up front so that the
+        # conversions themselves only read from the (already tokenized)
+        # parser buffers and can safely run concurrently
+        columns = []
         nused = 0
         for i in range(self.table_width):
             if i < self.leading_cols:
@@ -1056,16 +1086,10 @@ cdef class TextReader:
             conv = self._get_converter(i, name)
 
             # XXX
+            na_list = None
             na_flist = set()
             if self.na_filter:
                 na_list, na_flist = self._get_na_list(i, name)
-                if na_list is None:
-                    na_filter = 0
-                else:
-                    na_filter = 1
-                    na_hashset = kset_from_list(na_list)
-            else:
-                na_filter = 0
 
             col_dtype = None
             if self.dtype is not None:
@@ -1081,35 +1105,64 @@ cdef class TextReader:
                     else:
                         col_dtype = self.dtype
 
-            if conv:
-                if col_dtype is not None:
-                    warnings.warn(("Both a converter and dtype were specified "
-                                   "for column {0} - only the converter will "
-                                   "be used").format(name), ParserWarning,
-                                  stacklevel=5)
-                results[i] = _apply_converter(conv, self.parser, i, start, end,
-                                              self.c_encoding)
-                continue
+            if conv and col_dtype is not None:
+                warnings.warn(("Both a converter and dtype were specified "
+                               "for column {0} - only the converter will "
+                               "be used").format(name), ParserWarning,
+                              stacklevel=5)
+
+            columns.append((i, name, conv, na_list, na_flist, col_dtype))
+
+        convert = partial(self._convert_column, start, end, upcast_na)
+        if self.nthreads > 1 and len(columns) > 1:
+            # the numeric conversion kernels release the GIL, so the
+            # columns of a tokenized chunk can be converted in parallel, on
+            # a pool kept for the following chunks
+            if self.pool is None:
+                self.pool = ThreadPool(processes=self.nthreads)
+            converted = self.pool.map(convert, columns)
+        else:
+            converted = [convert(column) for column in columns]
+
+        results = {column[0]: col_res
+                   for column, col_res in zip(columns, converted)}
+
+        self.parser_start += end - start
 
+        return results
+
+    def _convert_column(self, int64_t start, int64_t end, bint upcast_na,
+                        tuple column):
+        cdef:
+            kh_str_t *na_hashset = NULL
+            bint na_filter = 0
+
+        i, name, conv, na_list, na_flist, col_dtype = column
+
+        if conv:
+            return _apply_converter(conv, self.parser, i, start, end,
+                                    self.c_encoding)
+
+        if na_list is not None:
+            na_filter = 1
+            na_hashset = kset_from_list(na_list)
+
+        try:
             # Should return as the desired dtype (inferred or specified)
             col_res, na_count = self._convert_tokens(
                 i, start, end, name, na_filter, na_hashset,
                 na_flist, col_dtype)
-
+        finally:
             if na_filter:
                 self._free_na_set(na_hashset)
 
-            if upcast_na and na_count > 0:
-                col_res = _maybe_upcast(col_res)
-
-            if col_res is None:
-                raise ParserError('Unable to parse column %d' % i)
+        if upcast_na and na_count > 0:
+            col_res = _maybe_upcast(col_res)
 
-            results[i] = col_res
+        if col_res is None:
+            raise ParserError('Unable to parse column %d' % i)
 
-        self.parser_start += end - start
-
-        return results
+        return col_res
 
     cdef inline _convert_tokens(self, Py_ssize_t i, int start, int end,
                                 object name, bint na_filter,
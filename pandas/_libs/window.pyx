@@ -293,6 +293,170 @@ cdef class VariableWindowIndexer(WindowIndexer):
                     end[i] -= 1
 
 
+cdef class WindowBounds:
+    """
+    precomputed start & end offsets of the windows, the i-th window
+    being input[start[i]:end[i]]; passed to the roll_* functions in
+    place of the index
+
+    Parameters
+    ----------
+    start: ndarray[int64_t]
+        start of each window (including), monotonic increasing
+    end: ndarray[int64_t]
+        end of each window (not including), monotonic increasing
+    """
+    cdef readonly:
+        ndarray start, end
+
+    def __init__(self, ndarray[int64_t] start, ndarray[int64_t] end):
+        if len(start) != len(end):
+            raise ValueError("start and end of the window bounds must "
+                             "have the same length")
+        self.start = start
+        self.end = end
+
+    def __len__(self):
+        return len(self.start)
+
+
+cdef class BoundedWindowIndexer(WindowIndexer):
+    """
+    create a variable length window indexer object
+    from precomputed window bounds
+
+    Parameters
+    ----------
+    input: ndarray
+        input data array
+    win: int64_t
+        window size
+    minp: int64_t
+        min number of obs in a window to consider non-NaN
+    bounds: WindowBounds
+        start & end offsets of the windows
+    floor: optional
+        unit for flooring the unit
+    """
+    def __init__(self, ndarray input, int64_t win, int64_t minp,
+                 WindowBounds bounds, object floor=None):
+
+        assert len(bounds) == len(input)
+        self.is_variable = 1
+        self.N = len(input)
+        self.minp = _check_minp(win, minp, self.N, floor=floor)
+        self.start = bounds.start
+        self.end = bounds.end
+
+        # max window size
+        self.win = (self.end - self.start).max() if self.N else 0
+
+
+def grouped_window_bounds(ndarray[int64_t] offsets, int64_t win,
+                          object index=None, object closed=None,
+                          int64_t center_offset=0):
+    """
+    window bounds over data sorted by group, such that no window
+    crosses the boundaries of its group
+
+    Parameters
+    ----------
+    offsets: ndarray[int64_t]
+        start of each group in the sorted data, followed by the
+        length of the data (ngroups + 1 values)
+    win: int64_t
+        window size
+    index: ndarray[int64_t], optional
+        sorted index of the data for variable windows, expected to
+        be monotonic within each group; fixed windows if None
+    closed: string, default None
+        {'right', 'left', 'both', 'neither'}
+        window endpoint closedness of variable windows
+    center_offset: int64_t, default 0
+        lead of fixed windows that are set to the center
+
+    Returns
+    -------
+    WindowBounds
+    """
+    cdef:
+        ndarray[int64_t] start, end, idx
+        int64_t N, ngroups, g0, g1, start_bound, end_bound
+        bint left_closed = False
+        bint right_closed = False
+        Py_ssize_t g, i, j
+
+    N = offsets[len(offsets) - 1] if len(offsets) else 0
+    ngroups = len(offsets) - 1
+    start = np.empty(N, dtype='int64')
+    end = np.empty(N, dtype='int64')
+
+    if index is None:
+
+        with nogil:
+            for g in range(ngroups):
+                g0 = offsets[g]
+                g1 = offsets[g + 1]
+                for i in range(g0, g1):
+                    end[i] = min(g1, i + center_offset + 1)
+                    start[i] = min(end[i],
+                                   max(g0, i + center_offset - win + 1))
+
+        return WindowBounds(start, end)
+
+    assert closed is None or closed in ['right', 'left', 'both', 'neither']
+    if closed is None:
+        closed = 'right'
+    if closed in ['right', 'both']:
+        right_closed = True
+    if closed in ['left', 'both']:
+        left_closed = True
+
+    idx = index
+    assert len(idx) == N
+
+    with nogil:
+
+        # the VariableWindowIndexer over each group
+        for g in range(ngroups):
+            g0 = offsets[g]
+            g1 = offsets[g + 1]
+            if g0 == g1:
+                continue
+
+            start[g0] = g0
+            end[g0] = g0 + 1 if right_closed else g0
+
+            for i in range(g0 + 1, g1):
+                end_bound = idx[i]
+                start_bound = idx[i] - win
+
+                # left endpoint is closed
+                if left_closed:
+                    start_bound -= 1
+
+                # advance the start bound until we are
+                # within the constraint
+                start[i] = i
+                for j in range(start[i - 1], i):
+                    if idx[j] > start_bound:
+                        start[i] = j
+                        break
+
+                # end bound is previous end
+                # or current index
+                if idx[end[i - 1]] <= end_bound:
+                    end[i] = i + 1
+                else:
+                    end[i] = end[i - 1]
+
+                # right endpoint is open
+                if not right_closed:
+                    end[i] -= 1
+
+    return WindowBounds(start, end)
+
+
 def get_window_indexer(input, win, minp, index, closed,
                        floor=None, use_mock=True):
     """
@@ -303,8 +467,9 @@ def get_window_indexer(input, win, minp, index, closed,
     input: 1d ndarray
     win: integer, window size
     minp: integer, minimum periods
-    index: 1d ndarray, optional
-        index to the input array
+    index: 1d ndarray or WindowBounds, optional
+        index to the input array, or the precomputed bounds of
+        the windows
     closed: string, default None
         {'right', 'left', 'both', 'neither'}
         window endpoint closedness. Defaults to 'right' in
@@ -340,7 +505,9 @@ def get_window_indexer(input, win, minp, index, closed,
     if closed in ['left', 'both']:
         left_closed = True
 
-    if index is not None:
+    if isinstance(index, WindowBounds):
+        indexer = BoundedWindowIndexer(input, win, minp, index, floor)
+    elif index is not None:
         indexer = VariableWindowIndexer(input, win, minp, left_closed,
                                         right_closed, index, floor)
     elif use_mock:
@@ -440,12 +607,11 @@ cdef inline void remove_sum(double val, int64_t *nobs, double *sum_x) nogil:
 def roll_sum(ndarray[double_t] input, int64_t win, int64_t minp,
              object index, object closed):
     cdef:
-        double val, prev_x, sum_x = 0
-        int64_t s, e, range_endpoint
-        int64_t nobs = 0, i, j, N
+        int64_t N
         bint is_variable
-        ndarray[int64_t] start, end
-        ndarray[double_t] output
+        const int64_t[:] start, end
+        const double_t[:] values = input
+        double_t[:] output
 
     start, end, N, win, minp, is_variable = get_window_indexer(input, win,
                                                                minp, index,
@@ -453,6 +619,49 @@ def roll_sum(ndarray[double_t] input, int64_t win, int64_t minp,
                                                                floor=0)
     output = np.empty(N, dtype=float)
 
+    with nogil:
+        _roll_sum(values, output, start, end, N, win, minp, is_variable)
+
+    return np.asarray(output)
+
+
+def roll_sum_2d(ndarray[double_t, ndim=2] input, int64_t win, int64_t minp,
+                object index, object closed):
+    """
+    roll_sum over each row of a 2D array, computing the window bounds once
+    and releasing the GIL for the whole block
+    """
+    cdef:
+        int64_t N
+        Py_ssize_t k
+        bint is_variable
+        const int64_t[:] start, end
+        const double_t[:, :] values = input
+        double_t[:, :] output
+
+    start, end, N, win, minp, is_variable = get_window_indexer(input[0], win,
+                                                               minp, index,
+                                                               closed,
+                                                               floor=0)
+    output = np.empty((len(input), N), dtype=float)
+
+    with nogil:
+        for k in range(output.shape[0]):
+            _roll_sum(values[k], output[k], start, end, N, win, minp,
+                      is_variable)
+
+    return np.asarray(output)
+
+
+cdef void _roll_sum(const double_t[:] input, double_t[:] output,
+                    const int64_t[:] start, const int64_t[:] end,
+                    int64_t N, int64_t win, int64_t minp,
+                    bint is_variable) nogil:
+    cdef:
+        double val, prev_x, sum_x = 0
+        int64_t s, e, range_endpoint
+        int64_t nobs = 0, i, j
+
     # for performance we are going to iterate
     # fixed windows separately, makes the code more complex as we have 2 paths
     # but is faster
@@ -460,31 +669,30 @@ def roll_sum(ndarray[double_t] input, int64_t win, int64_t minp,
     if is_variable:
 
         # variable window
-        with nogil:
-
-            for i in range(0, N):
-                s = start[i]
-                e = end[i]
+        for i in range(0, N):
+            s = start[i]
+            e = end[i]
 
-                if i == 0:
+            if i == 0 or s >= end[i - 1]:
 
-                    # setup
-                    sum_x = 0.0
-                    nobs = 0
-                    for j in range(s, e):
-                        add_sum(input[j], &nobs, &sum_x)
+                # setup, also when the window does not overlap the
+                # previous one (e.g. at a group boundary)
+                sum_x = 0.0
+                nobs = 0
+                for j in range(s, e):
+                    add_sum(input[j], &nobs, &sum_x)
 
-                else:
+            else:
 
-                    # calculate deletes
-                    for j in range(start[i - 1], s):
-                        remove_sum(input[j], &nobs, &sum_x)
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    remove_sum(input[j], &nobs, &sum_x)
 
-                    # calculate adds
-                    for j in range(end[i - 1], e):
-                        add_sum(input[j], &nobs, &sum_x)
+                # calculate adds
+                for j in range(end[i - 1], e):
+                    add_sum(input[j], &nobs, &sum_x)
 
-                output[i] = calc_sum(minp, nobs, sum_x)
+            output[i] = calc_sum(minp, nobs, sum_x)
 
     else:
 
@@ -492,23 +700,19 @@ def roll_sum(ndarray[double_t] input, int64_t win, int64_t minp,
 
         range_endpoint = int_max(minp, 1) - 1
 
-        with nogil:
-
-            for i in range(0, range_endpoint):
-                add_sum(input[i], &nobs, &sum_x)
-                output[i] = NaN
-
-            for i in range(range_endpoint, N):
-                val = input[i]
-                add_sum(val, &nobs, &sum_x)
+        for i in range(0, range_endpoint):
+            add_sum(input[i], &nobs, &sum_x)
+            output[i] = NaN
 
-                if i > win - 1:
-                    prev_x = input[i - win]
-                    remove_sum(prev_x, &nobs, &sum_x)
+        for i in range(range_endpoint, N):
+            val = input[i]
+            add_sum(val, &nobs, &sum_x)
 
-                output[i] = calc_sum(minp, nobs, sum_x)
+            if i > win - 1:
+                prev_x = input[i - win]
+                remove_sum(prev_x, &nobs, &sum_x)
 
-    return output
+            output[i] = calc_sum(minp, nobs, sum_x)
 
 # ----------------------------------------------------------------------
 # Rolling mean
@@ -559,72 +763,110 @@ cdef inline void remove_mean(double val, Py_ssize_t *nobs, double *sum_x,
 def roll_mean(ndarray[double_t] input, int64_t win, int64_t minp,
               object index, object closed):
     cdef:
-        double val, prev_x, result, sum_x = 0
-        int64_t s, e
+        int64_t N
         bint is_variable
-        Py_ssize_t nobs = 0, i, j, neg_ct = 0, N
-        ndarray[int64_t] start, end
-        ndarray[double_t] output
+        const int64_t[:] start, end
+        const double_t[:] values = input
+        double_t[:] output
 
     start, end, N, win, minp, is_variable = get_window_indexer(input, win,
                                                                minp, index,
                                                                closed)
     output = np.empty(N, dtype=float)
 
+    with nogil:
+        _roll_mean(values, output, start, end, N, win, minp, is_variable)
+
+    return np.asarray(output)
+
+
+def roll_mean_2d(ndarray[double_t, ndim=2] input, int64_t win, int64_t minp,
+                 object index, object closed):
+    """
+    roll_mean over each row of a 2D array, computing the window bounds once
+    and releasing the GIL for the whole block
+    """
+    cdef:
+        int64_t N
+        Py_ssize_t k
+        bint is_variable
+        const int64_t[:] start, end
+        const double_t[:, :] values = input
+        double_t[:, :] output
+
+    start, end, N, win, minp, is_variable = get_window_indexer(input[0], win,
+                                                               minp, index,
+                                                               closed)
+    output = np.empty((len(input), N), dtype=float)
+
+    with nogil:
+        for k in range(output.shape[0]):
+            _roll_mean(values[k], output[k], start, end, N, win, minp,
+                       is_variable)
+
+    return np.asarray(output)
+
+
+cdef void _roll_mean(const double_t[:] input, double_t[:] output,
+                     const int64_t[:] start, const int64_t[:] end,
+                     int64_t N, int64_t win, int64_t minp,
+                     bint is_variable) nogil:
+    cdef:
+        double val, prev_x, sum_x = 0
+        int64_t s, e
+        Py_ssize_t nobs = 0, i, j, neg_ct = 0
+
     # for performance we are going to iterate
     # fixed windows separately, makes the code more complex as we have 2 paths
     # but is faster
 
     if is_variable:
 
-        with nogil:
-
-            for i in range(0, N):
-                s = start[i]
-                e = end[i]
+        for i in range(0, N):
+            s = start[i]
+            e = end[i]
 
-                if i == 0:
+            if i == 0 or s >= end[i - 1]:
 
-                    # setup
-                    sum_x = 0.0
-                    nobs = 0
-                    for j in range(s, e):
-                        val = input[j]
-                        add_mean(val, &nobs, &sum_x, &neg_ct)
+                # setup, also when the window does not overlap the
+                # previous one (e.g. at a group boundary)
+                sum_x = 0.0
+                nobs = 0
+                neg_ct = 0
+                for j in range(s, e):
+                    val = input[j]
+                    add_mean(val, &nobs, &sum_x, &neg_ct)
 
-                else:
+            else:
 
-                    # calculate deletes
-                    for j in range(start[i - 1], s):
-                        val = input[j]
-                        remove_mean(val, &nobs, &sum_x, &neg_ct)
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    val = input[j]
+                    remove_mean(val, &nobs, &sum_x, &neg_ct)
 
-                    # calculate adds
-                    for j in range(end[i - 1], e):
-                        val = input[j]
-                        add_mean(val, &nobs, &sum_x, &neg_ct)
+                # calculate adds
+                for j in range(end[i - 1], e):
+                    val = input[j]
+                    add_mean(val, &nobs, &sum_x, &neg_ct)
 
-                output[i] = calc_mean(minp, nobs, neg_ct, sum_x)
+            output[i] = calc_mean(minp, nobs, neg_ct, sum_x)
 
     else:
 
-        with nogil:
-            for i from 0 <= i < minp - 1:
-                val = input[i]
-                add_mean(val, &nobs, &sum_x, &neg_ct)
-                output[i] = NaN
-
-            for i from minp - 1 <= i < N:
-                val = input[i]
-                add_mean(val, &nobs, &sum_x, &neg_ct)
+        for i from 0 <= i < minp - 1:
+            val = input[i]
+            add_mean(val, &nobs, &sum_x, &neg_ct)
+            output[i] = NaN
 
-                if i > win - 1:
-                    prev_x = input[i - win]
-                    remove_mean(prev_x, &nobs, &sum_x, &neg_ct)
+        for i from minp - 1 <= i < N:
+            val = input[i]
+            add_mean(val, &nobs, &sum_x, &neg_ct)
 
-                output[i] = calc_mean(minp, nobs, neg_ct, sum_x)
+            if i > win - 1:
+                prev_x = input[i - win]
+                remove_mean(prev_x, &nobs, &sum_x, &neg_ct)
 
-    return output
+            output[i] = calc_mean(minp, nobs, neg_ct, sum_x)
 
 # ----------------------------------------------------------------------
 # Rolling variance
@@ -691,12 +933,11 @@ def roll_var(ndarray[double_t] input, int64_t win, int64_t minp,
     Numerically stable implementation using Welford's method.
     """
     cdef:
-        double val, prev, mean_x = 0, ssqdm_x = 0, nobs = 0, delta, mean_x_old
-        int64_t s, e
+        int64_t N
         bint is_variable
-        Py_ssize_t i, j, N
-        ndarray[int64_t] start, end
-        ndarray[double_t] output
+        const int64_t[:] start, end
+        const double_t[:] values = input
+        double_t[:] output
 
     start, end, N, win, minp, is_variable = get_window_indexer(input, win,
                                                                minp, index,
@@ -706,78 +947,294 @@ def roll_var(ndarray[double_t] input, int64_t win, int64_t minp,
     # Check for windows larger than array, addresses #7297
     win = min(win, N)
 
+    with nogil:
+        _roll_var(values, output, start, end, N, win, minp, is_variable, ddof)
+
+    return np.asarray(output)
+
+
+def roll_var_2d(ndarray[double_t, ndim=2] input, int64_t win, int64_t minp,
+                object index, object closed, int ddof=1):
+    """
+    roll_var over each row of a 2D array, computing the window bounds once
+    and releasing the GIL for the whole block
+    """
+    cdef:
+        int64_t N
+        Py_ssize_t k
+        bint is_variable
+        const int64_t[:] start, end
+        const double_t[:, :] values = input
+        double_t[:, :] output
+
+    start, end, N, win, minp, is_variable = get_window_indexer(input[0], win,
+                                                               minp, index,
+                                                               closed)
+    output = np.empty((len(input), N), dtype=float)
+
+    # Check for windows larger than array, addresses #7297
+    win = min(win, N)
+
+    with nogil:
+        for k in range(output.shape[0]):
+            _roll_var(values[k], output[k], start, end, N, win, minp,
+                      is_variable, ddof)
+
+    return np.asarray(output)
+
+
+cdef void _roll_var(const double_t[:] input, double_t[:] output,
+                    const int64_t[:] start, const int64_t[:] end,
+                    int64_t N, int64_t win, int64_t minp,
+                    bint is_variable, int ddof) nogil:
+    cdef:
+        double val, prev, mean_x = 0, ssqdm_x = 0, nobs = 0, delta, mean_x_old
+        int64_t s, e
+        Py_ssize_t i, j
+
     # for performance we are going to iterate
     # fixed windows separately, makes the code more complex as we
     # have 2 paths but is faster
 
     if is_variable:
 
-        with nogil:
+        for i in range(0, N):
 
-            for i in range(0, N):
+            s = start[i]
+            e = end[i]
 
-                s = start[i]
-                e = end[i]
+            # Over the first window, observations can only be added
+            # never removed; the same holds for a window that does not
+            # overlap the previous one (e.g. at a group boundary)
+            if i == 0 or s >= end[i - 1]:
 
-                # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
-
-                    for j in range(s, e):
-                        add_var(input[j], &nobs, &mean_x, &ssqdm_x)
+                nobs = mean_x = ssqdm_x = 0
+                for j in range(s, e):
+                    add_var(input[j], &nobs, &mean_x, &ssqdm_x)
 
-                else:
+            else:
 
-                    # After the first window, observations can both be added
-                    # and removed
+                # After the first window, observations can both be added
+                # and removed
 
-                    # calculate adds
-                    for j in range(end[i - 1], e):
-                        add_var(input[j], &nobs, &mean_x, &ssqdm_x)
+                # calculate adds
+                for j in range(end[i - 1], e):
+                    add_var(input[j], &nobs, &mean_x, &ssqdm_x)
 
-                    # calculate deletes
-                    for j in range(start[i - 1], s):
-                        remove_var(input[j], &nobs, &mean_x, &ssqdm_x)
+                # calculate deletes
+                for j in range(start[i - 1], s):
+                    remove_var(input[j], &nobs, &mean_x, &ssqdm_x)
 
-                output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
+            output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
 
     else:
 
-        with nogil:
+        # Over the first window, observations can only be added, never
+        # removed
+        for i from 0 <= i < win:
+            add_var(input[i], &nobs, &mean_x, &ssqdm_x)
+            output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
 
-            # Over the first window, observations can only be added, never
-            # removed
-            for i from 0 <= i < win:
-                add_var(input[i], &nobs, &mean_x, &ssqdm_x)
-                output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
+        # a part of Welford's method for the online variance-calculation
+        # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
 
-            # a part of Welford's method for the online variance-calculation
-            # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
+        # After the first window, observations can both be added and
+        # removed
+        for i from win <= i < N:
+            val = input[i]
+            prev = input[i - win]
 
-            # After the first window, observations can both be added and
-            # removed
-            for i from win <= i < N:
-                val = input[i]
-                prev = input[i - win]
+            if val == val:
+                if prev == prev:
+
+                    # Adding one observation and removing another one
+                    delta = val - prev
+                    mean_x_old = mean_x
 
-                if val == val:
-                    if prev == prev:
+                    mean_x += delta / nobs
+                    ssqdm_x += ((nobs - 1) * val
+                                + (nobs + 1) * prev
+                                - 2 * nobs * mean_x_old) * delta / nobs
 
-                        # Adding one observation and removing another one
-                        delta = val - prev
-                        mean_x_old = mean_x
+                else:
+                    add_var(val, &nobs, &mean_x, &ssqdm_x)
+            elif prev == prev:
+                remove_var(prev, &nobs, &mean_x, &ssqdm_x)
 
-                        mean_x += delta / nobs
-                        ssqdm_x += ((nobs - 1) * val
-                                    + (nobs + 1) * prev
-                                    - 2 * nobs * mean_x_old) * delta / nobs
+            output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
 
-                    else:
-                        add_var(val, &nobs, &mean_x, &ssqdm_x)
-                elif prev == prev:
-                    remove_var(prev, &nobs, &mean_x, &ssqdm_x)
 
-                output[i] = calc_var(minp, ddof, nobs, ssqdm_x)
+# ----------------------------------------------------------------------
+# Rolling pairwise covariance and correlation
+
+
+cdef inline void add_cov(double x, double y, double *nobs, double *mean_x,
+                         double *mean_y, double *ssqdm_x, double *ssqdm_y,
+                         double *sdm_xy) nogil:
+    """ add a pair of values to the co-moments calc """
+    cdef double dx, dy
+
+    nobs[0] = nobs[0] + 1
+    # the bivariate form of Welford's method, see add_var
+    dx = x - mean_x[0]
+    dy = y - mean_y[0]
+    mean_x[0] = mean_x[0] + dx / nobs[0]
+    mean_y[0] = mean_y[0] + dy / nobs[0]
+    ssqdm_x[0] = ssqdm_x[0] + dx * (x - mean_x[0])
+    ssqdm_y[0] = ssqdm_y[0] + dy * (y - mean_y[0])
+    sdm_xy[0] = sdm_xy[0] + dx * (y - mean_y[0])
+
+
+cdef inline void remove_cov(double x, double y, double *nobs, double *mean_x,
+                            double *mean_y, double *ssqdm_x, double *ssqdm_y,
+                            double *sdm_xy) nogil:
+    """ remove a pair of values from the co-moments calc """
+    cdef double dx, dy
+
+    nobs[0] = nobs[0] - 1
+    if nobs[0]:
+        dx = x - mean_x[0]
+        dy = y - mean_y[0]
+        mean_x[0] = mean_x[0] - dx / nobs[0]
+        mean_y[0] = mean_y[0] - dy / nobs[0]
+        ssqdm_x[0] = ssqdm_x[0] - dx * (x - mean_x[0])
+        ssqdm_y[0] = ssqdm_y[0] - dy * (y - mean_y[0])
+        sdm_xy[0] = sdm_xy[0] - (x - mean_x[0]) * dy
+    else:
+        mean_x[0] = 0
+        mean_y[0] = 0
+        ssqdm_x[0] = 0
+        ssqdm_y[0] = 0
+        sdm_xy[0] = 0
+
+
+cdef inline double calc_cov(int64_t minp, int ddof, bint corr, double nobs,
+                            double ssqdm_x, double ssqdm_y,
+                            double sdm_xy) nogil:
+    if nobs >= minp and nobs > 0:
+        if corr:
+            if ssqdm_x <= 0 or ssqdm_y <= 0:
+                return NaN
+            return sdm_xy / sqrt(ssqdm_x * ssqdm_y)
+        if nobs > ddof:
+            return sdm_xy / (nobs - ddof)
+    return NaN
+
+
+def roll_cov_pairwise(ndarray[double_t, ndim=2] X,
+                      ndarray[double_t, ndim=2] Y, int64_t win,
+                      int64_t minp, object index, object closed,
+                      int ddof=1, bint corr=False, bint upper=False):
+    """
+    Rolling covariance, or correlation, of every column of X with every
+    column of Y in a single pass over the rows, each pair using the rows
+    where both of its values are valid
+
+    Parameters
+    ----------
+    X, Y : 2d ndarray with the same number of rows
+        if they are the same array, only the pairs i <= j are computed
+    win, minp, index, closed : as in the other rolling functions
+    ddof : int, default 1
+        delta degrees of freedom of the covariance
+    corr : bool, default False
+        compute the correlation instead of the covariance
+    upper : bool, default False
+        if X is Y, only fill the upper triangle out[t, j, i] with j <= i
+        and leave the pairs j > i as NaN instead of copying them from the
+        symmetric pair
+
+    Returns
+    -------
+    3d ndarray of shape (N, Y.shape[1], X.shape[1]), where out[t, j, i] is
+    the statistic of X[:, i] and Y[:, j] over the window of row t
+    """
+    cdef:
+        double x, y
+        int64_t i, j, k, i0, r, s, e, N, K1, K2, p
+        bint is_variable, same
+        ndarray[int64_t] start, end
+        ndarray[double_t, ndim=3] output
+        double *nobs
+        double *mean_x
+        double *mean_y
+        double *ssqdm_x
+        double *ssqdm_y
+        double *sdm_xy
+
+    K1 = X.shape[1]
+    K2 = Y.shape[1]
+    if X.shape[0] != Y.shape[0]:
+        raise ValueError("X and Y must have the same number of rows")
+
+    same = X is Y
+    start, end, N, win, minp, is_variable = get_window_indexer(
+        np.empty(X.shape[0]), win,
+        minp, index, closed,
+        use_mock=False)
+
+    output = np.empty((N, K2, K1), dtype=float)
+    output.fill(NaN)
+    if not K1 or not K2:
+        return output
+
+    nobs = <double *> malloc(6 * K1 * K2 * sizeof(double))
+    if nobs == NULL:
+        raise MemoryError("unable to allocate memory for the co-moments")
+    for p in range(6 * K1 * K2):
+        nobs[p] = 0
+    mean_x = nobs + K1 * K2
+    mean_y = mean_x + K1 * K2
+    ssqdm_x = mean_y + K1 * K2
+    ssqdm_y = ssqdm_x + K1 * K2
+    sdm_xy = ssqdm_y + K1 * K2
+
+    with nogil:
+        for k in range(N):
+            s = start[k]
+            e = end[k]
+
+            # calculate deletes
+            if k > 0:
+                for r in range(start[k - 1], min(s, end[k - 1])):
+                    for j in range(K2):
+                        y = Y[r, j]
+                        if isnan(y):
+                            continue
+                        i0 = j if same else 0
+                        for i in range(i0, K1):
+                            x = X[r, i]
+                            if not isnan(x):
+                                p = j * K1 + i
+                                remove_cov(x, y, &nobs[p], &mean_x[p],
+                                           &mean_y[p], &ssqdm_x[p],
+                                           &ssqdm_y[p], &sdm_xy[p])
+
+            # calculate adds
+            for r in range(max(s, end[k - 1]) if k > 0 else s, e):
+                for j in range(K2):
+                    y = Y[r, j]
+                    if isnan(y):
+                        continue
+                    i0 = j if same else 0
+                    for i in range(i0, K1):
+                        x = X[r, i]
+                        if not isnan(x):
+                            p = j * K1 + i
+                            add_cov(x, y, &nobs[p], &mean_x[p], &mean_y[p],
+                                    &ssqdm_x[p], &ssqdm_y[p], &sdm_xy[p])
+
+            for j in range(K2):
+                i0 = j if same else 0
+                for i in range(i0, K1):
+                    p = j * K1 + i
+                    output[k, j, i] = calc_cov(minp, ddof, corr, nobs[p],
+                                               ssqdm_x[p], ssqdm_y[p],
+                                               sdm_xy[p])
+                    if same and not upper:
+                        output[k, i, j] = output[k, j, i]
+
+    free(nobs)
 
     return output
 
@@ -869,9 +1326,12 @@ def roll_skew(ndarray[double_t] input, int64_t win, int64_t minp,
                 e = end[i]
 
                 # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+                # never removed; the same holds for a window that does not
+                # overlap the previous one (e.g. at a group boundary)
+                if i == 0 or s >= end[i - 1]:
 
+                    nobs = 0
+                    x = xx = xxx = 0
                     for j in range(s, e):
                         val = input[j]
                         add_skew(val, &nobs, &x, &xx, &xxx)
@@ -1006,9 +1466,12 @@ def roll_kurt(ndarray[double_t] input, int64_t win, int64_t minp,
                 e = end[i]
 
                 # Over the first window, observations can only be added
-                # never removed
-                if i == 0:
+                # never removed; the same holds for a window that does not
+                # overlap the previous one (e.g. at a group boundary)
+                if i == 0 or s >= end[i - 1]:
 
+                    nobs = 0
+                    x = xx = xxx = xxxx = 0
                     for j in range(s, e):
                         add_kurt(input[j], &nobs, &x, &xx, &xxx, &xxxx)
 
@@ -1084,24 +1547,25 @@ def roll_median_c(ndarray[float64_t] input, int64_t win, int64_t minp,
             if i == 0:
 
                 # setup
-                val = input[i]
-                if val == val:
-                    nobs += 1
-                    err = skiplist_insert(sl, val) != 1
-                    if err:
-                        break
+                for j in range(s, e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        err = skiplist_insert(sl, val) != 1
+                        if err:
+                            break
 
             else:
 
                 # calculate deletes
-                for j in range(start[i - 1], s):
+                for j in range(start[i - 1], min(s, end[i - 1])):
                     val = input[j]
                     if val == val:
                         skiplist_remove(sl, val)
                         nobs -= 1
 
                 # calculate adds
-                for j in range(end[i - 1], e):
+                for j in range(max(s, end[i - 1]), e):
                     val = input[j]
                     if val == val:
                         nobs += 1
@@ -1244,72 +1708,57 @@ cdef _roll_min_max_variable(ndarray[numeric] input,
                             bint is_max):
     cdef:
         numeric ai
-        int64_t i, close_offset, curr_win_size
+        int64_t i, j, s, e, s_prev = 0, e_prev = 0
         Py_ssize_t nobs = 0
         deque Q[int64_t]  # min/max always the front
-        deque W[int64_t]  # track the whole window for nobs compute
         ndarray[double_t, ndim=1] output
 
     output = np.empty(N, dtype=float)
     Q = deque[int64_t]()
-    W = deque[int64_t]()
 
     with nogil:
 
         # This is using a modified version of the C++ code in this
         # SO post: http://bit.ly/2nOoHlY
-        # The original impl didn't deal with variable window sizes
-        # So the code was optimized for that
-
-        for i from starti[0] <= i < endi[0]:
-            ai = init_mm(input[i], &nobs, is_max)
-
-            # Discard previous entries if we find new min or max
-            if is_max:
-                while not Q.empty() and ((ai >= input[Q.back()]) or
-                                         (input[Q.back()] != input[Q.back()])):
-                    Q.pop_back()
-            else:
-                while not Q.empty() and ((ai <= input[Q.back()]) or
-                                         (input[Q.back()] != input[Q.back()])):
-                    Q.pop_back()
-            Q.push_back(i)
-            W.push_back(i)
+        # The original impl didn't deal with variable window sizes,
+        # here the window moves between any monotonic bounds
 
-        # if right is open then the first window is empty
-        close_offset = 0 if endi[0] > starti[0] else 1
+        for i in range(N):
+            s = starti[i]
+            e = endi[i]
 
-        for i in range(endi[0], endi[N-1]):
-            if not Q.empty():
-                output[i-1+close_offset] = calc_mm(
-                    minp, nobs, input[Q.front()])
-            else:
-                output[i-1+close_offset] = NaN
+            # calculate deletes
+            for j in range(s_prev, min(s, e_prev)):
+                remove_mm(input[j], &nobs)
 
-            ai = init_mm(input[i], &nobs, is_max)
-
-            # Discard previous entries if we find new min or max
-            if is_max:
-                while not Q.empty() and ((ai >= input[Q.back()]) or
-                                         (input[Q.back()] != input[Q.back()])):
-                    Q.pop_back()
-            else:
-                while not Q.empty() and ((ai <= input[Q.back()]) or
-                                         (input[Q.back()] != input[Q.back()])):
-                    Q.pop_back()
+            # calculate adds
+            for j in range(max(s, e_prev), e):
+                ai = init_mm(input[j], &nobs, is_max)
 
-            # Maintain window/nobs retention
-            curr_win_size = endi[i + close_offset] - starti[i + close_offset]
-            while not Q.empty() and Q.front() <= i - curr_win_size:
+                # Discard previous entries if we find new min or max
+                if is_max:
+                    while not Q.empty() and (
+                            (ai >= input[Q.back()]) or
+                            (input[Q.back()] != input[Q.back()])):
+                        Q.pop_back()
+                else:
+                    while not Q.empty() and (
+                            (ai <= input[Q.back()]) or
+                            (input[Q.back()] != input[Q.back()])):
+                        Q.pop_back()
+                Q.push_back(j)
+
+            # Discard entries that left the window
+            while not Q.empty() and Q.front() < s:
                 Q.pop_front()
-            while not W.empty() and W.front() <= i - curr_win_size:
-                remove_mm(input[W.front()], &nobs)
-                W.pop_front()
 
-            Q.push_back(i)
-            W.push_back(i)
+            if not Q.empty():
+                output[i] = calc_mm(minp, nobs, input[Q.front()])
+            else:
+                output[i] = NaN
 
-        output[N-1] = calc_mm(minp, nobs, input[Q.front()])
+            s_prev = s
+            e_prev = e
 
     return output
 
@@ -1421,6 +1870,51 @@ interpolation_types = {
 }
 
 
+cdef inline double _get_quantile(skiplist_t *skiplist, int64_t nobs,
+                                 double quantile,
+                                 InterpolationType interpolation_type) nogil:
+    """ quantile of the nobs > 0 values of the skiplist """
+    cdef:
+        double idx_with_fraction, vlow, vhigh
+        Py_ssize_t idx
+        int ret = 0
+
+    if nobs == 1:
+        # Single value in skip list
+        return skiplist_get(skiplist, 0, &ret)
+
+    idx_with_fraction = quantile * (nobs - 1)
+    idx = <int> idx_with_fraction
+
+    if idx_with_fraction == idx:
+        # no need to interpolate
+        return skiplist_get(skiplist, idx, &ret)
+
+    if interpolation_type == LINEAR:
+        vlow = skiplist_get(skiplist, idx, &ret)
+        vhigh = skiplist_get(skiplist, idx + 1, &ret)
+        return vlow + (vhigh - vlow) * (idx_with_fraction - idx)
+    elif interpolation_type == LOWER:
+        return skiplist_get(skiplist, idx, &ret)
+    elif interpolation_type == HIGHER:
+        return skiplist_get(skiplist, idx + 1, &ret)
+    elif interpolation_type == NEAREST:
+        # the same behaviour as round()
+        if idx_with_fraction - idx == 0.5:
+            if idx % 2 == 0:
+                return skiplist_get(skiplist, idx, &ret)
+            return skiplist_get(skiplist, idx + 1, &ret)
+        elif idx_with_fraction - idx < 0.5:
+            return skiplist_get(skiplist, idx, &ret)
+        return skiplist_get(skiplist, idx + 1, &ret)
+    else:
+        # MIDPOINT
+        vlow = skiplist_get(skiplist, idx, &ret)
+        vhigh = skiplist_get(skiplist, idx + 1, &ret)
+        return <double> (vlow + vhigh) / 2
+
+
+
 def roll_quantile(ndarray[float64_t, cast=True] input, int64_t win,
                   int64_t minp, object index, object closed,
                   double quantile, str interpolation):
@@ -1428,16 +1922,13 @@ def roll_quantile(ndarray[float64_t, cast=True] input, int64_t win,
     O(N log(window)) implementation using skip list
     """
     cdef:
-        double val, prev, midpoint, idx_with_fraction
+        double val
         skiplist_t *skiplist
         int64_t nobs = 0, i, j, s, e, N
-        Py_ssize_t idx
         bint is_variable
         ndarray[int64_t] start, end
         ndarray[double_t] output
-        double vlow, vhigh
         InterpolationType interpolation_type
-        int ret = 0
 
     if quantile <= 0.0 or quantile >= 1.0:
         raise ValueError("quantile value {0} not in [0, 1]".format(quantile))
@@ -1467,67 +1958,113 @@ def roll_quantile(ndarray[float64_t, cast=True] input, int64_t win,
             if i == 0:
 
                 # setup
-                val = input[i]
-                if val == val:
-                    nobs += 1
-                    skiplist_insert(skiplist, val)
+                for j in range(s, e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        skiplist_insert(skiplist, val)
 
             else:
 
                 # calculate deletes
-                for j in range(start[i - 1], s):
+                for j in range(start[i - 1], min(s, end[i - 1])):
                     val = input[j]
                     if val == val:
                         skiplist_remove(skiplist, val)
                         nobs -= 1
 
                 # calculate adds
-                for j in range(end[i - 1], e):
+                for j in range(max(s, end[i - 1]), e):
                     val = input[j]
                     if val == val:
                         nobs += 1
                         skiplist_insert(skiplist, val)
 
             if nobs >= minp:
-                if nobs == 1:
-                    # Single value in skip list
-                    output[i] = skiplist_get(skiplist, 0, &ret)
-                else:
-                    idx_with_fraction = quantile * (nobs - 1)
-                    idx = <int> idx_with_fraction
+                output[i] = _get_quantile(skiplist, nobs, quantile,
+                                          interpolation_type)
+            else:
+                output[i] = NaN
 
-                    if idx_with_fraction == idx:
-                        # no need to interpolate
-                        output[i] = skiplist_get(skiplist, idx, &ret)
-                        continue
+    skiplist_destroy(skiplist)
+
+    return output
+
+
+def roll_quantiles(ndarray[float64_t, cast=True] input, int64_t win,
+                   int64_t minp, object index, object closed,
+                   ndarray[float64_t] quantiles, str interpolation):
+    """
+    O(N log(window) + N * len(quantiles)) implementation using one skip
+    list for all the quantiles, returning a (N, len(quantiles)) array
+    """
+    cdef:
+        double val
+        skiplist_t *skiplist
+        int64_t nobs = 0, i, j, k, s, e, N, K
+        bint is_variable
+        ndarray[int64_t] start, end
+        ndarray[double_t, ndim=2] output
+        InterpolationType interpolation_type
+
+    K = len(quantiles)
+    for k in range(K):
+        if not 0.0 <= quantiles[k] <= 1.0:
+            raise ValueError("quantile value {0} not in [0, 1]"
+                             .format(quantiles[k]))
+
+    try:
+        interpolation_type = interpolation_types[interpolation]
+    except KeyError:
+        raise ValueError("Interpolation '{}' is not supported"
+                         .format(interpolation))
+
+    start, end, N, win, minp, is_variable = get_window_indexer(
+        input, win,
+        minp, index, closed,
+        use_mock=False)
+    output = np.empty((N, K), dtype=float)
+    skiplist = skiplist_init(<int>win)
+    if skiplist == NULL:
+        raise MemoryError("skiplist_init failed")
+
+    with nogil:
+        for i in range(0, N):
+            s = start[i]
+            e = end[i]
+
+            if i == 0:
+
+                # setup
+                for j in range(s, e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        skiplist_insert(skiplist, val)
 
-                    if interpolation_type == LINEAR:
-                        vlow = skiplist_get(skiplist, idx, &ret)
-                        vhigh = skiplist_get(skiplist, idx + 1, &ret)
-                        output[i] = ((vlow + (vhigh - vlow) *
-                                      (idx_with_fraction - idx)))
-                    elif interpolation_type == LOWER:
-                        output[i] = skiplist_get(skiplist, idx, &ret)
-                    elif interpolation_type == HIGHER:
-                        output[i] = skiplist_get(skiplist, idx + 1, &ret)
-                    elif interpolation_type == NEAREST:
-                        # the same behaviour as round()
-                        if idx_with_fraction - idx == 0.5:
-                            if idx % 2 == 0:
-                                output[i] = skiplist_get(skiplist, idx, &ret)
-                            else:
-                                output[i] = skiplist_get(
-                                    skiplist, idx + 1, &ret)
-                        elif idx_with_fraction - idx < 0.5:
-                            output[i] = skiplist_get(skiplist, idx, &ret)
-                        else:
-                            output[i] = skiplist_get(skiplist, idx + 1, &ret)
-                    elif interpolation_type == MIDPOINT:
-                        vlow = skiplist_get(skiplist, idx, &ret)
-                        vhigh = skiplist_get(skiplist, idx + 1, &ret)
-                        output[i] = <double> (vlow + vhigh) / 2
             else:
-                output[i] = NaN
+
+                # calculate deletes
+                for j in range(start[i - 1], min(s, end[i - 1])):
+                    val = input[j]
+                    if val == val:
+                        skiplist_remove(skiplist, val)
+                        nobs -= 1
+
+                # calculate adds
+                for j in range(max(s, end[i - 1]), e):
+                    val = input[j]
+                    if val == val:
+                        nobs += 1
+                        skiplist_insert(skiplist, val)
+
+            if nobs >= minp and nobs > 0:
+                for k in range(K):
+                    output[i, k] = _get_quantile(skiplist, nobs, quantiles[k],
+                                                 interpolation_type)
+            else:
+                for k in range(K):
+                    output[i, k] = NaN
 
     skiplist_destroy(skiplist)
 
@@ -1700,7 +2237,7 @@ def roll_window(ndarray[float64_t, ndim=1, cast=True] input,
 
 
 def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
-         int minp):
+         int minp, ndarray[double_t] deltas=None):
     """
     Compute exponentially-weighted moving average using center-of-mass.
 
@@ -1711,6 +2248,10 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
     adjust: int
     ignore_na: int
     minp: int
+    deltas: ndarray (float64 type), optional
+        the number of periods between each value and the previous one, for
+        irregularly spaced values; by default every value is one period
+        after the previous one. ignore_na has no effect with deltas
 
     Returns
     -------
@@ -1726,6 +2267,15 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
 
     cdef double alpha, old_wt_factor, new_wt, weighted_avg, old_wt, cur
     cdef Py_ssize_t i, nobs
+    cdef bint use_deltas = deltas is not None
+
+    if use_deltas:
+        if len(deltas) != N - 1:
+            raise ValueError("deltas must be one shorter than the input")
+
+        # the weights follow the time elapsed between the observations,
+        # whether or not there are missing values in between
+        ignore_na = 0
 
     alpha = 1. / (1. + com)
     old_wt_factor = 1. - alpha
@@ -1745,7 +2295,10 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
 
             if is_observation or (not ignore_na):
 
-                old_wt *= old_wt_factor
+                if use_deltas:
+                    old_wt *= old_wt_factor ** deltas[i - 1]
+                else:
+                    old_wt *= old_wt_factor
                 if is_observation:
 
                     # avoid numerical errors on constant series
@@ -1768,7 +2321,8 @@ def ewma(ndarray[double_t] input, double_t com, int adjust, int ignore_na,
 
 
 def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
-           double_t com, int adjust, int ignore_na, int minp, int bias):
+           double_t com, int adjust, int ignore_na, int minp, int bias,
+           ndarray[double_t] deltas=None):
     """
     Compute exponentially-weighted moving variance using center-of-mass.
 
@@ -1781,6 +2335,9 @@ def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
     ignore_na: int
     minp: int
     bias: int
+    deltas: ndarray (float64 type), optional
+        the number of periods between each value and the previous one, see
+        ewma
 
     Returns
     -------
@@ -1799,7 +2356,17 @@ def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
 
     cdef double alpha, old_wt_factor, new_wt, mean_x, mean_y, cov
     cdef double sum_wt, sum_wt2, old_wt, cur_x, cur_y, old_mean_x, old_mean_y
+    cdef double wt_factor
     cdef Py_ssize_t i, nobs
+    cdef bint use_deltas = deltas is not None
+
+    if use_deltas:
+        if len(deltas) != N - 1:
+            raise ValueError("deltas must be one shorter than the input")
+
+        # the weights follow the time elapsed between the observations,
+        # whether or not there are missing values in between
+        ignore_na = 0
 
     alpha = 1. / (1. + com)
     old_wt_factor = 1. - alpha
@@ -1825,9 +2392,13 @@ def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
         nobs += int(is_observation)
         if mean_x == mean_x:
             if is_observation or (not ignore_na):
-                sum_wt *= old_wt_factor
-                sum_wt2 *= (old_wt_factor * old_wt_factor)
-                old_wt *= old_wt_factor
+                if use_deltas:
+                    wt_factor = old_wt_factor ** deltas[i - 1]
+                else:
+                    wt_factor = old_wt_factor
+                sum_wt *= wt_factor
+                sum_wt2 *= (wt_factor * wt_factor)
+                old_wt *= wt_factor
                 if is_observation:
                     old_mean_x = mean_x
                     old_mean_y = mean_y
@@ -1870,3 +2441,270 @@ def ewmcov(ndarray[double_t] input_x, ndarray[double_t] input_y,
             output[i] = NaN
 
     return output
+
+# ----------------------------------------------------------------------
+# Online rolling and exponentially weighted moving average
+# the state of the kernels above, kept between batches of observations
+
+
+cdef enum OnlineRollingType:
+    ONLINE_SUM,
+    ONLINE_MEAN,
+    ONLINE_VAR,
+    ONLINE_MEDIAN
+
+online_rolling_types = {
+    'sum': ONLINE_SUM,
+    'mean': ONLINE_MEAN,
+    'var': ONLINE_VAR,
+    'median': ONLINE_MEDIAN,
+}
+
+
+cdef class RollingState:
+    """
+    state of a rolling sum, mean, variance or median over a fixed window,
+    updated with new observations in O(number of observations) instead of
+    being computed over the whole array
+
+    Parameters
+    ----------
+    win: int64_t
+        window size
+    minp: int64_t
+        min number of obs in a window to consider non-NaN
+    func: {'sum', 'mean', 'var', 'median'}
+    ddof: int, default 1
+        delta degrees of freedom of the variance
+    """
+    cdef:
+        readonly int64_t win, minp
+        readonly object func
+        readonly int ddof
+        OnlineRollingType how
+
+        # the last win observations, the oldest at pos once full
+        ndarray buf
+        int64_t pos, n
+
+        # sum, mean & median
+        int64_t nobs
+        Py_ssize_t mean_nobs, neg_ct
+        double sum_x
+
+        # variance
+        double var_nobs, mean_x, ssqdm_x
+
+        skiplist_t *sl
+
+    def __init__(self, int64_t win, int64_t minp, object func, int ddof=1):
+        if win <= 0:
+            raise ValueError("window must be positive")
+        try:
+            self.how = online_rolling_types[func]
+        except KeyError:
+            raise ValueError("we do not support this function "
+                             "online: {0}".format(func))
+
+        self.win = win
+        self.minp = _check_minp(win, minp, win,
+                                floor=0 if self.how == ONLINE_SUM else None)
+        self.func = func
+        self.ddof = ddof
+        self.buf = np.empty(win, dtype=float)
+
+        if self.how == ONLINE_MEDIAN:
+            self.sl = skiplist_init(<int>win)
+            if self.sl == NULL:
+                raise MemoryError("skiplist_init failed")
+
+    def __dealloc__(self):
+        if self.sl != NULL:
+            skiplist_destroy(self.sl)
+
+    def __reduce__(self):
+        return (RollingState, (self.win, self.minp, self.func, self.ddof),
+                self.values)
+
+    def __setstate__(self, values):
+        self.update(values)
+
+    @property
+    def values(self):
+        """ the observations in the current window, oldest first """
+        if self.n < self.win:
+            return self.buf[:self.n].copy()
+        return np.concatenate([self.buf[self.pos:], self.buf[:self.pos]])
+
+    cdef inline bint _add(self, double val) nogil:
+        if self.how == ONLINE_SUM:
+            add_sum(val, &self.nobs, &self.sum_x)
+        elif self.how == ONLINE_MEAN:
+            add_mean(val, &self.mean_nobs, &self.sum_x, &self.neg_ct)
+        elif self.how == ONLINE_VAR:
+            add_var(val, &self.var_nobs, &self.mean_x, &self.ssqdm_x)
+        elif val == val:
+            self.nobs += 1
+            return skiplist_insert(self.sl, val) == 1
+        return True
+
+    cdef inline void _remove(self, double val) nogil:
+        if self.how == ONLINE_SUM:
+            remove_sum(val, &self.nobs, &self.sum_x)
+        elif self.how == ONLINE_MEAN:
+            remove_mean(val, &self.mean_nobs, &self.sum_x, &self.neg_ct)
+        elif self.how == ONLINE_VAR:
+            remove_var(val, &self.var_nobs, &self.mean_x, &self.ssqdm_x)
+        elif val == val:
+            skiplist_remove(self.sl, val)
+            self.nobs -= 1
+
+    cdef inline double _calc(self) nogil:
+        cdef:
+            int midpoint
+            int ret = 0
+
+        if self.how == ONLINE_SUM:
+            return calc_sum(self.minp, self.nobs, self.sum_x)
+        elif self.how == ONLINE_MEAN:
+            return calc_mean(self.minp, self.mean_nobs, self.neg_ct,
+                             self.sum_x)
+        elif self.how == ONLINE_VAR:
+            return calc_var(self.minp, self.ddof, self.var_nobs,
+                            self.ssqdm_x)
+        elif self.nobs >= self.minp:
+            midpoint = <int>(self.nobs / 2)
+            if self.nobs % 2:
+                return skiplist_get(self.sl, midpoint, &ret)
+            return (skiplist_get(self.sl, midpoint, &ret) +
+                    skiplist_get(self.sl, (midpoint - 1), &ret)) / 2
+        return NaN
+
+    def update(self, ndarray[double_t] values):
+        """
+        add the observations to the window
+
+        Parameters
+        ----------
+        values: ndarray[double_t]
+
+        Returns
+        -------
+        ndarray of the aggregation of the window ending at each observation
+        """
+        cdef:
+            Py_ssize_t i, N = len(values)
+            bint ok = True
+            ndarray[double_t] output
+            double_t[:] buf = self.buf
+
+        output = np.empty(N, dtype=float)
+
+        with nogil:
+            for i in range(N):
+                if self.n == self.win:
+                    self._remove(buf[self.pos])
+                else:
+                    self.n += 1
+
+                buf[self.pos] = values[i]
+                self.pos = (self.pos + 1) % self.win
+                ok = self._add(values[i])
+                if not ok:
+                    break
+                output[i] = self._calc()
+
+        if not ok:
+            raise MemoryError("skiplist_insert failed")
+        return output
+
+
+cdef class EWMAState:
+    """
+    state of an exponentially-weighted moving average using center-of-mass,
+    updated with new observations in O(number of observations)
+
+    Parameters
+    ----------
+    com : float64
+    adjust: int
+    ignore_na: int
+    minp: int
+    """
+    cdef:
+        readonly double com
+        readonly bint adjust, ignore_na
+        readonly int minp
+        double old_wt_factor, new_wt, weighted_avg, old_wt
+        Py_ssize_t nobs
+
+    def __init__(self, double com, bint adjust, bint ignore_na, int minp):
+        cdef double alpha
+
+        self.com = com
+        self.adjust = adjust
+        self.ignore_na = ignore_na
+        self.minp = max(minp, 1)
+
+        alpha = 1. / (1. + com)
+        self.old_wt_factor = 1. - alpha
+        self.new_wt = 1. if adjust else alpha
+        self.weighted_avg = NaN
+        self.old_wt = 1.
+
+    def __reduce__(self):
+        return (EWMAState, (self.com, self.adjust, self.ignore_na, self.minp),
+                (self.weighted_avg, self.old_wt, self.nobs))
+
+    def __setstate__(self, state):
+        self.weighted_avg, self.old_wt, self.nobs = state
+
+    def update(self, ndarray[double_t] values):
+        """
+        add the observations to the average, see ewma
+
+        Parameters
+        ----------
+        values: ndarray[double_t]
+
+        Returns
+        -------
+        ndarray of the average at each observation
+        """
+        cdef:
+            Py_ssize_t i, N = len(values)
+            double cur
+            bint is_observation
+            ndarray[double_t] output
+
+        output = np.empty(N, dtype=float)
+
+        with nogil:
+            for i in range(N):
+                cur = values[i]
+                is_observation = (cur == cur)
+                self.nobs += is_observation
+                if self.weighted_avg == self.weighted_avg:
+
+                    if is_observation or (not self.ignore_na):
+
+                        self.old_wt *= self.old_wt_factor
+                        if is_observation:
+
+                            # avoid numerical errors on constant series
+                            if self.weighted_avg != cur:
+                                self.weighted_avg = (
+                                    (self.old_wt * self.weighted_avg) +
+                                    (self.new_wt * cur)) / (self.old_wt +
+                                                            self.new_wt)
+                            if self.adjust:
+                                self.old_wt += self.new_wt
+                            else:
+                                self.old_wt = 1.
+                elif is_observation:
+                    self.weighted_avg = cur
+
+                output[i] = (self.weighted_avg if self.nobs >= self.minp
+                             else NaN)
+
+        return output
@@ -6,8 +6,11 @@ Note: pandas.core.common is *not* part of the public API.
 
 from datetime import datetime, timedelta
 from functools import partial
+from multiprocessing.pool import ThreadPool
 import inspect
 import collections
+import os
+import threading
 
 import numpy as np
 from pandas._libs import lib, tslibs
@@ -397,6 +400,26 @@ def get_distinct_objs(objs):
     return res
 
 
+_thread_pools = {}
+_thread_pools_lock = threading.Lock()
+
+
+def get_thread_pool(nthreads):
+    """
+    Return a thread pool with ``nthreads`` threads, created on first use and
+    then reused by every call with the same number of threads, so that the
+    threads are not started and joined again for every operation.
+
+    A pool is kept per process, as its threads do not survive a fork.
+    """
+    key = (os.getpid(), nthreads)
+    with _thread_pools_lock:
+        pool = _thread_pools.get(key)
+        if pool is None:
+            pool = _thread_pools[key] = ThreadPool(processes=nthreads)
+    return pool
+
+
 def _pipe(obj, func, *args, **kwargs):
     """
     Apply a function ``func`` to object ``obj`` either by passing obj as the
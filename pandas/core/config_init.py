@@ -43,11 +43,52 @@ def use_numexpr_cb(key):
     expressions.set_use_numexpr(cf.get_option(key))
 
 
+groupby_threads_doc = """
+: int
+    Number of threads used to run the cython groupby aggregation kernels
+    over column slices of wide blocks. The kernels release the GIL, so
+    values greater than 1 can speed up aggregations of frames with many
+    numeric columns. The default is 1 (single-threaded)
+"""
+
+rolling_threads_doc = """
+: int
+    Number of threads used to run the cython rolling window kernels over
+    chunks of columns of wide blocks. The kernels release the GIL, so
+    values greater than 1 can speed up rolling aggregations of frames with
+    many numeric columns. The default is 1 (single-threaded)
+"""
+
+index_engine_doc = """
+: str
+    How the numeric indexes map their values to locations for label
+    lookups. 'hash' builds a hash table, 'sorted' keeps a sorted permutation
+    of the values (4 bytes per value for indexes shorter than 2**31) and
+    searches it, using far less memory at the cost of slower lookups, and
+    'auto' uses the latter for indexes of at least 10 million values.
+    Applies to the lookups of indexes that have not been used for lookups
+    yet. The default is 'hash'
+"""
+
+
+def index_engine_cb(key):
+    from pandas._libs import index as libindex
+    libindex.set_engine_mode(cf.get_option(key))
+
+
 with cf.config_prefix('compute'):
     cf.register_option('use_bottleneck', True, use_bottleneck_doc,
                        validator=is_bool, cb=use_bottleneck_cb)
     cf.register_option('use_numexpr', True, use_numexpr_doc,
                        validator=is_bool, cb=use_numexpr_cb)
+    cf.register_option('groupby_threads', 1, groupby_threads_doc,
+                       validator=is_int)
+    cf.register_option('rolling_threads', 1, rolling_threads_doc,
+                       validator=is_int)
+    cf.register_option('index_engine', 'hash', index_engine_doc,
+                       validator=is_one_of_factory(['hash', 'sorted',
+                                                    'auto']),
+                       cb=index_engine_cb)
 #
 # options from the "display" namespace
 
@@ -427,9 +468,36 @@ chained_assignment = """
     The default is warn
 """
 
+copy_on_write_doc = """
+: bool
+    Whether objects derived from another one, such as copies, column
+    selections and slices, share its data until either of them is modified,
+    when the modified one copies the data first (copy-on-write). The default
+    is False
+"""
+
+
+def copy_on_write_cb(key):
+    from pandas.core.internals import blocks
+    blocks.set_copy_on_write(cf.get_option(key))
+
+
+data_manager_doc = """
+: string
+    The internal data manager of new DataFrames, 'block' or 'columnar'.
+    'block' consolidates the columns of the same dtype into 2D blocks,
+    'columnar' keeps one block per column and never consolidates, which
+    makes adding many columns one by one cheap. DataFrame.as_manager
+    selects the manager of a single DataFrame. The default is 'block'
+"""
+
 with cf.config_prefix('mode'):
     cf.register_option('chained_assignment', 'warn', chained_assignment,
                        validator=is_one_of_factory([None, 'warn', 'raise']))
+    cf.register_option('copy_on_write', False, copy_on_write_doc,
+                       validator=is_bool, cb=copy_on_write_cb)
+    cf.register_option('data_manager', 'block', data_manager_doc,
+                       validator=is_one_of_factory(['block', 'columnar']))
 
 # Set up the io.excel specific configuration.
 writer_engine_doc = """
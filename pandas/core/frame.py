@@ -70,7 +70,9 @@ from pandas.core.indexing import (maybe_droplevels, convert_to_index_sliceable,
                                   check_bool_indexer)
 from pandas.core.internals import (BlockManager,
                                    create_block_manager_from_arrays,
-                                   create_block_manager_from_blocks)
+                                   create_block_manager_from_blocks,
+                                   get_manager_class,
+                                   using_copy_on_write)
 from pandas.core.series import Series
 from pandas.core.arrays import Categorical, ExtensionArray
 import pandas.core.algorithms as algorithms
@@ -210,6 +212,22 @@ validate : string, default None
 
     .. versionadded:: 0.21.0
 
+engine : {None, 'partitioned'}, default None
+    Join algorithm used when joining on columns. If 'partitioned', both
+    sides are hash-partitioned on the join keys and the partitions are
+    joined concurrently in a thread pool. With ``sort=False`` a left join
+    keeps the order of the left rows and a right join the order of the
+    right rows; the order of an inner or outer join is unspecified.
+    Keys whose dtypes cannot be hashed consistently on both sides, and
+    joins with ``sort=True``, fall back to the default algorithm.
+
+    .. versionadded:: 0.24.0
+n_jobs : int, optional
+    Number of partitions and threads used by ``engine='partitioned'``.
+    Defaults to the number of CPUs.
+
+    .. versionadded:: 0.24.0
+
 Returns
 -------
 DataFrame
@@ -590,6 +608,56 @@ class DataFrame(NDFrame):
         """
         return len(self.index), len(self.columns)
 
+    def as_manager(self, typ):
+        """
+        Return the DataFrame with its data held in the given manager type.
+
+        .. versionadded:: 0.24.0
+
+        This selects the internal data manager of a single DataFrame, while
+        the ``mode.data_manager`` option selects the one of all new
+        DataFrames. The DataFrames derived from the result, such as copies,
+        column selections and slices, keep its manager type.
+
+        Parameters
+        ----------
+        typ : {'block', 'columnar'}
+            'block' consolidates the columns of the same dtype into 2D
+            blocks, 'columnar' keeps one block per column and never
+            consolidates, which makes adding many columns one by one cheap.
+
+        Returns
+        -------
+        DataFrame
+            The caller itself if it already uses this manager type. A
+            'columnar' result shares the data with the caller, while a
+            'block' result copies the columns of the same dtype into new
+            consolidated blocks.
+
+        Raises
+        ------
+        ValueError
+            If ``typ`` is not a known manager type.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({'a': [1., 2.], 'b': [3., 4.]})
+        >>> df._data.nblocks
+        1
+        >>> df = df.as_manager('columnar')
+        >>> for i in range(3):
+        ...     df['x{}'.format(i)] = float(i)
+        >>> df._data.nblocks
+        5
+        """
+        klass = get_manager_class(typ)
+        mgr = self._data
+        if type(mgr) is klass:
+            return self
+        new_mgr = klass(mgr.copy(deep=False).blocks, mgr.axes)
+        new_mgr._consolidate_inplace()
+        return self._constructor(new_mgr).__finalize__(self)
+
     def _repr_fits_vertical_(self):
         """
         Check length against max_rows.
@@ -1959,6 +2027,74 @@ class DataFrame(NDFrame):
         from pandas.io.feather_format import to_feather
         to_feather(self, fname)
 
+    def to_shared_memory(self, path=None):
+        """
+        Place the data of the DataFrame in shared memory.
+
+        The values of the columns and the numeric or datetime-like index are
+        copied once into a memory-mapped file. The returned handle is small
+        to pickle, e.g. to pass it to ``multiprocessing`` workers, which
+        reconstruct the DataFrame with :meth:`DataFrame.from_shared_memory`
+        without copying the data. Object and extension columns, and the
+        other types of index, are pickled with the handle instead.
+
+        .. versionadded:: 0.24.0
+
+        Parameters
+        ----------
+        path : str, optional
+            The file to create, by default a new temporary file, in
+            ``/dev/shm`` where available. Call ``handle.unlink()`` to remove
+            it once every process has reconstructed the DataFrame.
+
+        Returns
+        -------
+        SharedMemoryHandle
+
+        See Also
+        --------
+        DataFrame.from_shared_memory : Reconstruct the DataFrame.
+
+        Examples
+        --------
+        >>> df = pd.DataFrame({'a': [1, 2], 'b': [3., 4.]})
+        >>> handle = df.to_shared_memory()
+        >>> pd.DataFrame.from_shared_memory(handle)
+           a    b
+        0  1  3.0
+        1  2  4.0
+        >>> handle.unlink()
+        """
+        from pandas.io.shared_memory import to_shared_memory
+        return to_shared_memory(self, path=path)
+
+    @classmethod
+    def from_shared_memory(cls, handle):
+        """
+        Reconstruct a DataFrame placed in shared memory, without copying it.
+
+        The data in shared memory is mapped read-only: setting values in
+        the DataFrame raises, use a copy of it to modify them.
+
+        .. versionadded:: 0.24.0
+
+        Parameters
+        ----------
+        handle : SharedMemoryHandle
+            Returned by :meth:`DataFrame.to_shared_memory`, possibly in
+            another process.
+
+        Returns
+        -------
+        DataFrame
+
+        See Also
+        --------
+        DataFrame.to_shared_memory : Place a DataFrame in shared memory.
+        """
+        from pandas.io.shared_memory import from_shared_memory
+        return cls(from_shared_memory(handle)._data)
+
     def to_parquet(self, fname, engine='auto', compression='snappy',
                    **kwargs):
         """
@@ -2663,8 +2799,18 @@ class DataFrame(NDFrame):
 
     def _set_value(self, index, col, value, takeable=False):
         try:
+            copy_on_write = using_copy_on_write()
+            if copy_on_write:
+                # the column is a new Series sharing the (now unshared)
+                # values, write through it directly
+                loc = col if takeable is True else self.columns.get_loc(col)
+                self._data._copy_items_if_referenced(loc)
+
             if takeable is True:
                 series = self._iget_item_cache(col)
+                if copy_on_write:
+                    series._values[index] = value
+                    return self
                 return series._set_value(index, value, takeable=True)
 
             series = self._get_item_cache(col)
@@ -3550,6 +3696,11 @@ class DataFrame(NDFrame):
         col_labels : sequence
             The column labels to use for lookup
 
+        Returns
+        -------
+        values : ndarray
+            The found values, in the common dtype of the columns looked up
+
         Notes
         -----
         Akin to::
@@ -3558,31 +3709,30 @@ class DataFrame(NDFrame):
             for row, col in zip(row_labels, col_labels):
                 result.append(df.get_value(row, col))
 
+        The labels are resolved with one call to ``get_indexer`` per axis
+        and the values of each block are gathered at once, so looking up
+        many pairs is much faster than the loop.
+
         Examples
         --------
-        values : ndarray
-            The found values
-
+        >>> df = pd.DataFrame({'A': [1, 2, 3], 'B': [0.5, 1.5, 2.5]},
+        ...                   index=['x', 'y', 'z'])
+        >>> df.lookup(['x', 'z', 'y'], ['A', 'B', 'B'])
+        array([1. , 2.5, 1.5])
         """
         n = len(row_labels)
         if n != len(col_labels):
             raise ValueError('Row labels must have same size as column labels')
 
-        thresh = 1000
-        if not self._is_mixed_type or n > thresh:
-            values = self.values
-            ridx = self.index.get_indexer(row_labels)
-            cidx = self.columns.get_indexer(col_labels)
-            if (ridx == -1).any():
-                raise KeyError('One or more row labels was not found')
-            if (cidx == -1).any():
-                raise KeyError('One or more column labels was not found')
-            flat_index = ridx * len(self.columns) + cidx
-            result = values.flat[flat_index]
-        else:
-            result = np.empty(n, dtype='O')
-            for i, (r, c) in enumerate(zip(row_labels, col_labels)):
-                result[i] = self._get_value(r, c)
+        ridx = self.index.get_indexer(row_labels)
+        cidx = self.columns.get_indexer(col_labels)
+        if (ridx == -1).any():
+            raise KeyError('One or more row labels was not found')
+        if (cidx == -1).any():
+            raise KeyError('One or more column labels was not found')
+
+        # gathered block by block, in the dtype of the blocks of the columns
+        result = self._data.take_points(cidx, ridx)
 
         if is_object_dtype(result):
             result = lib.maybe_convert_objects(result)
@@ -6633,12 +6783,13 @@ class DataFrame(NDFrame):
     def merge(self, right, how='inner', on=None, left_on=None, right_on=None,
               left_index=False, right_index=False, sort=False,
               suffixes=('_x', '_y'), copy=True, indicator=False,
-              validate=None):
+              validate=None, engine=None, n_jobs=None):
         from pandas.core.reshape.merge import merge
         return merge(self, right, how=how, on=on, left_on=left_on,
                      right_on=right_on, left_index=left_index,
                      right_index=right_index, sort=sort, suffixes=suffixes,
-                     copy=copy, indicator=indicator, validate=validate)
+                     copy=copy, indicator=indicator, validate=validate,
+                     engine=engine, n_jobs=n_jobs)
 
     def round(self, decimals=0, *args, **kwargs):
         """
@@ -7107,6 +7258,19 @@ class DataFrame(NDFrame):
         def f(x):
             return op(x, axis=axis, skipna=skipna, **kwds)
 
+        if (axis == 0 and self._data._columnar and
+                filter_type in (None, 'numeric') and
+                numeric_only is not False):
+            # reduce the columns block by block instead of interleaving
+            # them into a single 2D array
+            data = self._get_numeric_data() if numeric_only else self
+            if all(blk.is_numeric and blk._can_consolidate
+                   for blk in data._data.blocks):
+                with np.errstate(all='ignore'):
+                    result = data._data.reduce(
+                        lambda x: op(x, axis=1, skipna=skipna, **kwds))
+                return Series(result, index=data.columns)
+
         # exclude timedelta/datetime unless we are uniform types
         if axis == 1 and self._is_mixed_type and self._is_datelike_mixed_type:
             numeric_only = True
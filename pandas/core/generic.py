@@ -40,7 +40,7 @@ from pandas.core.index import (Index, MultiIndex, ensure_index,
 import pandas.core.indexing as indexing
 from pandas.core.indexes.datetimes import DatetimeIndex
 from pandas.core.indexes.period import PeriodIndex, Period
-from pandas.core.internals import BlockManager
+from pandas.core.internals import BlockManager, using_copy_on_write
 import pandas.core.algorithms as algos
 import pandas.core.common as com
 import pandas.core.missing as missing
@@ -81,6 +81,8 @@ def _single_replace(self, to_replace, method, inplace, limit):
 
     orig_dtype = self.dtype
     result = self if inplace else self.copy()
+    # the fill functions write to the values in-place
+    result._data._block._copy_if_referenced()
     fill_f = missing.get_fill_func(method)
 
     mask = missing.mask_missing(result.values, to_replace)
@@ -2334,9 +2336,11 @@ class NDFrame(PandasObject, SelectionMixin):
             default HIGHEST_PROTOCOL (see [1]_ paragraph 12.1.2). The possible
             values for this parameter depend on the version of Python. For
             Python 2.x, possible values are 0, 1, 2. For Python>=3.0, 3 is a
-            valid value. For Python >= 3.4, 4 is a valid value. A negative
-            value for the protocol parameter is equivalent to setting its value
-            to HIGHEST_PROTOCOL.
+            valid value. For Python >= 3.4, 4 is a valid value. For Python
+            >= 3.8, 5 is a valid value, with which the data of the arrays is
+            written without intermediate copies. A negative value for the
+            protocol parameter is equivalent to setting its value to
+            HIGHEST_PROTOCOL.
 
             .. [1] https://docs.python.org/3/library/pickle.html
             .. versionadded:: 0.21.0
@@ -2673,6 +2677,10 @@ class NDFrame(PandasObject, SelectionMixin):
         if res is None:
             values = self._data.get(item)
             res = self._box_item_values(item, values)
+            if using_copy_on_write():
+                # the item is a new object sharing the data with
+                # copy-on-write, writes to it must not reach this object
+                return res
             cache[item] = res
             res._set_as_cached(item, self)
 
@@ -5607,6 +5615,9 @@ class NDFrame(PandasObject, SelectionMixin):
                         continue
                     obj = result[k]
                     obj.fillna(v, limit=limit, inplace=True, downcast=downcast)
+                    if using_copy_on_write():
+                        # the column is not cached, set it back
+                        result[k] = obj
                 return result if not inplace else None
 
             elif not is_list_like(value):
@@ -9194,11 +9205,12 @@ class NDFrame(PandasObject, SelectionMixin):
         @Appender(rwindow.ewm.__doc__)
         def ewm(self, com=None, span=None, halflife=None, alpha=None,
                 min_periods=0, adjust=True, ignore_na=False,
-                axis=0):
+                axis=0, times=None):
             axis = self._get_axis_number(axis)
             return rwindow.ewm(self, com=com, span=span, halflife=halflife,
                                alpha=alpha, min_periods=min_periods,
-                               adjust=adjust, ignore_na=ignore_na, axis=axis)
+                               adjust=adjust, ignore_na=ignore_na, axis=axis,
+                               times=times)
 
         cls.ewm = ewm
 
@@ -1,4 +1,6 @@
 from pandas.core.groupby.groupby import GroupBy  # flake8: noqa
 from pandas.core.groupby.generic import (
     SeriesGroupBy, DataFrameGroupBy, PanelGroupBy)  # flake8: noqa
-from pandas.core.groupby.grouper import Grouper  # flake8: noqa
+from pandas.core.groupby.grouper import (
+    Grouper, PreparedGrouper)  # flake8: noqa
+from pandas.core.groupby.streaming import StreamingGroupBy  # flake8: noqa
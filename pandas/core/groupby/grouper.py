@@ -207,6 +207,178 @@ class Grouper(object):
         return "{}({})".format(cls_name, attrs)
 
 
+class PreparedGrouper(object):
+    """
+    A factorized groupby specification that can be reused across repeated
+    groupby calls on the same keys
+
+    The keys are factorized once when the PreparedGrouper is created; the
+    resulting group codes, number of groups, sort order and result index are
+    then shared by every ``groupby`` that is passed the PreparedGrouper.
+    The key columns are hashed when the PreparedGrouper is created and
+    again on every reuse, so replacing them or setting values in them,
+    whether through the object, a column selected from it or the
+    underlying numpy arrays, is detected and the factorization is
+    recomputed rather than silently reusing stale groups.
+
+    .. versionadded:: 0.24.0
+
+    Parameters
+    ----------
+    obj : Series or DataFrame
+        The object whose keys should be factorized
+    by : label, array-like, or list of these, defaults to None
+        The keys to group by, as accepted by ``DataFrame.groupby``
+    level : int, level name, or sequence of such, defaults to None
+        If the axis is a MultiIndex (hierarchical), group by a particular
+        level or levels
+    axis : int, default 0
+    sort : boolean, default True
+        Sort group keys
+    observed : boolean, default False
+        If a key is a Categorical, only show the observed values
+
+    Returns
+    -------
+    A PreparedGrouper, to be passed as ``by`` to ``groupby``
+
+    Examples
+    --------
+    >>> pg = pd.PreparedGrouper(df, ['A', 'B'])
+    >>> df.groupby(pg).sum()
+    >>> df.groupby(pg)['C'].mean()
+    >>> df['C'].groupby(pg).max()
+    """
+
+    def __init__(self, obj, by=None, level=None, axis=0, sort=True,
+                 observed=False):
+        if by is None and level is None:
+            raise TypeError("You have to supply one of 'by' and 'level'")
+
+        self.by = by
+        self.level = level
+        self.axis = obj._get_axis_number(axis)
+        self.sort = sort
+        self.observed = observed
+        self._prepare(obj)
+
+    def __repr__(self):
+        return "{}(by={!r}, level={!r}, ngroups={})".format(
+            self.__class__.__name__, self.by, self.level, self.ngroups)
+
+    @property
+    def codes(self):
+        """ the group code of every row, -1 for missing keys """
+        return self.grouper.group_info[0]
+
+    @property
+    def ngroups(self):
+        return self.grouper.ngroups
+
+    @property
+    def sort_order(self):
+        """ the stable indexer that sorts the rows by their group """
+        return self.grouper._sort_idx
+
+    @property
+    def result_index(self):
+        return self.grouper.result_index
+
+    def _key_columns(self, obj):
+        # the keys which are columns of obj, these are the only ones that
+        # can be modified in place
+        if not isinstance(obj, DataFrame) or self.axis != 0:
+            return []
+        keys = self.by if isinstance(self.by, list) else [self.by]
+        return [key for key in keys
+                if _is_label_like(key) and key in obj.columns]
+
+    @staticmethod
+    def _key_state(obj, columns):
+        # a hash of the values of every key column, which changes however
+        # the column is modified: replaced, set through the frame, through
+        # a column selected from it or straight in its numpy array
+        from pandas.core.util.hashing import hash_pandas_object
+
+        state = {}
+        for col in columns:
+            hashed = hash_pandas_object(obj[col], index=False).values
+
+            # weight each hash by an odd number, so that moving values
+            # between rows changes the sum as well
+            weights = np.arange(1, 2 * len(hashed), 2, dtype=np.uint64)
+            state[col] = (hashed * weights).sum()
+        return state
+
+    def _factorize(self, obj):
+        columns = self._key_columns(obj)
+
+        by = self.by
+        if isinstance(by, list):
+            by = [key.copy() if isinstance(key, (np.ndarray, Series)) else key
+                  for key in by]
+        elif isinstance(by, (np.ndarray, Series)):
+            by = by.copy()
+
+        grouper, exclusions, _ = _get_grouper(obj, by, axis=self.axis,
+                                              level=self.level,
+                                              sort=self.sort,
+                                              observed=self.observed)
+
+        # factorize eagerly, this is what we want to reuse
+        grouper.group_info
+        grouper.result_index
+        return grouper, exclusions, columns
+
+    def _prepare(self, obj):
+        self.grouper, self.exclusions, columns = self._factorize(obj)
+        self._state = self._key_state(obj, columns)
+        self._axis = obj._get_axis(self.axis)
+
+    def _is_valid(self, obj):
+        if not obj._get_axis(self.axis).equals(self._axis):
+            return False
+
+        # obj may only hold a subset of the key columns (e.g. a Series
+        # selected from the original frame), check the ones it has
+        columns = self._key_columns(obj)
+        if not set(columns).issubset(self._state):
+            return False
+
+        state = self._key_state(obj, columns)
+        return all(state[col] == self._state[col] for col in columns)
+
+    def _get_grouper(self, obj, axis=0):
+        """
+        Parameters
+        ----------
+        obj : the subject object
+        axis : int, default 0
+
+        Returns
+        -------
+        a tuple of grouper, exclusions
+        """
+        if obj._get_axis_number(axis) != self.axis:
+            raise ValueError("The PreparedGrouper was created for "
+                             "axis {0}".format(self.axis))
+
+        if self._is_valid(obj):
+            return self.grouper, self.exclusions
+
+        if not obj._get_axis(self.axis).equals(self._axis):
+            # a different object, don't evict the cached factorization
+            if not self._key_columns(obj) and self.level is None:
+                raise ValueError("The PreparedGrouper does not match the "
+                                 "axis of the grouped object")
+            grouper, exclusions, _ = self._factorize(obj)
+            return grouper, exclusions
+
+        # the keys were modified since the factorization
+        self._prepare(obj)
+        return self.grouper, self.exclusions
+
+
 class Grouping(object):
 
     """
@@ -483,6 +655,11 @@ def _get_grouper(obj, key=None, axis=0, level=None, sort=True,
         else:
             return grouper, {key.key}, obj
 
+    # a prepared grouping, reuse its factorization
+    elif isinstance(key, PreparedGrouper):
+        grouper, exclusions = key._get_grouper(obj, axis=axis)
+        return grouper, exclusions, obj
+
     # already have a BaseGrouper, just return it
     elif isinstance(key, BaseGrouper):
         return key, [], obj
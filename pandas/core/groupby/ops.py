@@ -8,6 +8,7 @@ are contained *in* the SeriesGroupBy and DataFrameGroupBy objects.
 
 import copy
 import collections
+
 import numpy as np
 
 from pandas._libs import lib, reduction, NaT, iNaT, groupby as libgroupby
@@ -16,6 +17,7 @@ from pandas.util._decorators import cache_readonly
 from pandas.compat import zip, range, lzip
 
 from pandas.core.base import SelectionMixin
+from pandas.core.config import get_option
 from pandas.core.dtypes.missing import isna, _maybe_fill
 from pandas.core.index import (
     Index, MultiIndex, ensure_index)
@@ -95,6 +97,31 @@ def generate_bins_generic(values, binner, closed):
     return bins
 
 
+def _aggregate_column_slices(agg_func, result, counts, values, comp_ids,
+                             min_count, nthreads):
+    """
+    Run a cython aggregation kernel over column slices of a 2D block of
+    values on a thread pool.
+
+    The group kernels release the GIL and only aggregate along axis 0, so
+    each slice of columns can be processed independently, writing into the
+    matching columns of ``result``. The group labels are shared by all the
+    slices; ``counts`` only depends on the labels and is filled by the
+    first slice.
+    """
+    ncols = values.shape[1]
+    bounds = np.linspace(0, ncols, min(nthreads, ncols) + 1).astype(np.intp)
+    slices = [slice(start, stop) for start, stop in zip(bounds[:-1],
+                                                         bounds[1:])]
+    slice_counts = [counts] + [np.zeros_like(counts) for _ in slices[1:]]
+
+    def f(i):
+        agg_func(result[:, slices[i]], slice_counts[i], values[:, slices[i]],
+                 comp_ids, min_count)
+
+    com.get_thread_pool(nthreads).map(f, range(len(slices)))
+
+
 class BaseGrouper(object):
     """
     This is an internal Grouper class, which actually holds
@@ -155,7 +182,14 @@ class BaseGrouper(object):
 
     def _get_splitter(self, data, axis=0):
         comp_ids, _, ngroups = self.group_info
-        return get_splitter(data, comp_ids, ngroups, axis=axis)
+        return get_splitter(data, comp_ids, ngroups, axis=axis,
+                            sort_idx=self._sort_idx)
+
+    @cache_readonly
+    def _sort_idx(self):
+        # Counting sort indexer of the group labels, shared by all splitters
+        comp_ids, _, ngroups = self.group_info
+        return get_group_index_sorter(comp_ids, ngroups)
 
     def _get_group_keys(self):
         if len(self.groupings) == 1:
@@ -567,7 +601,15 @@ class BaseGrouper(object):
                 agg_func(result[:, :, i], counts, chunk, comp_ids,
                          min_count)
         else:
-            agg_func(result, counts, values, comp_ids, min_count)
+            nthreads = get_option('compute.groupby_threads')
+            # the slices map columns of values to the same columns of result,
+            # which kernels with several outputs per column (ohlc) don't
+            if (is_numeric and nthreads > 1 and values.shape[1] > 1 and
+                    result.shape[1] == values.shape[1]):
+                _aggregate_column_slices(agg_func, result, counts, values,
+                                         comp_ids, min_count, nthreads)
+            else:
+                agg_func(result, counts, values, comp_ids, min_count)
 
         return result
 
@@ -805,12 +847,13 @@ def _is_indexed_like(obj, axes):
 
 class DataSplitter(object):
 
-    def __init__(self, data, labels, ngroups, axis=0):
+    def __init__(self, data, labels, ngroups, axis=0, sort_idx=None):
         self.data = data
         self.labels = ensure_int64(labels)
         self.ngroups = ngroups
 
         self.axis = axis
+        self._sort_idx = sort_idx
 
     @cache_readonly
     def slabels(self):
@@ -820,6 +863,8 @@ class DataSplitter(object):
     @cache_readonly
     def sort_idx(self):
         # Counting sort indexer
+        if self._sort_idx is not None:
+            return self._sort_idx
         return get_group_index_sorter(self.labels, self.ngroups)
 
     def __iter__(self):
@@ -859,8 +904,9 @@ class SeriesSplitter(DataSplitter):
 
 class FrameSplitter(DataSplitter):
 
-    def __init__(self, data, labels, ngroups, axis=0):
-        super(FrameSplitter, self).__init__(data, labels, ngroups, axis=axis)
+    def __init__(self, data, labels, ngroups, axis=0, sort_idx=None):
+        super(FrameSplitter, self).__init__(data, labels, ngroups, axis=axis,
+                                            sort_idx=sort_idx)
 
     def fast_apply(self, f, names):
         # must return keys::list, values::list, mutated::bool
@@ -885,8 +931,9 @@ class FrameSplitter(DataSplitter):
 
 class NDFrameSplitter(DataSplitter):
 
-    def __init__(self, data, labels, ngroups, axis=0):
-        super(NDFrameSplitter, self).__init__(data, labels, ngroups, axis=axis)
+    def __init__(self, data, labels, ngroups, axis=0, sort_idx=None):
+        super(NDFrameSplitter, self).__init__(data, labels, ngroups,
+                                              axis=axis, sort_idx=sort_idx)
 
         self.factory = data._constructor
 
@@ -0,0 +1,418 @@
+"""
+Provide a groupby that reduces a stream of chunks, such as the ones returned
+by ``read_csv(..., chunksize=...)``, ``HDFStore.select(..., iterator=True)``
+or ``read_sql(..., chunksize=...)``, without materializing the full object.
+
+Every chunk is reduced to mergeable partial aggregates using the regular
+(cython) groupby reductions, and the partial aggregates are combined chunk by
+chunk, so the memory use only depends on the chunk size and on the number of
+groups.
+"""
+
+import numpy as np
+
+from pandas import compat
+from pandas.compat import range, zip
+from pandas.core.dtypes.common import is_numeric_dtype, ensure_platform_int
+from pandas.core.dtypes.missing import notna
+from pandas.core.base import SpecificationError
+from pandas.core.index import Index, MultiIndex
+from pandas.core.frame import DataFrame
+from pandas.core.series import Series
+from pandas.core.reshape.concat import concat
+from pandas.core.util.hashing import hash_array
+
+
+# the partial aggregates (states) each reduction needs
+_reduction_states = {
+    'sum': ('sum',),
+    'count': ('count',),
+    'mean': ('sum', 'count'),
+    'var': ('moments',),
+    'std': ('moments',),
+    'min': ('min',),
+    'max': ('max',),
+    'first': ('first',),
+    'last': ('last',),
+    'nunique': ('registers',),
+}
+
+# reductions which skip non-numeric columns when no column is specified
+_numeric_only = {'sum', 'mean', 'var', 'std'}
+
+# states computed by the groupby reduction of the same name, mapped to the
+# groupby reduction which merges the concatenated partial aggregates
+_simple_states = {'sum': 'sum', 'count': 'sum', 'min': 'min', 'max': 'max',
+                  'first': 'first', 'last': 'last'}
+
+
+class StreamingGroupBy(object):
+    """
+    Groupby reductions over a stream of chunks
+
+    The chunks are reduced one at a time to partial aggregates, which are
+    merged as the chunks arrive, so the whole object never has to fit in
+    memory.
+
+    .. versionadded:: 0.24.0
+
+    Parameters
+    ----------
+    by : label or list of labels
+        The columns of the chunks to group by
+    func : string, list of strings or dict
+        The reductions to compute, with the same meaning as for
+        ``DataFrameGroupBy.aggregate``. Supported reductions are 'sum',
+        'count', 'mean', 'var', 'std', 'min', 'max', 'first', 'last' and
+        'nunique'
+    sort : boolean, default True
+        Sort group keys, otherwise the groups are in order of first
+        appearance in the stream
+    precision : int, default 12
+        Precision of the HyperLogLog sketch used by 'nunique', which uses
+        ``2 ** precision`` bytes per group and column and has a relative
+        standard error of about ``1.04 / sqrt(2 ** precision)``
+
+    Examples
+    --------
+    >>> reader = pd.read_csv('data.csv', chunksize=10 ** 6)
+    >>> sgb = StreamingGroupBy(['A', 'B'], {'C': ['sum', 'mean'],
+    ...                                     'D': 'nunique'})
+    >>> result = sgb.aggregate(reader)
+
+    Partial results of independent streams can be combined with
+    :meth:`merge`:
+
+    >>> left = StreamingGroupBy('A', 'var').update(chunk1)
+    >>> right = StreamingGroupBy('A', 'var').update(chunk2)
+    >>> left.merge(right).result()
+    """
+
+    def __init__(self, by, func, sort=True, precision=12):
+        if not isinstance(by, list):
+            by = [by]
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+
+        self.by = by
+        self.func = func
+        self.sort = sort
+        self.precision = precision
+
+        self._states = None
+        self._columns = None
+
+    def __repr__(self):
+        return "{}(by={!r}, func={!r})".format(self.__class__.__name__,
+                                               self.by, self.func)
+
+    # ------------------------------------------------------------
+    # Consuming chunks
+
+    def update(self, chunk):
+        """
+        Reduce a chunk and merge it into the partial aggregates
+
+        Parameters
+        ----------
+        chunk : DataFrame
+
+        Returns
+        -------
+        self
+        """
+        if self._columns is None:
+            self._columns = self._get_reductions(chunk)
+
+        grouped = chunk.groupby(self.by, sort=False)
+        states = {}
+        for column, how in self._columns:
+            for kind in _reduction_states[how]:
+                key = (column, kind)
+                if key not in states:
+                    states[key] = self._reduce(grouped, column, kind)
+
+        self._merge_states(states)
+        return self
+
+    def aggregate(self, chunks):
+        """
+        Consume all the chunks of an iterable and return the result
+
+        Parameters
+        ----------
+        chunks : iterable of DataFrame
+
+        Returns
+        -------
+        DataFrame
+        """
+        for chunk in chunks:
+            self.update(chunk)
+        return self.result()
+
+    agg = aggregate
+
+    def merge(self, other):
+        """
+        Merge the partial aggregates of another StreamingGroupBy
+
+        Parameters
+        ----------
+        other : StreamingGroupBy
+            Created with the same ``by``, ``func`` and ``precision``
+
+        Returns
+        -------
+        self
+        """
+        if (other.by != self.by or other.func != self.func or
+                other.precision != self.precision):
+            raise ValueError("can only merge a StreamingGroupBy with the "
+                             "same 'by', 'func' and 'precision'")
+        if other._states is not None:
+            if self._columns is None:
+                self._columns = list(other._columns)
+            self._merge_states(other._states)
+        return self
+
+    def result(self):
+        """
+        Compute the reductions from the partial aggregates
+
+        Returns
+        -------
+        DataFrame
+        """
+        if self._states is None:
+            raise ValueError("No chunks have been aggregated")
+
+        index = self._group_index()
+        results = []
+        for column, how in self._columns:
+            results.append(self._finalize(column, how, index))
+
+        result = DataFrame(dict(zip(range(len(results)), results)),
+                           index=index, columns=range(len(results)))
+        result.columns = self._result_columns()
+        return result
+
+    # ------------------------------------------------------------
+    # Partial aggregates
+
+    def _get_reductions(self, chunk):
+        """ the list of (column, how) to compute """
+        func = self.func
+        if isinstance(func, dict):
+            reductions = []
+            for column, hows in compat.iteritems(func):
+                if column in self.by:
+                    raise SpecificationError("cannot aggregate the grouping "
+                                             "column {0!r}".format(column))
+                if column not in chunk.columns:
+                    raise KeyError(column)
+                if not isinstance(hows, list):
+                    hows = [hows]
+                reductions.extend((column, how) for how in hows)
+        else:
+            hows = func if isinstance(func, list) else [func]
+            reductions = []
+            for column in chunk.columns:
+                if column in self.by:
+                    continue
+                for how in hows:
+                    if (how in _numeric_only and
+                            not is_numeric_dtype(chunk[column])):
+                        continue
+                    reductions.append((column, how))
+
+        for _, how in reductions:
+            if how not in _reduction_states:
+                raise ValueError("{0!r} is not a supported streaming "
+                                 "reduction".format(how))
+        return reductions
+
+    def _result_columns(self):
+        func = self.func
+        if isinstance(func, dict):
+            flat = all(not isinstance(hows, list)
+                       for hows in compat.itervalues(func))
+        else:
+            flat = not isinstance(func, list)
+
+        if flat:
+            return Index([column for column, _ in self._columns])
+        return MultiIndex.from_tuples(self._columns)
+
+    def _reduce(self, grouped, column, kind):
+        """ reduce a chunk to the partial aggregate ``kind`` """
+        values = grouped[column]
+        if kind in _simple_states:
+            return getattr(values, kind)()
+        elif kind == 'moments':
+            count = values.count()
+            mean = values.mean()
+            m2 = (values.var() * (count - 1)).where(count > 1, 0.)
+            return DataFrame({'count': count, 'mean': mean, 'm2': m2},
+                             columns=['count', 'mean', 'm2'])
+        elif kind == 'registers':
+            comp_ids, _, ngroups = grouped.grouper.group_info
+            registers = _hll_registers(grouped.obj[column]._values,
+                                       comp_ids, ngroups, self.precision)
+            return grouped.grouper.result_index, registers
+
+    def _merge_states(self, states):
+        if self._states is None:
+            # a copy, as states may be the ones of another StreamingGroupBy
+            self._states = dict(states)
+            return
+
+        for key, state in compat.iteritems(states):
+            column, kind = key
+            current = self._states[key]
+            if kind in _simple_states:
+                level = list(range(current.index.nlevels))
+                merged = concat([current, state])
+                merged = getattr(merged.groupby(level=level, sort=False),
+                                 _simple_states[kind])()
+            elif kind == 'moments':
+                merged = _merge_moments(current, state)
+            elif kind == 'registers':
+                merged = _merge_registers(current, state)
+            self._states[key] = merged
+
+    def _group_index(self):
+        column, how = self._columns[0]
+        state = self._states[(column, _reduction_states[how][0])]
+        index = state[0] if isinstance(state, tuple) else state.index
+        if self.sort:
+            index = index.sort_values()
+        return index
+
+    def _finalize(self, column, how, index):
+        """ compute the reduction ``how`` from the partial aggregates """
+
+        def get_state(kind):
+            state = self._states[(column, kind)]
+            if kind == 'registers':
+                state_index, registers = state
+                indexer = ensure_platform_int(state_index.get_indexer(index))
+                return registers.take(indexer, axis=0)
+            return state.reindex(index)
+
+        if how in _simple_states:
+            result = get_state(how)
+        elif how == 'mean':
+            count = get_state('count')
+            result = get_state('sum') / count.where(count > 0)
+        elif how in ('var', 'std'):
+            moments = get_state('moments')
+            count = moments['count']
+            result = moments['m2'] / (count - 1).where(count > 1)
+            if how == 'std':
+                result = np.sqrt(result)
+        elif how == 'nunique':
+            result = Series(_hll_estimate(get_state('registers')),
+                            index=index)
+
+        return result
+
+
+def _merge_moments(left, right):
+    """
+    Merge two sets of (count, mean, m2) partial aggregates per group, using
+    the pairwise update of Chan, Golub & LeVeque
+    """
+    index = left.index.append(right.index).unique()
+    left = left.reindex(index).fillna(0)
+    right = right.reindex(index).fillna(0)
+
+    n_left, n_right = left['count'].values, right['count'].values
+    n = n_left + n_right
+    with np.errstate(invalid='ignore', divide='ignore'):
+        delta = right['mean'].values - left['mean'].values
+        mean = left['mean'].values + delta * n_right / n
+        m2 = (left['m2'].values + right['m2'].values +
+              delta ** 2 * n_left * n_right / n)
+
+    empty = n == 0
+    mean[empty] = 0.
+    m2[empty] = 0.
+    return DataFrame({'count': n, 'mean': mean, 'm2': m2}, index=index,
+                     columns=['count', 'mean', 'm2'])
+
+
+def _hll_registers(values, comp_ids, ngroups, precision):
+    """
+    Build the HyperLogLog registers of every group
+
+    Parameters
+    ----------
+    values : ndarray-like
+    comp_ids : ndarray of int64
+        The group of every value, -1 for missing keys
+    ngroups : int
+    precision : int
+        The number of hash bits used to select a register
+
+    Returns
+    -------
+    ndarray of uint8, shape (ngroups, 2 ** precision)
+    """
+    registers = np.zeros((ngroups, 1 << precision), dtype=np.uint8)
+
+    mask = (comp_ids != -1) & notna(values)
+    values, comp_ids = values[mask], comp_ids[mask]
+    if not len(values):
+        return registers
+
+    hashed = hash_array(values)
+    buckets = ensure_platform_int(hashed >> np.uint64(64 - precision))
+    remainder = hashed << np.uint64(precision)
+
+    # the rank is the position of the first set bit of the remaining hash
+    # bits, computed by a vectorized binary search for the leading zeros
+    zeros = np.zeros(len(remainder), dtype=np.uint8)
+    shifted = remainder.copy()
+    for bits in (32, 16, 8, 4, 2, 1):
+        top_clear = shifted < (np.uint64(1) << np.uint64(64 - bits))
+        zeros[top_clear] += bits
+        shifted[top_clear] <<= np.uint64(bits)
+    zeros[remainder == 0] = 64
+    ranks = np.minimum(zeros, 64 - precision) + 1
+
+    np.maximum.at(registers, (ensure_platform_int(comp_ids), buckets),
+                  ranks.astype(np.uint8))
+    return registers
+
+
+def _merge_registers(left, right):
+    left_index, left_registers = left
+    right_index, right_registers = right
+
+    index = left_index.append(right_index).unique()
+    registers = np.zeros((len(index), left_registers.shape[1]),
+                         dtype=np.uint8)
+
+    indexer = ensure_platform_int(index.get_indexer(left_index))
+    registers[indexer] = left_registers
+    indexer = ensure_platform_int(index.get_indexer(right_index))
+    registers[indexer] = np.maximum(registers[indexer], right_registers)
+    return index, registers
+
+
+def _hll_estimate(registers):
+    """ the HyperLogLog cardinality estimate of every row of registers """
+    m = registers.shape[1]
+    alpha = 0.7213 / (1 + 1.079 / m)
+
+    raw = alpha * m * m / np.power(2., -registers.astype(np.float64)).sum(1)
+
+    # small range correction (linear counting)
+    empty = (registers == 0).sum(1)
+    with np.errstate(divide='ignore'):
+        linear = m * np.log(m / empty.astype(np.float64))
+    small = (raw <= 2.5 * m) & (empty > 0)
+    estimate = np.where(small, linear, raw)
+
+    return np.round(estimate).astype(np.int64)
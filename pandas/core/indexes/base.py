@@ -238,6 +238,11 @@ class Index(IndexOpsMixin, PandasObject):
 
     _engine_type = libindex.ObjectEngine
 
+    # whether get_value of a Series of numpy values amounts to a lookup of
+    # the key in the engine, which the scalar lookups of .at and .loc then
+    # do directly
+    _can_get_value_from_engine = True
+
     _accessors = {'str'}
 
     str = CachedAccessor("str", StringMethods)
@@ -2053,7 +2058,17 @@ class Index(IndexOpsMixin, PandasObject):
         names = {obj.name for obj in to_concat}
         name = None if len(names) > 1 else self.name
 
-        return self._concat(to_concat, name)
+        result = self._concat(to_concat, name)
+
+        # the values of self lead the result: extend the engine state of self
+        # (its mapping moves over to the result) instead of rebuilding it
+        engine = (getattr(self, '_cache', None) or {}).get('_engine')
+        if (engine is not None and type(result) is type(self) and
+                isinstance(engine, libindex.IndexEngine) and
+                type(result._engine) is type(engine)):
+            result._engine._extend_from(engine, len(self))
+
+        return result
 
     def _concat(self, to_concat, name):
 
@@ -73,6 +73,7 @@ class CategoricalIndex(Index, accessor.PandasDelegate):
 
     _typ = 'categoricalindex'
     _engine_type = libindex.Int64Engine
+    _can_get_value_from_engine = False
     _attributes = ['name']
 
     def __new__(cls, data=None, categories=None, ordered=None, dtype=None,
@@ -431,6 +431,11 @@ class DatetimeIndex(DatetimeArrayMixin, DatelikeOps, TimelikeOps,
         else:
             return self.values
 
+    @property
+    def _can_get_value_from_engine(self):
+        # get_value localizes naive keys to the timezone of the index
+        return self.tz is None
+
     @property
     def tz(self):
         # GH 18595
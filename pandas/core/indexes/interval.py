@@ -138,6 +138,7 @@ class IntervalIndex(IntervalMixin, Index):
     _typ = 'intervalindex'
     _comparables = ['name']
     _attributes = ['name', 'closed']
+    _can_get_value_from_engine = False
 
     # we would like our indexing holder to defer to us
     _defer_to_indexing = True
@@ -207,6 +207,7 @@ class MultiIndex(Index):
     _levels = FrozenList()
     _labels = FrozenList()
     _comparables = ['names']
+    _can_get_value_from_engine = False
     rename = Index.set_names
 
     def __new__(cls, levels=None, labels=None, sortorder=None, names=None,
@@ -1062,7 +1063,8 @@ class MultiIndex(Index):
     def unique(self, level=None):
 
         if level is None:
-            return super(MultiIndex, self).unique()
+            # by the labels, without building the tuples
+            return self[~self.duplicated()].remove_unused_levels()
         else:
             level = self._get_level_number(level)
             return self._get_level_values(level=level, unique=True)
@@ -1528,8 +1530,9 @@ class MultiIndex(Index):
 
     def __reduce__(self):
         """Necessary for making this object picklable"""
+        # plain ndarray labels can be pickled out-of-band (protocol 5)
         d = dict(levels=[lev for lev in self.levels],
-                 labels=[label for label in self.labels],
+                 labels=[label.view(np.ndarray) for label in self.labels],
                  sortorder=self.sortorder, names=list(self.names))
         return ibase._new_Index, (self.__class__, d), None
 
@@ -1942,12 +1945,9 @@ class MultiIndex(Index):
                 target = MultiIndex.from_tuples(target)
             except (TypeError, ValueError):
 
-                # let's instead try with a straight Index
+                # let's instead look up the keys one at a time
                 if method is None:
-                    return Index(self.values).get_indexer(target,
-                                                          method=method,
-                                                          limit=limit,
-                                                          tolerance=tolerance)
+                    return self._get_indexer_keys(target)
 
         if not self.is_unique:
             raise ValueError('Reindexing only valid with uniquely valued '
@@ -1966,8 +1966,33 @@ class MultiIndex(Index):
 
         return ensure_platform_int(indexer)
 
+    def _get_indexer_keys(self, target):
+        """
+        Locate each of the keys of target, of which only the tuples with a
+        label for each level can match, without building the tuples of self
+        """
+        if not self.is_unique:
+            raise InvalidIndexError('Reindexing only valid with uniquely '
+                                    'valued Index objects')
+
+        indexer = np.empty(len(target), dtype=np.intp)
+        for i, key in enumerate(target):
+            loc = -1
+            if isinstance(key, tuple) and len(key) == self.nlevels:
+                try:
+                    loc = self._engine.get_loc(key)
+                except (KeyError, TypeError, ValueError):
+                    pass
+            indexer[i] = loc
+        return indexer
+
     @Appender(_index_shared_docs['get_indexer_non_unique'] % _index_doc_kwargs)
     def get_indexer_non_unique(self, target):
+        target = ensure_index(target)
+        if isinstance(target, MultiIndex):
+            # the engine recodes the labels of target
+            indexer, missing = self._engine.get_indexer_non_unique(target)
+            return ensure_platform_int(indexer), missing
         return super(MultiIndex, self).get_indexer_non_unique(target)
 
     def reindex(self, target, method=None, level=None, limit=None,
@@ -2843,9 +2868,30 @@ class MultiIndex(Index):
     @Appender(Index.isin.__doc__)
     def isin(self, values, level=None):
         if level is None:
-            values = MultiIndex.from_tuples(values,
-                                            names=self.names).values
-            return algos.isin(self.values, values)
+            from pandas.core.sorting import get_group_index
+
+            if (not isinstance(values, MultiIndex) or
+                    values.nlevels != self.nlevels):
+                values = MultiIndex.from_tuples(values, names=self.names)
+
+            # recode the labels of values for the levels, leaving out the
+            # keys with labels missing from them, and compare the group ids
+            # of both, without building the tuples
+            found = np.ones(len(values), dtype=np.bool_)
+            labels = []
+            for lev, lab, vlev, vlab in zip(self.levels, self.labels,
+                                            values.levels, values.labels):
+                recoded = np.append(lev.get_indexer(vlev), -1).take(vlab)
+                missing = recoded == -1
+                if compat.PYPY:
+                    # where tuples with NaN compare equal
+                    missing &= vlab != -1
+                found &= ~missing
+                labels.append(np.concatenate([lab, recoded]))
+
+            ids = get_group_index(labels, map(len, self.levels), sort=False,
+                                  xnull=False)
+            return algos.isin(ids[:len(self)], ids[len(self):][found])
         else:
             num = self._get_level_number(level)
             levs = self.levels[num]
@@ -294,6 +294,7 @@ class Float64Index(NumericIndex):
 
     _typ = 'float64index'
     _engine_type = libindex.Float64Engine
+    _can_get_value_from_engine = False
     _left_indexer_unique = libjoin.left_join_indexer_unique_float64
     _left_indexer = libjoin.left_join_indexer_float64
     _inner_indexer = libjoin.inner_join_indexer_float64
@@ -174,6 +174,7 @@ class PeriodIndex(PeriodArrayMixin, DatelikeOps, DatetimeIndexOpsMixin,
     _freq = None
 
     _engine_type = libindex.PeriodEngine
+    _can_get_value_from_engine = False
 
     def __new__(cls, data=None, ordinal=None, freq=None, start=None, end=None,
                 periods=None, tz=None, dtype=None, copy=False, name=None,
@@ -21,7 +21,7 @@ from pandas.util._decorators import Appender
 from pandas.core.index import Index, MultiIndex
 
 import pandas.core.common as com
-from pandas._libs.indexing import _NDFrameIndexerBase
+from pandas._libs.indexing import _NDFrameIndexerBase, get_scalar
 
 
 # the supported indexers
@@ -1811,11 +1811,12 @@ class _LocIndexer(_LocationIndexer):
         if len(key) != self.ndim:
             return False
 
+        axes = self.obj.axes
         for i, k in enumerate(key):
             if not is_scalar(k):
                 return False
 
-            ax = self.obj.axes[i]
+            ax = axes[i]
             if isinstance(ax, MultiIndex):
                 return False
 
@@ -1827,7 +1828,7 @@ class _LocIndexer(_LocationIndexer):
     def _getitem_scalar(self, key):
         # a fast-path to scalar access
         # if not, raise
-        values = self.obj._get_value(*key)
+        values = get_scalar(self.obj, key, False)
         return values
 
     def _get_partial_string_timestamp_match_key(self, key, labels):
@@ -2099,11 +2100,12 @@ class _iLocIndexer(_LocationIndexer):
         if len(key) != self.ndim:
             return False
 
+        axes = self.obj.axes
         for i, k in enumerate(key):
             if not is_integer(k):
                 return False
 
-            ax = self.obj.axes[i]
+            ax = axes[i]
             if not ax.is_unique:
                 return False
 
@@ -2112,7 +2114,7 @@ class _iLocIndexer(_LocationIndexer):
     def _getitem_scalar(self, key):
         # a fast-path to scalar access
         # if not, raise
-        values = self.obj._get_value(*key, takeable=True)
+        values = get_scalar(self.obj, key, True)
         return values
 
     def _validate_integer(self, key, axis):
@@ -2270,7 +2272,7 @@ class _ScalarAccessIndexer(_NDFrameIndexer):
                 raise ValueError('Invalid call for scalar access (getting)!')
 
         key = self._convert_key(key)
-        return self.obj._get_value(*key, takeable=self._takeable)
+        return get_scalar(self.obj, key, self._takeable)
 
     def __setitem__(self, key, value):
         if isinstance(key, tuple):
@@ -6,9 +6,11 @@ from .blocks import (  # noqa:F401
     FloatBlock, IntBlock, ComplexBlock, BoolBlock, ObjectBlock,
     TimeDeltaBlock, DatetimeBlock, DatetimeTZBlock,
     CategoricalBlock, ExtensionBlock, SparseBlock, ScalarBlock,
-    Block)
+    Block,
+    using_copy_on_write)
 from .managers import (  # noqa:F401
-    BlockManager, SingleBlockManager,
+    BlockManager, SingleBlockManager, ColumnarBlockManager,
+    get_manager_class,
     create_block_manager_from_arrays, create_block_manager_from_blocks,
     items_overlap_with_suffix,  # reshape.merge
     concatenate_block_managers)  # reshape.concat, reshape.merge
@@ -2,6 +2,7 @@
 import warnings
 import inspect
 import re
+import weakref
 from datetime import datetime, timedelta, date
 
 import numpy as np
@@ -13,6 +14,7 @@ from pandas import compat
 from pandas.compat import range, zip
 
 from pandas.util._validators import validate_bool_kwarg
+from pandas.core.config import get_option
 
 from pandas.core.dtypes.dtypes import (
     ExtensionDtype, DatetimeTZDtype,
@@ -74,6 +76,41 @@ from pandas.core.indexing import check_setitem_lengths
 from pandas.io.formats.printing import pprint_thing
 
 
+_USE_COPY_ON_WRITE = False
+
+
+def set_copy_on_write(v=True):
+    # set/unset copy-on-write, kept in sync with the 'mode.copy_on_write'
+    # option, which is too slow to look up on every copy and column access
+    global _USE_COPY_ON_WRITE
+    _USE_COPY_ON_WRITE = v
+
+
+set_copy_on_write(get_option('mode.copy_on_write'))
+
+
+def using_copy_on_write():
+    return _USE_COPY_ON_WRITE
+
+
+class BlockRefs(object):
+    """
+    The blocks sharing (views of) the same values with copy-on-write, so
+    that each of them copies the values before the first write to them as
+    long as any other one is alive
+    """
+
+    def __init__(self, blk):
+        self.referenced_blocks = [weakref.ref(blk)]
+
+    def add_reference(self, blk):
+        self.referenced_blocks.append(weakref.ref(blk))
+
+    def remove_reference(self, blk):
+        self.referenced_blocks = [ref for ref in self.referenced_blocks
+                                  if ref() is not None and ref() is not blk]
+
+
 class Block(PandasObject):
     """
     Canonical n-dimensional unit of homogeneous dtype contained in a pandas
@@ -102,6 +139,9 @@ class Block(PandasObject):
     _ftype = 'dense'
     _concatenator = staticmethod(np.concatenate)
 
+    # BlockRefs of the blocks sharing the values with copy-on-write
+    _refs = None
+
     def __init__(self, values, placement, ndim=None):
         self.ndim = self._check_ndim(values, ndim)
         self.mgr_locs = placement
@@ -249,6 +289,47 @@ class Block(PandasObject):
 
         return make_block(values, placement=placement, ndim=ndim)
 
+    def make_block_ref(self, values=None, placement=None, ndim=None):
+        """
+        Wrap the values of this block, or a view of them, in a block of the
+        same type. With copy-on-write the new block and this one copy the
+        values before writing to them while the other is alive.
+        """
+        if values is None:
+            values = self.values
+        if placement is None:
+            placement = self.mgr_locs
+        nb = self.make_block_same_class(values, placement=placement,
+                                        ndim=ndim)
+        if using_copy_on_write():
+            if self._refs is None:
+                self._refs = BlockRefs(self)
+            self._refs.add_reference(nb)
+            nb._refs = self._refs
+        return nb
+
+    def _copy_if_referenced(self):
+        """
+        Copy the values of the block before writing to them, if other blocks
+        share them with copy-on-write
+
+        Returns
+        -------
+        bool : whether the values were copied
+        """
+        refs = self._refs
+        if refs is None:
+            return False
+        self._refs = None
+        refs.remove_reference(self)
+        if not refs.referenced_blocks:
+            return False
+        if isinstance(self.values, ABCIndexClass):
+            self.values = self.values.copy(deep=True)
+        else:
+            self.values = self.values.copy()
+        return True
+
     def make_block_scalar(self, values):
         """
         Create a ScalarBlock
@@ -332,7 +413,7 @@ class Block(PandasObject):
         if self._validate_ndim and new_values.ndim != self.ndim:
             raise ValueError("Only same dim slicing is allowed")
 
-        return self.make_block_same_class(new_values, new_mgr_locs)
+        return self.make_block_ref(new_values, new_mgr_locs)
 
     @property
     def shape(self):
@@ -369,6 +450,7 @@ class Block(PandasObject):
         -------
         None
         """
+        self._copy_if_referenced()
         self.values[locs] = values
 
     def delete(self, loc):
@@ -403,6 +485,8 @@ class Block(PandasObject):
             else:
                 return self.copy()
 
+        if inplace:
+            self._copy_if_referenced()
         mask = isna(self.values)
         if limit is not None:
             if not is_integer(limit):
@@ -771,6 +855,9 @@ class Block(PandasObject):
     def copy(self, deep=True, mgr=None):
         """ copy constructor """
         values = self.values
+        if using_copy_on_write():
+            # the values are copied on the first write to either block
+            return self.make_block_ref(values)
         if deep:
             values = values.copy()
         return self.make_block_same_class(values)
@@ -844,6 +931,8 @@ class Block(PandasObject):
             if self.is_numeric:
                 value = np.nan
 
+        self._copy_if_referenced()
+
         # coerce if block dtype can store value
         values = self.values
         try:
@@ -969,6 +1058,8 @@ class Block(PandasObject):
         a list of new blocks, the result of the putmask
         """
 
+        if inplace:
+            self._copy_if_referenced()
         new_values = self.values if inplace else self.values.copy()
 
         new = getattr(new, 'values', new)
@@ -1186,6 +1277,8 @@ class Block(PandasObject):
                 else:
                     return [self.copy()]
 
+        if inplace:
+            self._copy_if_referenced()
         values = self.values if inplace else self.values.copy()
         values, _, fill_value, _ = self._try_coerce_args(values, fill_value)
         values = missing.interpolate_2d(values, method=method, axis=axis,
@@ -1203,6 +1296,8 @@ class Block(PandasObject):
         """ interpolate using scipy wrappers """
 
         inplace = validate_bool_kwarg(inplace, 'inplace')
+        if inplace:
+            self._copy_if_referenced()
         data = self.values if inplace else self.values.copy()
 
         # only deal with floats
@@ -1802,7 +1897,9 @@ class NonConsolidatableMixIn(object):
 
         # use block's copy logic.
         # .values may be an Index which does shallow copy by default
-        new_values = self.values if inplace else self.copy().values
+        nb = self if inplace else self.copy()
+        nb._copy_if_referenced()
+        new_values = nb.values
         new_values, _, new, _ = self._try_coerce_args(new_values, new)
 
         if isinstance(new, np.ndarray) and len(new) == len(mask):
@@ -1936,6 +2033,7 @@ class ExtensionBlock(NonConsolidatableMixIn, Block):
             indexer = indexer[0]
 
         check_setitem_lengths(indexer, value, self.values)
+        self._copy_if_referenced()
         self.values[indexer] = value
         return self
 
@@ -2007,6 +2105,8 @@ class ExtensionBlock(NonConsolidatableMixIn, Block):
 
     def fillna(self, value, limit=None, inplace=False, downcast=None,
                mgr=None):
+        if inplace:
+            self._copy_if_referenced()
         values = self.values if inplace else self.values.copy()
         values = values.fillna(value=value, limit=limit)
         return [self.make_block_same_class(values=values,
@@ -2016,6 +2116,8 @@ class ExtensionBlock(NonConsolidatableMixIn, Block):
     def interpolate(self, method='pad', axis=0, inplace=False, limit=None,
                     fill_value=None, **kwargs):
 
+        if inplace:
+            self._copy_if_referenced()
         values = self.values if inplace else self.values.copy()
         return self.make_block_same_class(
             values=values.fillna(value=fill_value, method=method,
@@ -2382,6 +2484,7 @@ class ObjectBlock(Block):
                     return
             except:
                 pass
+        self._copy_if_referenced()
         try:
             self.values[locs] = values
         except (ValueError):
@@ -2510,6 +2613,8 @@ class ObjectBlock(Block):
                                                     filter=filter, regex=regex,
                                                     mgr=mgr)
 
+        if inplace:
+            self._copy_if_referenced()
         new_values = self.values if inplace else self.values.copy()
 
         # deal with replacing values with objects (strings) that match but
@@ -2776,6 +2881,7 @@ class DatetimeBlock(DatetimeLikeBlockMixin, Block):
             # Workaround for numpy 1.6 bug
             values = conversion.ensure_datetime64ns(values)
 
+        self._copy_if_referenced()
         self.values[locs] = values
 
 
@@ -3113,6 +3219,8 @@ class SparseBlock(NonConsolidatableMixIn, Block):
         if limit is not None:
             raise NotImplementedError("specifying a limit for 'fillna' has "
                                       "not been implemented yet")
+        if inplace:
+            self._copy_if_referenced()
         values = self.values if inplace else self.values.copy()
         values = values.fillna(value, downcast=downcast)
         return [self.make_block_same_class(values=values,
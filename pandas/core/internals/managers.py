@@ -9,6 +9,7 @@ import numpy as np
 from pandas._libs import lib, internals as libinternals
 
 from pandas.util._validators import validate_bool_kwarg
+from pandas.core.config import get_option
 from pandas.compat import range, map, zip
 
 from pandas.core.dtypes.dtypes import (
@@ -40,7 +41,7 @@ from pandas.io.formats.printing import pprint_thing
 from .blocks import (
     Block, DatetimeTZBlock, CategoricalBlock, ExtensionBlock, SparseBlock,
     _extend_blocks, _merge_blocks, _safe_reshape,
-    make_block, get_block_type)
+    make_block, get_block_type, using_copy_on_write)
 from .concat import (  # all for concatenate_block_managers
     concatenate_join_units, is_uniform_join_units,
     get_mgr_concatenation_plan, combine_concat_plans)
@@ -102,6 +103,9 @@ class BlockManager(PandasObject):
     __slots__ = ['axes', 'blocks', '_ndim', '_shape', '_known_consolidated',
                  '_is_consolidated', '_blknos', '_blklocs']
 
+    # whether the manager keeps one block per item, see ColumnarBlockManager
+    _columnar = False
+
     def __init__(self, blocks, axes, do_integrity_check=True):
         self.axes = [ensure_index(ax) for ax in axes]
         self.blocks = tuple(blocks)
@@ -250,15 +254,15 @@ class BlockManager(PandasObject):
         return algos.take_1d(ftypes, self._blknos, allow_fill=False)
 
     def __getstate__(self):
-        block_values = [b.values for b in self.blocks]
+        block_values = [_pickle_values(b.values) for b in self.blocks]
         block_items = [self.items[b.mgr_locs.indexer] for b in self.blocks]
         axes_array = [ax for ax in self.axes]
 
         extra_state = {
             '0.14.1': {
                 'axes': axes_array,
-                'blocks': [dict(values=b.values, mgr_locs=b.mgr_locs.indexer)
-                           for b in self.blocks]
+                'blocks': [dict(values=values, mgr_locs=b.mgr_locs.indexer)
+                           for values, b in zip(block_values, self.blocks)]
             }
         }
 
@@ -899,7 +903,11 @@ class BlockManager(PandasObject):
         single block
         """
         if len(self.blocks) == 1:
-            return self.blocks[0].iget((slice(None), loc))
+            result = self.blocks[0].iget((slice(None), loc))
+            if using_copy_on_write():
+                # the row is returned as a bare array, untracked by the block
+                result = result.copy()
+            return result
 
         items = self.items
 
@@ -922,6 +930,47 @@ class BlockManager(PandasObject):
 
         return result
 
+    def take_points(self, items, indexer):
+        """
+        Take the value of each item at the matching location along axis 1,
+        gathering the values of each block at once
+
+        Parameters
+        ----------
+        items : ndarray of int
+            locations of the items
+        indexer : ndarray of int
+            locations along axis 1, as many as the items
+
+        Returns
+        -------
+        ndarray of the dtype interleaving the blocks of the items
+        """
+        blknos = self._blknos[items]
+        blklocs = self._blklocs[items]
+
+        if len(items):
+            blocks = [self.blocks[blkno] for blkno in algos.unique(blknos)]
+        else:
+            blocks = self.blocks
+        dtype = _interleaved_dtype(blocks)
+        result = np.empty(len(items), dtype=dtype)
+
+        for blkno, positions in libinternals.get_blkno_indexers(blknos):
+            blk = self.blocks[blkno]
+            if blk.is_extension or not blk._can_consolidate:
+                # one item in 1-dimensional values
+                values = blk.values.take(indexer[positions])
+            else:
+                values = blk.values[blklocs[positions], indexer[positions]]
+
+            # box datetime-likes for object dtype as the block would
+            values = blk.make_block_same_class(
+                values, placement=slice(0, len(values)), ndim=1)
+            result[positions] = values.get_values(dtype)
+
+        return result
+
     def consolidate(self):
         """
         Join together blocks having same dtype
@@ -987,9 +1036,8 @@ class BlockManager(PandasObject):
 
         # fastpath shortcut for select a single-dim from a 2-dim BM
         return SingleBlockManager(
-            [block.make_block_same_class(values,
-                                         placement=slice(0, len(values)),
-                                         ndim=1)],
+            [block.make_block_ref(values, placement=slice(0, len(values)),
+                                  ndim=1)],
             self.axes[1])
 
     def delete(self, item):
@@ -1030,6 +1078,16 @@ class BlockManager(PandasObject):
         self._shape = None
         self._rebuild_blknos_and_blklocs()
 
+    def _copy_items_if_referenced(self, loc):
+        """
+        Copy the values of the blocks holding the items at the positional
+        ``loc`` before writing to them in-place, if other blocks share them
+        with copy-on-write
+        """
+        blknos = np.unique(np.atleast_1d(self._blknos[loc]))
+        for blkno in blknos:
+            self.blocks[blkno]._copy_if_referenced()
+
     def set(self, item, value, check=False):
         """
         Set new item in-place. Does not consolidate. Adds new Block if not
@@ -1322,6 +1380,14 @@ class BlockManager(PandasObject):
                         newblk.mgr_locs = slice(mgr_loc, mgr_loc + 1)
                         blocks.append(newblk)
 
+                elif using_copy_on_write():
+                    # with copy-on-write, take each item as a view of the
+                    # block instead of copying the selected items
+                    for i, ml in zip(blklocs[mgr_locs.indexer], mgr_locs):
+                        newblk = blk.getitem_block(slice(i, i + 1),
+                                                   new_mgr_locs=[ml])
+                        blocks.append(newblk)
+
                 else:
                     blocks.append(blk.take_nd(blklocs[mgr_locs.indexer],
                                               axis=0, new_mgr_locs=mgr_locs,
@@ -1384,7 +1450,9 @@ class BlockManager(PandasObject):
         new_axes = list(self.axes)
         new_axes[0] = new_items
 
-        return self.__class__(_consolidate(new_blocks), new_axes)
+        if not self._columnar:
+            new_blocks = _consolidate(new_blocks)
+        return self.__class__(new_blocks, new_axes)
 
     def equals(self, other):
         self_axes, other_axes = self.axes, other.axes
@@ -1442,6 +1510,73 @@ class BlockManager(PandasObject):
         return bm
 
 
+class ColumnarBlockManager(BlockManager):
+    """
+    BlockManager holding one block per item, which never consolidates
+
+    Inserting an item only appends its block, and the items of the same
+    dtype are never copied together into a single block, at the cost of
+    operations across the items working block by block.
+    """
+    __slots__ = ()
+
+    _columnar = True
+
+    def __init__(self, blocks, axes, do_integrity_check=True):
+        super(ColumnarBlockManager, self).__init__(
+            _split_blocks(blocks), axes, do_integrity_check=do_integrity_check)
+
+    def is_consolidated(self):
+        return True
+
+    def _consolidate_check(self):
+        self._is_consolidated = True
+        self._known_consolidated = True
+
+    def _consolidate_inplace(self):
+        pass
+
+    def set(self, item, value, check=False):
+        super(ColumnarBlockManager, self).set(item, value, check=check)
+
+        # setting several items at once can append a block holding all of
+        # them; the blocks already present keep holding a single item
+        if self.blocks and len(self.blocks[-1].mgr_locs) > 1:
+            last = self.blocks[-1]
+            blkno = len(self.blocks) - 1
+            self.blocks = self.blocks[:-1] + tuple(_split_blocks([last]))
+            self._blknos[last.mgr_locs.indexer] = blkno + np.arange(len(last))
+            self._blklocs[last.mgr_locs.indexer] = 0
+
+    def reduce(self, func, dtype=None):
+        """
+        Reduce each item with ``func`` block by block, without interleaving
+        the blocks.
+
+        Parameters
+        ----------
+        func : callable
+            Reduction called on the 2D values of a block along axis 1.
+        dtype : dtype, optional
+            dtype of the result, by default the common type of the results
+            of the blocks
+
+        Returns
+        -------
+        ndarray with a value per item
+        """
+        results = [(blk.mgr_locs.indexer, func(blk.get_values()))
+                   for blk in self.blocks]
+        if dtype is None:
+            dtype = find_common_type([np.asarray(res).dtype
+                                      for _, res in results] or
+                                     [np.float64])
+        result = np.empty(len(self.items), dtype=dtype)
+        for indexer, res in results:
+            result[indexer] = res
+        return result
+
+
 class SingleBlockManager(BlockManager):
     """ manage a single block with """
 
@@ -1517,8 +1652,10 @@ class SingleBlockManager(BlockManager):
         if axis >= self.ndim:
             raise IndexError("Requested axis not found in manager")
 
-        return self.__class__(self._block._slice(slobj),
-                              self.index[slobj], fastpath=True)
+        new_index = self.index[slobj]
+        block = self._block.make_block_ref(self._block._slice(slobj),
+                                           placement=slice(0, len(new_index)))
+        return self.__class__(block, new_index, fastpath=True)
 
     @property
     def index(self):
@@ -1648,6 +1785,21 @@ class SingleBlockManager(BlockManager):
 # --------------------------------------------------------------------
 # Constructor Helpers
 
+def get_manager_class(typ=None):
+    """
+    Return the BlockManager class for the manager type ``typ``, 'block' or
+    'columnar', by default the 'mode.data_manager' option
+    """
+    if typ is None:
+        typ = get_option('mode.data_manager')
+    if typ == 'block':
+        return BlockManager
+    elif typ == 'columnar':
+        return ColumnarBlockManager
+    raise ValueError("manager type must be 'block' or 'columnar', "
+                     "got {typ!r}".format(typ=typ))
+
+
 def create_block_manager_from_blocks(blocks, axes):
     try:
         if len(blocks) == 1 and not isinstance(blocks[0], Block):
@@ -1661,7 +1813,7 @@ def create_block_manager_from_blocks(blocks, axes):
                 blocks = [make_block(values=blocks[0],
                                      placement=slice(0, len(axes[0])))]
 
-        mgr = BlockManager(blocks, axes)
+        mgr = get_manager_class()(blocks, axes)
         mgr._consolidate_inplace()
         return mgr
 
@@ -1674,8 +1826,10 @@ def create_block_manager_from_blocks(blocks, axes):
 def create_block_manager_from_arrays(arrays, names, axes):
 
     try:
-        blocks = form_blocks(arrays, names, axes)
-        mgr = BlockManager(blocks, axes)
+        klass = get_manager_class()
+        blocks = form_blocks(arrays, names, axes,
+                             consolidate=not klass._columnar)
+        mgr = klass(blocks, axes)
         mgr._consolidate_inplace()
         return mgr
     except ValueError as e:
@@ -1696,10 +1850,16 @@ def construction_error(tot_items, block_shape, axes, e=None):
 
 # -----------------------------------------------------------------------
 
-def form_blocks(arrays, names, axes):
+def form_blocks(arrays, names, axes, consolidate=True):
     # put "leftover" items in float bucket, where else?
     # generalize?
     items_dict = defaultdict(list)
+
+    def blockify(func, tuples, *args):
+        if consolidate:
+            return func(tuples, *args)
+        # stack each item in its own block
+        return [blk for tup in tuples for blk in func([tup], *args)]
     extra_locs = []
 
     names_idx = ensure_index(names)
@@ -1722,24 +1882,26 @@ def form_blocks(arrays, names, axes):
 
     blocks = []
     if len(items_dict['FloatBlock']):
-        float_blocks = _multi_blockify(items_dict['FloatBlock'])
+        float_blocks = blockify(_multi_blockify, items_dict['FloatBlock'])
         blocks.extend(float_blocks)
 
     if len(items_dict['ComplexBlock']):
-        complex_blocks = _multi_blockify(items_dict['ComplexBlock'])
+        complex_blocks = blockify(_multi_blockify,
+                                  items_dict['ComplexBlock'])
         blocks.extend(complex_blocks)
 
     if len(items_dict['TimeDeltaBlock']):
-        timedelta_blocks = _multi_blockify(items_dict['TimeDeltaBlock'])
+        timedelta_blocks = blockify(_multi_blockify,
+                                    items_dict['TimeDeltaBlock'])
         blocks.extend(timedelta_blocks)
 
     if len(items_dict['IntBlock']):
-        int_blocks = _multi_blockify(items_dict['IntBlock'])
+        int_blocks = blockify(_multi_blockify, items_dict['IntBlock'])
         blocks.extend(int_blocks)
 
     if len(items_dict['DatetimeBlock']):
-        datetime_blocks = _simple_blockify(items_dict['DatetimeBlock'],
-                                           _NS_DTYPE)
+        datetime_blocks = blockify(_simple_blockify,
+                                   items_dict['DatetimeBlock'], _NS_DTYPE)
         blocks.extend(datetime_blocks)
 
     if len(items_dict['DatetimeTZBlock']):
@@ -1750,11 +1912,13 @@ def form_blocks(arrays, names, axes):
         blocks.extend(dttz_blocks)
 
     if len(items_dict['BoolBlock']):
-        bool_blocks = _simple_blockify(items_dict['BoolBlock'], np.bool_)
+        bool_blocks = blockify(_simple_blockify, items_dict['BoolBlock'],
+                               np.bool_)
         blocks.extend(bool_blocks)
 
     if len(items_dict['ObjectBlock']) > 0:
-        object_blocks = _simple_blockify(items_dict['ObjectBlock'], np.object_)
+        object_blocks = blockify(_simple_blockify, items_dict['ObjectBlock'],
+                                 np.object_)
         blocks.extend(object_blocks)
 
     if len(items_dict['SparseBlock']) > 0:
@@ -1890,6 +2054,34 @@ def _consolidate(blocks):
     return new_blocks
 
 
+def _pickle_values(values):
+    """
+    Return the values of a block to pickle, contiguous so that numpy pickles
+    them as an out-of-band buffer with pickle protocol 5
+    """
+    if (isinstance(values, np.ndarray) and
+            not (values.flags.c_contiguous or values.flags.f_contiguous)):
+        # numpy would copy them in-band anyway
+        values = np.ascontiguousarray(values)
+    return values
+
+
+def _split_blocks(blocks):
+    """
+    Return the blocks with the blocks holding several items split into a
+    block per item, viewing the values of the block
+    """
+    new_blocks = []
+    for blk in blocks:
+        if len(blk.mgr_locs) <= 1:
+            new_blocks.append(blk)
+            continue
+        for i, ml in enumerate(blk.mgr_locs):
+            new_blocks.append(blk.getitem_block(slice(i, i + 1),
+                                                new_mgr_locs=[ml]))
+    return new_blocks
+
+
 def _maybe_compare(a, b, op):
 
     is_a_array = isinstance(a, np.ndarray)
@@ -2036,4 +2228,6 @@ def concatenate_block_managers(mgrs_indexers, axes, concat_axis, copy):
                 placement=placement)
         blocks.append(b)
 
-    return BlockManager(blocks, axes)
+    if any(mgr._columnar for mgr, _ in mgrs_indexers):
+        return ColumnarBlockManager(blocks, axes)
+    return get_manager_class()(blocks, axes)
@@ -5,6 +5,8 @@ SQL-style merge routines
 import copy
 import warnings
 import string
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
 
 import numpy as np
 from pandas.compat import range, lzip, zip, map, filter
@@ -34,17 +36,21 @@ from pandas.core.dtypes.common import (
     ensure_int64,
     ensure_float64,
     ensure_object,
+    ensure_platform_int,
+    is_object_dtype,
     _get_dtype)
-from pandas.core.dtypes.missing import na_value_for_dtype
+from pandas.core.dtypes.missing import isna, na_value_for_dtype
 from pandas.core.internals import (items_overlap_with_suffix,
                                    concatenate_block_managers)
 from pandas.util._decorators import Appender, Substitution
 
 from pandas.core.sorting import is_int64_overflow_possible
+from pandas.core.util.hashing import hash_array, _combine_hash_arrays
 import pandas.core.algorithms as algos
 import pandas.core.sorting as sorting
 import pandas.core.common as com
-from pandas._libs import hashtable as libhashtable, join as libjoin, lib
+from pandas._libs import (hashtable as libhashtable, join as libjoin,
+                          algos as libalgos, lib)
 from pandas.errors import MergeError
 
 
@@ -53,12 +59,12 @@ from pandas.errors import MergeError
 def merge(left, right, how='inner', on=None, left_on=None, right_on=None,
           left_index=False, right_index=False, sort=False,
           suffixes=('_x', '_y'), copy=True, indicator=False,
-          validate=None):
+          validate=None, engine=None, n_jobs=None):
     op = _MergeOperation(left, right, how=how, on=on, left_on=left_on,
                          right_on=right_on, left_index=left_index,
                          right_index=right_index, sort=sort, suffixes=suffixes,
                          copy=copy, indicator=indicator,
-                         validate=validate)
+                         validate=validate, engine=engine, n_jobs=n_jobs)
     return op.get_result()
 
 
@@ -492,7 +498,7 @@ class _MergeOperation(object):
                  left_on=None, right_on=None, axis=1,
                  left_index=False, right_index=False, sort=True,
                  suffixes=('_x', '_y'), copy=True, indicator=False,
-                 validate=None):
+                 validate=None, engine=None, n_jobs=None):
         left = validate_operand(left)
         right = validate_operand(right)
         self.left = self.orig_left = left
@@ -512,6 +518,18 @@ class _MergeOperation(object):
         self.right_index = right_index
 
         self.indicator = indicator
+        self.validate = validate
+
+        if engine not in (None, 'partitioned'):
+            raise ValueError("engine must be None or 'partitioned', "
+                             "not {engine!r}".format(engine=engine))
+        if engine == 'partitioned':
+            if n_jobs is None:
+                n_jobs = cpu_count()
+            elif not is_integer(n_jobs) or n_jobs < 1:
+                raise ValueError('n_jobs must be a positive integer')
+        self.engine = engine
+        self.n_jobs = n_jobs
 
         if isinstance(self.indicator, compat.string_types):
             self.indicator_name = self.indicator
@@ -745,6 +763,29 @@ class _MergeOperation(object):
 
     def _get_join_indexers(self):
         """ return the join indexers """
+        if self.engine == 'partitioned':
+            return _get_partitioned_join_indexers(self.left_join_keys,
+                                                  self.right_join_keys,
+                                                  sort=self.sort,
+                                                  how=self.how,
+                                                  n_jobs=self.n_jobs)
+
+        if len(self.left_join_keys) == 1:
+            result = _get_monotonic_join_indexers(self.left_join_keys[0],
+                                                  self.right_join_keys[0],
+                                                  sort=self.sort,
+                                                  how=self.how)
+            if result is not None:
+                return result
+
+        if not self.sort and len(self.left_join_keys) == 1:
+            result = _get_hash_join_indexers(self.left_join_keys[0],
+                                             self.right_join_keys[0],
+                                             how=self.how,
+                                             validate=self.validate)
+            if result is not None:
+                return result
+
         return _get_join_indexers(self.left_join_keys,
                                   self.right_join_keys,
                                   sort=self.sort,
@@ -1143,6 +1184,289 @@ def _get_join_indexers(left_keys, right_keys, sort=False, how='inner',
     return join_func(lkey, rkey, count, **kwargs)
 
 
+def _get_monotonic_join_indexers(lk, rk, sort=False, how='inner'):
+    """
+    Join indexers for a single key sorted on both sides, without
+    factorizing.
+
+    The keys are merged in one linear pass by the ``*_join_indexer``
+    kernels used by ``Index._join_monotonic``. Those kernels require at
+    least one side to be unique. The result matches
+    ``_get_join_indexers``.
+
+    Parameters
+    ----------
+    lk : ndarray, Index, Series
+    rk : ndarray, Index, Series
+    sort : boolean, default False
+    how : string {'inner', 'outer', 'left', 'right'}, default 'inner'
+
+    Returns
+    -------
+    tuple of (left_indexer, right_indexer) or None
+        None when the keys are not eligible, in which case the caller
+        should fall back to the general path
+    """
+    if how in ('right', 'outer') and not sort:
+        # unsorted right/outer joins put the keys missing on the left
+        # after the others instead of in key order
+        return None
+
+    if is_categorical_dtype(lk) or is_categorical_dtype(rk):
+        return None
+
+    if is_datetime64tz_dtype(lk) and is_datetime64tz_dtype(rk):
+        lk = lk.values
+        rk = rk.values
+
+    lk = np.asarray(lk)
+    rk = np.asarray(rk)
+    if not is_dtype_equal(lk.dtype, rk.dtype):
+        return None
+
+    timelike = needs_i8_conversion(lk)
+    if timelike:
+        lk = lk.view('i8')
+        rk = rk.view('i8')
+
+    name = lk.dtype.name
+    if name not in ('int64', 'uint64', 'float64'):
+        return None
+
+    is_monotonic = getattr(libalgos, 'is_monotonic_{name}'.format(name=name))
+    linc, _, lunique = is_monotonic(lk, timelike)
+    if not linc:
+        return None
+    rinc, _, runique = is_monotonic(rk, timelike)
+    if not rinc or not (lunique or runique):
+        return None
+
+    if how == 'right':
+        join_func = getattr(libjoin, 'left_join_indexer_{name}'.format(
+            name=name))
+        _, right_indexer, left_indexer = join_func(rk, lk)
+    else:
+        join_func = getattr(libjoin, '{how}_join_indexer_{name}'.format(
+            how=how, name=name))
+        _, left_indexer, right_indexer = join_func(lk, rk)
+
+    return left_indexer, right_indexer
+
+
+def _get_hash_join_indexers(lk, rk, how='inner', validate=None):
+    """
+    Join indexers for a single key where one side is unique, without
+    factorizing both sides.
+
+    A hash table is built on the unique side and probed with the other
+    one, which replaces the factorization of both key arrays done by
+    ``_get_join_indexers``. The result matches ``_get_join_indexers``
+    with ``sort=False``.
+
+    Parameters
+    ----------
+    lk : ndarray, Index, Series
+    rk : ndarray, Index, Series
+    how : {'inner', 'left'}
+        other join types return None
+    validate : string, optional
+        the ``validate`` argument of the merge; a declared unique side
+        is used even when it is the larger one
+
+    Returns
+    -------
+    tuple of (left_indexer, right_indexer) or None
+        None when the keys are not eligible (unsupported dtype, no
+        unique side), in which case the caller should fall back to the
+        general path
+    """
+    if how not in ('inner', 'left'):
+        return None
+
+    if is_categorical_dtype(lk) or is_categorical_dtype(rk):
+        return None
+
+    if is_datetime64tz_dtype(lk) and is_datetime64tz_dtype(rk):
+        lk = lk.values
+        rk = rk.values
+
+    if is_int_or_datetime_dtype(lk) and is_int_or_datetime_dtype(rk):
+        klass = libhashtable.Int64HashTable
+        lk = ensure_int64(com.values_from_object(lk))
+        rk = ensure_int64(com.values_from_object(rk))
+    elif is_object_dtype(lk) and is_object_dtype(rk):
+        klass = libhashtable.PyObjectHashTable
+        lk = ensure_object(lk)
+        rk = ensure_object(rk)
+    else:
+        return None
+
+    # many-to-one: hash the right keys, probe with the left ones. A
+    # one-to-many inner join is the mirror image.
+    if how == 'inner' and validate in ('one_to_many', '1:m'):
+        build_left = True
+    elif validate in ('many_to_one', 'm:1'):
+        build_left = False
+    elif validate in ('one_to_one', '1:1'):
+        # both sides are unique, hash the smaller one
+        build_left = how == 'inner' and len(lk) < len(rk)
+    elif len(rk) <= len(lk):
+        # undeclared: only risk hashing the smaller side
+        build_left = False
+    else:
+        return None
+
+    build, probe = (lk, rk) if build_left else (rk, lk)
+
+    if klass is libhashtable.PyObjectHashTable and isna(build).any():
+        # nulls do not hash to a single entry in the object table
+        return None
+
+    table = klass(len(build))
+    table.map_locations(build)
+    if len(table) != len(build):
+        # build side is not unique
+        return None
+
+    locs = table.lookup(probe)
+
+    if how == 'left':
+        # each left row matches at most one right row, keep left order
+        return np.arange(len(lk), dtype=np.int64), locs
+
+    matched = np.flatnonzero(locs != -1).astype(np.int64)
+    locs = locs.take(matched)
+
+    if build_left:
+        # groups are the (unique) left rows, already in order of
+        # appearance; a stable sort on the left position is enough
+        sorter, _ = libalgos.groupsort_indexer(locs, len(lk))
+        sorter = ensure_platform_int(sorter)
+        return locs.take(sorter), matched.take(sorter)
+
+    # groups are the matched right rows; order them by first appearance
+    # in the left keys, as the factorization in _get_join_indexers does
+    sorter, counts = libalgos.groupsort_indexer(locs, len(rk))
+    counts = counts[1:]
+    present = np.flatnonzero(counts)
+    starts = (counts.cumsum() - counts).take(present)
+    first = matched.take(sorter.take(starts))
+
+    rank = np.empty(len(rk), dtype=np.int64)
+    rank[present.take(first.argsort())] = np.arange(len(present))
+
+    sorter, _ = libalgos.groupsort_indexer(rank.take(locs), len(present))
+    sorter = ensure_platform_int(sorter)
+    return matched.take(sorter), locs.take(sorter)
+
+
+def _hash_join_key(key):
+    """ hash a join key so that keys comparing equal hash equal """
+    if is_datetime64tz_dtype(key):
+        key = key.values
+    if is_float_dtype(key):
+        # -0.0 == 0.0 and every NaN joins with every other NaN
+        key = np.asarray(key) + 0.0
+        key[np.isnan(key)] = np.nan
+    return hash_array(np.asarray(key) if not is_categorical_dtype(key)
+                      else key)
+
+
+def _can_partition_join_keys(left_keys, right_keys):
+    """
+    Whether each pair of join keys hashes consistently, so that rows
+    with equal keys always land in the same partition
+    """
+    for lk, rk in zip(left_keys, right_keys):
+        if is_categorical_dtype(lk) and is_categorical_dtype(rk):
+            lk, rk = lk.categories, rk.categories
+        if not is_dtype_equal(lk.dtype, rk.dtype):
+            return False
+        if is_object_dtype(lk):
+            # mixed objects are hashed through their string repr
+            for k in (lk, rk):
+                inferred = lib.infer_dtype(k, skipna=True)
+                if inferred not in ('string', 'unicode', 'bytes', 'empty'):
+                    return False
+        elif not (is_numeric_dtype(lk) or is_bool_dtype(lk) or
+                  needs_i8_conversion(lk)):
+            return False
+    return True
+
+
+def _get_partitioned_join_indexers(left_keys, right_keys, sort=False,
+                                   how='inner', n_jobs=1):
+    """
+    Join indexers computed on hash partitions of the keys in a thread pool
+
+    Both sides are split into ``n_jobs`` partitions by the hash of their
+    join keys, so matching rows always share a partition, and each
+    partition pair is joined with ``_get_join_indexers``. Sorted joins
+    are computed by ``_get_join_indexers`` on the full keys, as sorting
+    the joined partitions costs about as much as the serial join.
+
+    Parameters
+    ----------
+    left_keys: ndarray, Index, Series
+    right_keys: ndarray, Index, Series
+    sort: boolean, default False
+    how: string {'inner', 'outer', 'left', 'right'}, default 'inner'
+    n_jobs: int, default 1
+        number of partitions, joined concurrently when greater than one
+
+    Returns
+    -------
+    tuple of (left_indexer, right_indexer)
+        indexers into the left_keys, right_keys; left joins are ordered
+        like the left keys and right joins like the right keys
+    """
+    if (sort or n_jobs == 1 or
+            not _can_partition_join_keys(left_keys, right_keys)):
+        return _get_join_indexers(left_keys, right_keys, sort=sort, how=how)
+
+    def partition(keys):
+        hashed = _combine_hash_arrays((_hash_join_key(k) for k in keys),
+                                      len(keys))
+        labels = ensure_int64(hashed % np.uint64(n_jobs))
+        sorter, counts = libalgos.groupsort_indexer(labels, n_jobs)
+        bounds = counts[1:].cumsum()
+        return np.split(sorter, bounds[:-1])
+
+    lparts = partition(left_keys)
+    rparts = partition(right_keys)
+
+    def join_partition(i):
+        lpos, rpos = lparts[i], rparts[i]
+        lidx, ridx = _get_join_indexers([k.take(lpos) for k in left_keys],
+                                        [k.take(rpos) for k in right_keys],
+                                        sort=False, how=how)
+        # back to positions in the full keys, keeping -1 for no match
+        return (algos.take_1d(lpos, lidx, fill_value=-1),
+                algos.take_1d(rpos, ridx, fill_value=-1))
+
+    pool = ThreadPool(n_jobs)
+    try:
+        results = pool.map(join_partition, range(n_jobs))
+    finally:
+        pool.close()
+        pool.join()
+
+    left_indexer = np.concatenate([lidx for lidx, _ in results])
+    right_indexer = np.concatenate([ridx for _, ridx in results])
+
+    if how == 'left':
+        sorter, _ = libalgos.groupsort_indexer(left_indexer,
+                                               len(left_keys[0]))
+    elif how == 'right':
+        sorter, _ = libalgos.groupsort_indexer(right_indexer,
+                                               len(right_keys[0]))
+    else:
+        return left_indexer, right_indexer
+
+    sorter = ensure_platform_int(sorter)
+    return left_indexer.take(sorter), right_indexer.take(sorter)
+
+
 class _OrderedMerge(_MergeOperation):
     _merge_type = 'ordered_merge'
 
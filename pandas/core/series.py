@@ -951,6 +951,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
             self._maybe_update_cacher()
 
     def _set_with_engine(self, key, value):
+        self._data._block._copy_if_referenced()
         values = self._values
         try:
             self.index._engine.set_value(values, key, value)
@@ -1081,6 +1082,7 @@ class Series(base.IndexOpsMixin, generic.NDFrame):
         return self._set_value(label, value, takeable=takeable)
 
     def _set_value(self, label, value, takeable=False):
+        self._data._block._copy_if_referenced()
         try:
             if takeable:
                 self._values[label] = value
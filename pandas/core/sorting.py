@@ -6,12 +6,17 @@ from pandas.core.dtypes.common import (
     ensure_platform_int,
     ensure_int64,
     is_list_like,
-    is_categorical_dtype)
+    is_bool_dtype,
+    is_int64_dtype,
+    is_integer_dtype,
+    is_categorical_dtype,
+    needs_i8_conversion)
 from pandas.core.dtypes.cast import infer_dtype_from_array
 from pandas.core.dtypes.missing import isna
 import pandas.core.algorithms as algorithms
 from pandas._libs import lib, algos, hashtable
 from pandas._libs.hashtable import unique_label_indices
+from pandas._libs.tslibs import iNaT
 
 
 _INT64_MAX = np.iinfo(np.int64).max
@@ -196,6 +201,14 @@ def lexsort_indexer(keys, orders=None, na_position='last'):
     elif orders is None:
         orders = [True] * len(keys)
 
+    if na_position not in ['last', 'first']:
+        raise ValueError('invalid na_position: {!r}'.format(na_position))
+
+    # integer-like and categorical keys are radix sorted
+    passes = _get_radix_passes(keys, orders, na_position)
+    if passes is not None:
+        return _radix_sort_indexer(passes, len(keys[0]) if keys else 0)
+
     for key, order in zip(keys, orders):
 
         # we are already a Categorical
@@ -206,25 +219,8 @@ def lexsort_indexer(keys, orders=None, na_position='last'):
         else:
             c = Categorical(key, ordered=True)
 
-        if na_position not in ['last', 'first']:
-            raise ValueError('invalid na_position: {!r}'.format(na_position))
-
         n = len(c.categories)
-        codes = c.codes.copy()
-
-        mask = (c.codes == -1)
-        if order:  # ascending
-            if na_position == 'last':
-                codes = np.where(mask, n, codes)
-            elif na_position == 'first':
-                codes += 1
-        else:  # not order means descending
-            if na_position == 'last':
-                codes = np.where(mask, n, n - codes - 1)
-            elif na_position == 'first':
-                codes = np.where(mask, 0, n - codes)
-        if mask.any():
-            n += 1
+        codes, n = _order_codes(c.codes, n, order, na_position)
 
         shape.append(n)
         labels.append(codes)
@@ -232,6 +228,123 @@ def lexsort_indexer(keys, orders=None, na_position='last'):
     return indexer_from_factorized(labels, shape)
 
 
+def _order_codes(codes, n, order, na_position):
+    """
+    Turn codes in ``range(n)``, with -1 for missing values, into
+    non-negative codes ordered by ``order`` and ``na_position``
+    """
+    mask = (codes == -1)
+    if order:  # ascending
+        if na_position == 'last':
+            codes = np.where(mask, n, codes)
+        elif na_position == 'first':
+            codes = codes + 1
+    else:  # not order means descending
+        if na_position == 'last':
+            codes = np.where(mask, n, n - codes - 1)
+        elif na_position == 'first':
+            codes = np.where(mask, 0, n - codes)
+    if mask.any():
+        n += 1
+    return codes, n
+
+
+# bits per counting sort pass of _radix_sort_indexer
+_RADIX_BITS = 16
+
+
+def _get_radix_passes(keys, orders, na_position):
+    """
+    Counting sort passes sorting by ``keys``, most significant first.
+
+    Categorical keys need a single pass over their codes. Integer,
+    boolean and datetimelike keys are offset by their minimum and take
+    a single pass when their range is below ``max(len(key), 2 ** 16)``,
+    otherwise one pass per 16 bits of the range. A pass placing the
+    NaTs comes first.
+
+    Returns
+    -------
+    list of (values, shift, size) or None
+        ``shift`` is None when ``values`` already are codes in
+        ``range(size)``, else the bit offset of the digit to sort by;
+        None if any key is of another type
+    """
+    passes = []
+    for key, order in zip(keys, orders):
+        if is_categorical_dtype(key):
+            codes, n = _order_codes(ensure_int64(key.codes),
+                                    len(key.categories), order, na_position)
+            passes.append((codes, None, n))
+            continue
+
+        values = getattr(key, 'values', key)
+        if not isinstance(values, np.ndarray) or values.ndim != 1:
+            return None
+        if needs_i8_conversion(values):
+            values = values.view('i8')
+            mask = values == iNaT
+        elif is_bool_dtype(values) or (is_integer_dtype(values) and
+                                       values.dtype.itemsize < 8):
+            values = values.astype(np.int64)
+            mask = None
+        elif is_int64_dtype(values):
+            mask = None
+        else:
+            return None
+
+        if mask is not None and not mask.any():
+            mask = None
+        valid = values if mask is None else values[~mask]
+        if not len(valid):
+            # all missing (or empty), the key does not reorder anything
+            continue
+
+        # offsets from the minimum, computed modulo 2 ** 64 as the range
+        # of an int64 may not fit in an int64
+        vmin = valid.min()
+        span = int(valid.max()) - int(vmin)
+        offsets = values.view('u8') - np.array(vmin).view('u8')
+        if not order:
+            offsets = np.uint64(span) - offsets
+        if mask is not None:
+            offsets[mask] = 0
+            placement = mask if na_position == 'last' else ~mask
+            passes.append((placement.view('i1'), None, 2))
+
+        if span < max(len(values), 1 << _RADIX_BITS):
+            passes.append((offsets.view('i8'), None, span + 1))
+        else:
+            shift = (span.bit_length() - 1) // _RADIX_BITS * _RADIX_BITS
+            while shift >= 0:
+                size = min((span >> shift) + 1, 1 << _RADIX_BITS)
+                passes.append((offsets, shift, size))
+                shift -= _RADIX_BITS
+
+    return passes
+
+
+def _radix_sort_indexer(passes, n):
+    """
+    LSD radix sort of ``n`` rows: one stable counting sort per pass,
+    least significant first, each applied to the order found by the
+    previous ones.
+    """
+    indexer = None
+    digit = np.uint64((1 << _RADIX_BITS) - 1)
+    for values, shift, size in reversed(passes):
+        if indexer is not None:
+            values = values.take(indexer)
+        if shift is not None:
+            values = (values >> np.uint64(shift)) & digit
+        sorter, _ = algos.groupsort_indexer(ensure_int64(values), size)
+        indexer = sorter if indexer is None else indexer.take(sorter)
+
+    if indexer is None:
+        indexer = np.arange(n)
+    return ensure_platform_int(indexer)
+
+
 def nargsort(items, kind='quicksort', ascending=True, na_position='last'):
     """
     This is intended to be a drop-in replacement for np.argsort which
@@ -488,3 +601,291 @@ def safe_sort(values, labels=None, na_sentinel=-1, assume_unique=False):
     np.putmask(new_labels, mask, na_sentinel)
 
     return ordered, ensure_platform_int(new_labels)
+
+
+# fan-in of each k-way merge pass of external_sort_values; every run
+# holds one piece in memory while merging
+_EXTERNAL_SORT_FANIN = 16
+
+
+def external_sort_values(chunks, by, ascending=True, na_position='last',
+                         memory_limit=2 ** 28, tmpdir=None):
+    """
+    Sort a stream of DataFrames by columns without holding it in memory.
+
+    The chunks are buffered up to ``memory_limit`` bytes, each buffer is
+    sorted and spilled to a temporary file as a sorted run, and the runs
+    are merged back with a k-way merge. Runs are merged at most
+    16 at a time, so any number of them can be merged in bounded memory.
+
+    .. versionadded:: 0.24.0
+
+    Parameters
+    ----------
+    chunks : DataFrame or iterable of DataFrames
+        The data to sort, e.g. the ``TextFileReader`` returned by
+        ``read_csv(..., chunksize=...)``. All chunks must have the same
+        columns.
+    by : str or list of str
+        Name or list of names of the columns to sort by.
+    ascending : bool or list of bool, default True
+        Sort ascending vs. descending. Specify list for multiple sort
+        orders.
+    na_position : {'first', 'last'}, default 'last'
+        Put NaNs at the beginning or at the end.
+    memory_limit : int, default 256MB
+        Approximate number of bytes of data, as reported by
+        ``DataFrame.memory_usage(deep=True)``, to sort in memory at once.
+        Sorting a buffer needs roughly twice that amount.
+    tmpdir : str, optional
+        Directory for the temporary files, the system default is used if
+        None. The files are removed once the result is exhausted or
+        closed.
+
+    Returns
+    -------
+    iterator of DataFrames
+        The sorted rows, in DataFrames of varying length. Rows with
+        equal keys keep their input order.
+
+    Examples
+    --------
+    >>> reader = pd.read_csv('events.csv', chunksize=10 ** 6)
+    >>> with pd.HDFStore('sorted.h5') as store:
+    ...     for chunk in pd.external_sort_values(reader, 'timestamp'):
+    ...         store.append('events', chunk)  # doctest: +SKIP
+
+    See Also
+    --------
+    DataFrame.sort_values
+    """
+    from pandas.core.frame import DataFrame
+
+    if not is_list_like(by):
+        by = [by]
+    by = list(by)
+    if is_list_like(ascending):
+        ascending = list(ascending)
+        if len(ascending) != len(by):
+            raise ValueError('Length of ascending (%d) != length of by (%d)' %
+                             (len(ascending), len(by)))
+    else:
+        ascending = [ascending] * len(by)
+    if na_position not in ['last', 'first']:
+        raise ValueError('invalid na_position: {!r}'.format(na_position))
+    if memory_limit <= 0:
+        raise ValueError('memory_limit must be positive')
+
+    if isinstance(chunks, DataFrame):
+        chunks = [chunks]
+
+    return _external_sort(iter(chunks), by, ascending, na_position,
+                          memory_limit, tmpdir)
+
+
+def _external_sort(chunks, by, ascending, na_position, memory_limit,
+                   tmpdir):
+    import os
+    import shutil
+    import tempfile
+
+    piece_bytes = max(memory_limit // (2 * _EXTERNAL_SORT_FANIN), 1)
+
+    def buffers():
+        buffered, nbytes = [], 0
+        for chunk in chunks:
+            buffered.append(chunk)
+            nbytes += chunk.memory_usage(index=True, deep=True).sum()
+            if nbytes >= memory_limit:
+                yield buffered
+                buffered, nbytes = [], 0
+        if buffered:
+            yield buffered
+
+    buffered = buffers()
+    first = next(buffered, None)
+    if first is None:
+        return
+    second = next(buffered, None)
+    if second is None:
+        # fits in memory, nothing to spill
+        yield _sort_frame(_concat_frames(first), by, ascending,
+                          na_position)
+        return
+
+    path = tempfile.mkdtemp(prefix='pandas-sort-', dir=tmpdir)
+    try:
+        runs = []
+
+        def spill(chunk_list):
+            frame = _sort_frame(_concat_frames(chunk_list), by,
+                                ascending, na_position)
+            name = os.path.join(path, 'run-{n}'.format(n=len(runs)))
+            runs.append(_write_run(name, [frame], piece_bytes))
+
+        spill(first)
+        first = None
+        spill(second)
+        second = None
+        for chunk_list in buffered:
+            spill(chunk_list)
+
+        # merge passes until a single merge can produce the result
+        npass = 0
+        while len(runs) > _EXTERNAL_SORT_FANIN:
+            merged = []
+            for i in range(0, len(runs), _EXTERNAL_SORT_FANIN):
+                group = runs[i:i + _EXTERNAL_SORT_FANIN]
+                name = os.path.join(path, 'merge-{p}-{n}'.format(
+                    p=npass, n=len(merged)))
+                merged.append(_write_run(
+                    name, _merge_runs(group, by, ascending, na_position),
+                    piece_bytes))
+                for run in group:
+                    os.remove(run)
+            runs = merged
+            npass += 1
+
+        for frame in _merge_runs(runs, by, ascending, na_position):
+            yield frame
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _concat_frames(frames):
+    if len(frames) == 1:
+        return frames[0]
+    from pandas.core.reshape.concat import concat
+    return concat(frames)
+
+
+def _write_run(path, frames, piece_bytes):
+    """ spill sorted frames to ``path`` as a sequence of small pickles """
+    from pandas.compat import cPickle as pkl
+
+    with open(path, 'wb') as fh:
+        for frame in frames:
+            if not len(frame):
+                continue
+            nbytes = frame.memory_usage(index=True, deep=True).sum()
+            step = max(int(len(frame) * piece_bytes // max(nbytes, 1)), 1)
+            for start in range(0, len(frame), step):
+                pkl.dump(frame.iloc[start:start + step], fh,
+                         protocol=pkl.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path):
+    from pandas.compat import cPickle as pkl
+
+    with open(path, 'rb') as fh:
+        while True:
+            try:
+                yield pkl.load(fh)
+            except EOFError:
+                break
+
+
+def _merge_runs(runs, by, ascending, na_position):
+    """
+    k-way merge of sorted runs, yielding sorted DataFrames
+
+    Every run keeps one piece of rows in memory. Of the runs with pieces
+    left on disk, the one whose loaded rows end with the smallest row bounds
+    what can be output: the loaded rows sorting before that row, and those
+    equal to it from the runs before it, are final. These prefixes are
+    found by comparing with that row, so every row is only sorted once,
+    when it is output, and ties keep the run order, i.e. the input order.
+    """
+    readers = [_read_run(run) for run in runs]
+    buffers = [None] * len(runs)
+    is_open = [True] * len(runs)
+
+    while True:
+        # runs whose loaded rows are used up load their next piece
+        for i, reader in enumerate(readers):
+            while is_open[i] and (buffers[i] is None or not len(buffers[i])):
+                buffers[i] = next(reader, None)
+                if buffers[i] is None:
+                    is_open[i] = False
+
+        active = [i for i, buf in enumerate(buffers)
+                  if buf is not None and len(buf)]
+        if not active:
+            break
+
+        bounded = [i for i in active if is_open[i]]
+        if not bounded:
+            yield _sort_frame(_concat_frames([buffers[i] for i in active]),
+                              by, ascending, na_position)
+            break
+
+        # the stable sort picks the first run among equal last rows
+        tails = _concat_frames([buffers[i].iloc[-1:] for i in bounded])
+        bound = bounded[lexsort_indexer([tails[k].values for k in by],
+                                        orders=ascending,
+                                        na_position=na_position)[0]]
+        row = [buffers[bound][k].values[-1] for k in by]
+
+        heads = []
+        for i in active:
+            buf = buffers[i]
+            if i == bound:
+                n = len(buf)
+            else:
+                cmp = _compare_with_row(buf, row, by, ascending,
+                                        na_position)
+                n = int((cmp <= 0).sum() if i < bound else (cmp < 0).sum())
+            heads.append(buf.iloc[:n])
+            buffers[i] = buf.iloc[n:]
+
+        yield _sort_frame(_concat_frames(heads), by, ascending, na_position)
+
+
+def _sort_frame(frame, by, ascending, na_position):
+    indexer = lexsort_indexer([frame[k].values for k in by],
+                              orders=ascending, na_position=na_position)
+    return frame.take(indexer)
+
+
+def _compare_with_row(frame, row, by, ascending, na_position):
+    """
+    -1, 0 or 1 for every row of ``frame`` sorting before, like or after
+    ``row``, the values of the ``by`` columns of a row, in the order of
+    ``lexsort_indexer``
+    """
+    result = np.zeros(len(frame), dtype=np.int8)
+    undecided = np.ones(len(frame), dtype=bool)
+    for key, target, order in zip(by, row, ascending):
+        cmp = _compare_with_value(frame[key].values, target, order,
+                                  na_position)
+        decided = undecided & (cmp != 0)
+        result[decided] = cmp[decided]
+        undecided &= cmp == 0
+    return result
+
+
+def _compare_with_value(values, target, ascending, na_position):
+    target_na = isna(target)
+    if is_categorical_dtype(values):
+        # categoricals sort in the order of their categories
+        mask = values.codes == -1
+        if not target_na:
+            target = values.categories.get_loc(target)
+        values = values.codes
+    else:
+        values = np.asarray(values)
+        mask = isna(values)
+
+    result = np.zeros(len(values), dtype=np.int8)
+    if target_na:
+        result[~mask] = 1 if na_position == 'first' else -1
+        return result
+
+    valid = ~mask
+    valid_values = values[valid]
+    cmp = np.where(valid_values < target, -1,
+                   np.where(valid_values > target, 1, 0))
+    result[valid] = cmp if ascending else -cmp
+    result[mask] = 1 if na_position == 'last' else -1
+    return result
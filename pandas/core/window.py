@@ -26,16 +26,20 @@ from pandas.core.dtypes.common import (
     is_integer_dtype,
     needs_i8_conversion,
     is_timedelta64_dtype,
+    is_datetime64_any_dtype,
     is_list_like,
     ensure_float64,
+    ensure_int64,
     is_scalar)
 
 from pandas.core.base import PandasObject, SelectionMixin
 from pandas.core.groupby.base import GroupByMixin
 import pandas.core.common as com
 import pandas._libs.window as _window
+from pandas._libs.tslibs import Timedelta
 
 from pandas import compat
+from pandas.core.config import get_option
 from pandas.compat.numpy import function as nv
 from pandas.util._decorators import (Substitution, Appender,
                                      cache_readonly)
@@ -57,11 +61,83 @@ pandas.DataFrame.%(name)s
 """
 
 
+class BaseIndexer(object):
+    """
+    Base class to define the windows of a custom rolling window.
+
+    Sub-classes implement ``get_window_bounds``, returning the start
+    (including) and end (not including) offset of each window. An instance
+    is passed as the ``window`` of :meth:`DataFrame.rolling`, and the
+    windows are aggregated by the same cython routines as fixed and offset
+    based windows.
+
+    .. versionadded:: 0.24.0
+
+    Parameters
+    ----------
+    index_array : ndarray, optional
+        values the windows may be computed from, e.g. the index as i8
+    window_size : int, default 0
+        size of the windows, for indexers that have one
+    **kwargs
+        set as attributes of the indexer, for use in ``get_window_bounds``
+
+    Examples
+    --------
+    >>> class ForwardIndexer(pd.api.indexers.BaseIndexer):
+    ...     def get_window_bounds(self, num_values=0, min_periods=None,
+    ...                           center=None, closed=None):
+    ...         start = np.arange(num_values, dtype='int64')
+    ...         end = np.minimum(start + self.window_size, num_values)
+    ...         return start, end
+    >>> df = pd.DataFrame({'B': [0, 1, 2, np.nan, 4]})
+    >>> df.rolling(ForwardIndexer(window_size=2)).sum()
+         B
+    0  1.0
+    1  3.0
+    2  2.0
+    3  4.0
+    4  4.0
+    """
+
+    def __init__(self, index_array=None, window_size=0, **kwargs):
+        self.index_array = index_array
+        self.window_size = window_size
+        self.__dict__.update(kwargs)
+
+    def get_window_bounds(self, num_values=0, min_periods=None, center=None,
+                          closed=None):
+        """
+        Compute the bounds of the windows.
+
+        Parameters
+        ----------
+        num_values : int, default 0
+            number of values the windows are rolled over
+        min_periods : int, default None
+            min_periods passed to rolling
+        center : boolean, default None
+            center passed to rolling
+        closed : string, default None
+            closed passed to rolling
+
+        Returns
+        -------
+        tuple of (start, end) ndarrays of int64, both monotonic
+        increasing, the i-th window being ``values[start[i]:end[i]]``
+        """
+        raise NotImplementedError
+
+
 class _Window(PandasObject, SelectionMixin):
     _attributes = ['window', 'min_periods', 'center', 'win_type',
                    'axis', 'on', 'closed']
     exclusions = set()
 
+    # precomputed bounds of the windows, overriding the ones derived
+    # from the window and the index
+    _window_bounds = None
+
     def __init__(self, obj, window=None, min_periods=None,
                  center=False, win_type=None, axis=0, on=None, closed=None,
                  **kwargs):
@@ -194,12 +270,40 @@ class _Window(PandasObject, SelectionMixin):
         tuple of (index, index_as_ndarray)
         """
 
+        if self._window_bounds is not None:
+            return index, self._window_bounds
+        if isinstance(self.window, BaseIndexer):
+            return index, self._get_indexer_bounds()
         if self.is_freq_type:
             if index is None:
                 index = self._on
             return index, index.asi8
         return index, index
 
+    def _get_indexer_bounds(self):
+        """
+        Return the validated WindowBounds of a BaseIndexer window
+        """
+        num_values = self._selected_obj.shape[self.axis]
+        start, end = self.window.get_window_bounds(
+            num_values=num_values, min_periods=self.min_periods,
+            center=self.center, closed=self.closed)
+        start, end = ensure_int64(start), ensure_int64(end)
+
+        if len(start) != num_values or len(end) != num_values:
+            raise ValueError("get_window_bounds must return a start and an "
+                             "end of length {0}".format(num_values))
+        if num_values:
+            if (start < 0).any() or (end > num_values).any():
+                raise ValueError("window bounds must be between 0 and "
+                                 "{0}".format(num_values))
+            if (start > end).any():
+                raise ValueError("window start must be <= its end")
+            if (np.diff(start) < 0).any() or (np.diff(end) < 0).any():
+                raise ValueError("window bounds must be monotonic "
+                                 "increasing")
+        return _window.WindowBounds(start, end)
+
     def _prep_values(self, values=None, kill_inf=True):
 
         if values is None:
@@ -451,7 +555,7 @@ class Window(_Window):
 
     Parameters
     ----------
-    window : int, or offset
+    window : int, offset, or BaseIndexer subclass
         Size of the moving window. This is the number of observations used for
         calculating the statistic. Each window will be a fixed size.
 
@@ -459,10 +563,13 @@ class Window(_Window):
         window will be a variable sized based on the observations included in
         the time-period. This is only valid for datetimelike indexes. This is
         new in 0.19.0
+
+        If a BaseIndexer subclass is passed, the window boundaries are
+        computed by its ``get_window_bounds`` method. This is new in 0.24.0
     min_periods : int, default None
         Minimum number of observations in window required to have a value
-        (otherwise result is NA). For a window that is specified by an offset,
-        this will default to 1.
+        (otherwise result is NA). For a window that is specified by an offset
+        or a BaseIndexer subclass, this will default to 1.
     center : boolean, default False
         Set the labels at the center of the window.
     win_type : string, default None
@@ -786,12 +893,96 @@ class _GroupByMixin(GroupByMixin):
     corr = GroupByMixin._dispatch('corr', other=None, pairwise=None)
     cov = GroupByMixin._dispatch('cov', other=None, pairwise=None)
 
+    def _quantiles(self, quantiles, interpolation='linear', **kwargs):
+        # each group computes all of the quantiles in one pass
+        return self._apply(None, 'quantile', quantile=quantiles,
+                           interpolation=interpolation, **kwargs)
+
+    # methods whose kernels accept arbitrary window bounds, so that
+    # all of the groups can be computed in a single pass
+    _grouped_methods = frozenset(['sum', 'mean', 'var', 'std',
+                                  'skew', 'kurt'])
+
+    def _get_grouped_bounds(self, roller, offsets):
+        """
+        sub-classes to define
+        return the window bounds over the data sorted by group, or None
+        if the windows can not be computed this way
+
+        Parameters
+        ----------
+        roller : window object over the sorted data
+        offsets : ndarray of int64
+            start of each group in the sorted data, followed by its length
+        """
+        return None
+
+    def _apply_grouped(self, name, **kwargs):
+        """
+        perform the function call on all of the groups at once: the data
+        is sorted by group, and rolled with window bounds that do not cross
+        the group boundaries
+
+        Returns None if this is not possible, in which case each group
+        is computed on its own
+        """
+        from pandas import MultiIndex
+        from pandas.core.groupby.groupby import _group_selection_context
+        from pandas.core.sorting import get_group_index_sorter
+
+        groupby = self._groupby
+        if (name not in self._grouped_methods or self.axis != 0 or
+                groupby.axis != 0 or not groupby.as_index or
+                not groupby.group_keys):
+            return None
+
+        ids, _, ngroups = groupby.grouper.group_info
+        counts = np.bincount(ids[ids != -1], minlength=ngroups)
+        if not counts.sum():
+            return None
+
+        # rows with a missing key are sorted first and are in no group
+        sorter = get_group_index_sorter(ids, ngroups)
+        sorter = sorter[len(ids) - counts.sum():]
+        offsets = ensure_int64(np.concatenate([[0], counts.cumsum()]))
+
+        def roll(obj):
+            roller = self._shallow_copy(obj.take(sorter), center=False)
+            bounds = self._get_grouped_bounds(roller, offsets)
+            if bounds is None:
+                return None
+            roller._window_bounds = bounds
+            return getattr(roller, name)(**kwargs)
+
+        try:
+            result = roll(groupby._selected_obj)
+        except Exception:
+            # as groupby.apply, try again excluding the grouping columns
+            with _group_selection_context(groupby):
+                result = roll(groupby._selected_obj)
+
+        if result is None:
+            return None
+
+        # the group keys followed by the original index, as concatenating
+        # the result of each group would give
+        keys = groupby.grouper.result_index.take(ids.take(sorter))
+        index = result.index
+        arrays = ([keys.get_level_values(i) for i in range(keys.nlevels)] +
+                  [index.get_level_values(i) for i in range(index.nlevels)])
+        result.index = MultiIndex.from_arrays(
+            arrays, names=list(groupby.grouper.names) + list(index.names))
+        return result
+
     def _apply(self, func, name, window=None, center=None,
                check_minp=None, **kwargs):
         """
         dispatch to apply; we are stripping all of the _apply kwargs and
         performing the original function call on the grouped object
         """
+        result = self._apply_grouped(name, **kwargs)
+        if result is not None:
+            return result
 
         def f(x, name=name, *args):
             x = self._shallow_copy(x)
@@ -839,6 +1030,18 @@ class _Rolling(_Window):
 
         blocks, obj, index = self._create_blocks()
         index, indexi = self._get_index(index=index)
+
+        # windows with precomputed bounds are already centered
+        if isinstance(indexi, _window.WindowBounds):
+            center = False
+
+        # cython functions also come as kernels rolling all the rows of a
+        # 2D array in one call, and release the GIL so that blocks can be
+        # split across threads
+        is_cython = isinstance(func, compat.string_types)
+        func2d = getattr(_window, func + '_2d', None) if is_cython else None
+        nthreads = get_option('compute.rolling_threads')
+
         results = []
         for b in blocks:
             values = self._prep_values(b.values)
@@ -876,8 +1079,24 @@ class _Rolling(_Window):
                     return func(x, window, min_periods=self.min_periods,
                                 closed=self.closed)
 
+            def calc2d(x):
+                minp = check_minp(self.min_periods, window)
+                if center:
+                    nans = np.empty((len(x), offset))
+                    nans.fill(np.NaN)
+                    x = np.concatenate((x, nans), axis=1)
+                return func2d(x, window, minp, indexi, self.closed, **kwargs)
+
+            def calc_rows(x):
+                return np.vstack([calc(row) for row in x])
+
             with np.errstate(all='ignore'):
-                if values.ndim > 1:
+                if values.ndim > 1 and func2d is not None:
+                    result = _apply_rows(calc2d, values, self.axis, nthreads)
+                elif values.ndim > 1 and is_cython and nthreads > 1:
+                    result = _apply_rows(calc_rows, values, self.axis,
+                                         nthreads)
+                elif values.ndim > 1:
                     result = np.apply_along_axis(calc, self.axis, values)
                 else:
                     result = calc(values)
@@ -978,8 +1197,11 @@ class _Rolling_and_Expanding(_Rolling):
         # TODO: _level is unused?
         _level = kwargs.pop('_level', None)  # noqa
         window = self._get_window()
-        offset = _offset(window, self.center)
         index, indexi = self._get_index()
+        if isinstance(indexi, _window.WindowBounds):
+            offset = 0
+        else:
+            offset = _offset(window, self.center)
 
         # TODO: default is for backward compat
         # change to False in the future
@@ -1276,8 +1498,13 @@ class _Rolling_and_Expanding(_Rolling):
 
     Parameters
     ----------
-    quantile : float
-        Quantile to compute. 0 <= quantile <= 1.
+    quantile : float or array-like
+        Quantile to compute. 0 <= quantile <= 1. If array-like, all of
+        the quantiles are computed in a single pass over the data, and a
+        DataFrame with a column per quantile (per column of the caller)
+        is returned.
+
+        .. versionchanged:: 0.24.0
     interpolation : {'linear', 'lower', 'higher', 'midpoint', 'nearest'}
         .. versionadded:: 0.23.0
 
@@ -1317,6 +1544,13 @@ class _Rolling_and_Expanding(_Rolling):
     3    3.5
     dtype: float64
 
+    >>> s.rolling(2).quantile([.25, .75])
+       0.25  0.75
+    0   NaN   NaN
+    1  1.25  1.75
+    2  2.25  2.75
+    3  3.25  3.75
+
     See Also
     --------
     pandas.Series.quantile : Computes value at the given quantile over all data
@@ -1326,6 +1560,9 @@ class _Rolling_and_Expanding(_Rolling):
     """)
 
     def quantile(self, quantile, interpolation='linear', **kwargs):
+        if is_list_like(quantile):
+            return self._quantiles(quantile, interpolation, **kwargs)
+
         window = self._get_window()
         index, indexi = self._get_index()
 
@@ -1345,6 +1582,68 @@ class _Rolling_and_Expanding(_Rolling):
         return self._apply(f, 'quantile', quantile=quantile,
                            **kwargs)
 
+    def _quantiles(self, quantiles, interpolation='linear', **kwargs):
+        """
+        compute several quantiles with one skiplist per column, rather
+        than a skiplist per column and quantile
+
+        Returns
+        -------
+        DataFrame
+            with a column for each quantile, or for each (column, quantile)
+            pair in the case of DataFrame inputs
+        """
+        from pandas import DataFrame, MultiIndex, Index
+
+        if self.axis != 0:
+            raise NotImplementedError("multiple quantiles are only "
+                                      "implemented along the rows")
+
+        quantiles = ensure_float64(np.asarray(quantiles))
+        window = self._get_window()
+        minp = _use_window(self.min_periods, window)
+
+        _, obj, index = self._create_blocks()
+        index, indexi = self._get_index(index=index)
+
+        # windows with precomputed bounds are already centered
+        center = self.center and not isinstance(indexi, _window.WindowBounds)
+        offset = _offset(window, center)
+
+        def calc(x):
+            x = ensure_float64(x)
+            if center:
+                x = np.concatenate((x, np.array([np.NaN] * offset)))
+            with np.errstate(all='ignore'):
+                result = _window.roll_quantiles(x, window, minp, indexi,
+                                                self.closed, quantiles,
+                                                interpolation)
+            if center:
+                result = self._center_window(result, window)
+            return result
+
+        if obj.ndim == 1:
+            result = calc(self._prep_values(obj.values))
+            return DataFrame(result, index=obj.index,
+                             columns=Index(quantiles, name=obj.name))
+
+        if not len(obj.columns):
+            return DataFrame(index=obj.index)
+
+        # the quantiles of the column at position i go to the columns at
+        # positions [i * nq, (i + 1) * nq), which is right for duplicate
+        # column labels too
+        nq = len(quantiles)
+        result = np.empty((len(obj), len(obj.columns) * nq))
+        for blk in obj._data.blocks:
+            values = self._prep_values(blk.values)
+            values = values.reshape(len(blk.mgr_locs), -1)
+            for i, loc in enumerate(blk.mgr_locs.as_array):
+                result[:, loc * nq:(loc + 1) * nq] = calc(values[i])
+
+        columns = MultiIndex.from_product([obj.columns, quantiles])
+        return DataFrame(result, index=obj.index, columns=columns)
+
     _shared_docs['cov'] = dedent("""
     %(name)s sample covariance
 
@@ -1373,6 +1672,8 @@ class _Rolling_and_Expanding(_Rolling):
         # GH 16058: offset window
         if self.is_freq_type:
             window = self.win_freq
+        elif isinstance(self.window, BaseIndexer):
+            window = self.window
         else:
             window = self._get_window(other)
 
@@ -1388,8 +1689,12 @@ class _Rolling_and_Expanding(_Rolling):
             bias_adj = count / (count - ddof)
             return (mean(X * Y) - mean(X) * mean(Y)) * bias_adj
 
+        def _get_cov_pairwise(X, Y):
+            return self._roll_pairwise(X, Y, window, ddof=ddof)
+
         return _flex_binary_moment(self._selected_obj, other._selected_obj,
-                                   _get_cov, pairwise=bool(pairwise))
+                                   _get_cov, pairwise=bool(pairwise),
+                                   f2d=self._pairwise_func(_get_cov_pairwise))
 
     _shared_docs['corr'] = dedent("""
     Calculate %(name)s correlation.
@@ -1506,7 +1811,10 @@ class _Rolling_and_Expanding(_Rolling):
             # only default unset
             pairwise = True if pairwise is None else pairwise
         other = self._shallow_copy(other)
-        window = self._get_window(other)
+        if isinstance(self.window, BaseIndexer):
+            window = self.window
+        else:
+            window = self._get_window(other)
 
         def _get_corr(a, b):
             a = a.rolling(window=window, min_periods=self.min_periods,
@@ -1516,8 +1824,72 @@ class _Rolling_and_Expanding(_Rolling):
 
             return a.cov(b, **kwargs) / (a.std(**kwargs) * b.std(**kwargs))
 
+        def _get_corr_pairwise(X, Y):
+            return self._roll_pairwise(X, Y, window, corr=True)
+
         return _flex_binary_moment(self._selected_obj, other._selected_obj,
-                                   _get_corr, pairwise=bool(pairwise))
+                                   _get_corr, pairwise=bool(pairwise),
+                                   f2d=self._pairwise_func(_get_corr_pairwise))
+
+    def _pairwise_func(self, func):
+        """
+        return func if the pairwise moments can be computed on the 2d
+        values of the objects by _roll_pairwise, else None
+        """
+        if self.axis != 0 or self.on is not None:
+            return None
+        return func
+
+    def _roll_pairwise(self, X, Y, window, ddof=1, corr=False, upper=False):
+        """
+        rolling covariance, or correlation, of every column of X with
+        every column of Y in a single pass
+
+        Parameters
+        ----------
+        X, Y : 2d float64 ndarrays with the same number of rows
+        window : the window used by the Series moments
+        ddof : int, default 1
+        corr : bool, default False
+        upper : bool, default False
+            if X is Y, only compute the upper triangle result[t, j, i] with
+            j <= i and leave the other pairs NaN
+
+        Returns
+        -------
+        3d ndarray of shape (rows, Y columns, X columns)
+        """
+        if self.is_freq_type or isinstance(window, BaseIndexer):
+            window = self._get_window()
+        minp = _use_window(self.min_periods, window)
+        index, indexi = self._get_index()
+
+        # the kernel only skips NaN, so make +/-inf NaN as for the Series
+        same = X is Y
+        X = self._prep_values(X)
+        Y = X if same else self._prep_values(Y)
+
+        # windows with precomputed bounds are already centered
+        center = self.center and not isinstance(indexi, _window.WindowBounds)
+        if center:
+            offset = _offset(window, center)
+            nans = np.empty((offset, X.shape[1]))
+            nans.fill(np.NaN)
+            X = np.concatenate((X, nans))
+            if same:
+                Y = X
+            else:
+                nans = np.empty((offset, Y.shape[1]))
+                nans.fill(np.NaN)
+                Y = np.concatenate((Y, nans))
+
+        with np.errstate(all='ignore'):
+            result = _window.roll_cov_pairwise(X, Y, window, minp, indexi,
+                                               self.closed, ddof=ddof,
+                                               corr=corr, upper=upper)
+        if center:
+            result = self._center_window(result, window)
+        return result
 
 
 class Rolling(_Rolling_and_Expanding):
@@ -1546,8 +1918,15 @@ class Rolling(_Rolling_and_Expanding):
     def validate(self):
         super(Rolling, self).validate()
 
+        # we allow custom window bounds
+        if isinstance(self.window, BaseIndexer):
+
+            # min_periods must be an integer
+            if self.min_periods is None:
+                self.min_periods = 1
+
         # we allow rolling on a datetimelike index
-        if ((self.obj.empty or self.is_datetimelike) and
+        elif ((self.obj.empty or self.is_datetimelike) and
                 isinstance(self.window, (compat.string_types, ABCDateOffset,
                                          timedelta))):
 
@@ -1574,10 +1953,18 @@ class Rolling(_Rolling_and_Expanding):
         elif self.window < 0:
             raise ValueError("window must be non-negative")
 
-        if not self.is_datetimelike and self.closed is not None:
+        if (not self.is_datetimelike and self.closed is not None and
+                not isinstance(self.window, BaseIndexer)):
             raise ValueError("closed only implemented for datetimelike "
                              "and offset based windows")
 
+    def _get_window(self, other=None):
+        if isinstance(self.window, BaseIndexer):
+            # the windows of an indexer span at most the whole object
+            obj = self._selected_obj
+            return max(obj.shape[self.axis], self.min_periods)
+        return super(Rolling, self)._get_window(other)
+
     def _validate_monotonic(self):
         """ validate on is monotonic """
         if not self._on.is_monotonic:
@@ -1661,8 +2048,8 @@ class Rolling(_Rolling_and_Expanding):
     @Appender(_shared_docs['count'])
     def count(self):
 
-        # different impl for freq counting
-        if self.is_freq_type:
+        # different impl for freq counting and custom windows
+        if self.is_freq_type or isinstance(self.window, BaseIndexer):
             return self._apply('roll_count', 'count')
 
         return super(Rolling, self).count()
@@ -1772,6 +2159,35 @@ class Rolling(_Rolling_and_Expanding):
         return super(Rolling, self).corr(other=other, pairwise=pairwise,
                                          **kwargs)
 
+    def online(self, func, **kwargs):
+        """
+        Return an OnlineRolling of ``func``, with the window state of the
+        rows of this object, to be updated with the rows appended to it
+
+        .. versionadded:: 0.24.0
+
+        Parameters
+        ----------
+        func : {'sum', 'mean', 'var', 'std', 'median'}
+        **kwargs
+            passed to OnlineRolling, e.g. ``ddof``
+
+        Returns
+        -------
+        OnlineRolling
+        """
+        if (not is_integer(self.window) or self.is_freq_type or
+                self.center or self.on is not None or self.axis != 0):
+            raise NotImplementedError("online is only implemented for fixed "
+                                      "windows along the rows which are "
+                                      "not centered")
+        online = OnlineRolling(self.window, func,
+                               min_periods=self.min_periods, **kwargs)
+
+        # only the last window is part of the state
+        online.update(self._selected_obj.iloc[-self.window:])
+        return online
+
 
 class RollingGroupby(_GroupByMixin, Rolling):
     """
@@ -1803,6 +2219,16 @@ class RollingGroupby(_GroupByMixin, Rolling):
         """
         pass
 
+    def _get_grouped_bounds(self, roller, offsets):
+        if isinstance(roller.window, BaseIndexer):
+            return None
+        if roller.is_freq_type:
+            return _window.grouped_window_bounds(
+                offsets, roller.window, roller._on.asi8, roller.closed)
+        return _window.grouped_window_bounds(
+            offsets, roller.window,
+            center_offset=_offset(roller.window, self.center))
+
 
 class Expanding(_Rolling_and_Expanding):
     """
@@ -2043,6 +2469,12 @@ class ExpandingGroupby(_GroupByMixin, Expanding):
     def _constructor(self):
         return Expanding
 
+    def _get_grouped_bounds(self, roller, offsets):
+        # the windows of each group are as long as the group itself
+        if self.center or self.min_periods is None:
+            return None
+        return _window.grouped_window_bounds(offsets, roller._get_window())
+
 
 _bias_template = """
 
@@ -2084,9 +2516,12 @@ class EWM(_Rolling):
     span : float, optional
         Specify decay in terms of span,
         :math:`\alpha = 2 / (span + 1),\text{ for } span \geq 1`
-    halflife : float, optional
+    halflife : float, str or timedelta, optional
         Specify decay in terms of half-life,
         :math:`\alpha = 1 - exp(log(0.5) / halflife),\text{ for } halflife > 0`
+
+        If ``times`` is specified, the time span (str or timedelta) over
+        which an observation decays to half of its weight.
     alpha : float, optional
         Specify smoothing factor :math:`\alpha` directly,
         :math:`0 < \alpha \leq 1`
@@ -2102,6 +2537,17 @@ class EWM(_Rolling):
     ignore_na : boolean, default False
         Ignore missing values when calculating weights;
         specify True to reproduce pre-0.15.0 behavior
+    axis : int or string, default 0
+    times : str, array-like or DatetimeIndex, optional
+        The times of the observations, or the name of the column of the
+        DataFrame holding them, which must be monotonically increasing
+        and of datetime64 dtype. The weights of the observations then
+        decay with the time elapsed between them, according to the
+        ``halflife``, so that irregularly spaced observations do not have
+        to be resampled first. ``ignore_na`` has no effect, and ``adjust``
+        must be True, with ``times``.
+
+        .. versionadded:: 0.24.0
 
     Returns
     -------
@@ -2126,6 +2572,19 @@ class EWM(_Rolling):
     3  1.615385
     4  3.670213
 
+    Specifying ``times`` with a timedelta ``halflife`` weights the
+    observations by the time elapsed between them.
+
+    >>> times = ['2020-01-01', '2020-01-03', '2020-01-10', '2020-01-15',
+    ...          '2020-01-17']
+    >>> df.ewm(halflife='4 days', times=pd.DatetimeIndex(times)).mean()
+              B
+    0  0.000000
+    1  0.585786
+    2  1.523889
+    3  1.523889
+    4  3.233686
+
     Notes
     -----
     Exactly one of center of mass, span, half-life, and alpha must be provided.
@@ -2158,19 +2617,89 @@ class EWM(_Rolling):
     rolling : Provides rolling window calculations
     expanding : Provides expanding transformations.
     """
-    _attributes = ['com', 'min_periods', 'adjust', 'ignore_na', 'axis']
+    _attributes = ['com', 'halflife', 'min_periods', 'adjust', 'ignore_na',
+                   'axis', 'times']
 
     def __init__(self, obj, com=None, span=None, halflife=None, alpha=None,
                  min_periods=0, adjust=True, ignore_na=False,
-                 axis=0):
+                 axis=0, times=None):
         self.obj = obj
-        self.com = _get_center_of_mass(com, span, halflife, alpha)
         self.min_periods = min_periods
         self.adjust = adjust
         self.ignore_na = ignore_na
         self.axis = axis
         self.on = None
 
+        if times is not None:
+            if isinstance(times, compat.string_types):
+                # the column of the times is left out of the calculations,
+                # as the 'on' column of rolling
+                self.on = times
+            self.times = times
+            self._times = self._validate_times(times, halflife)
+            if com is not None or span is not None or alpha is not None:
+                raise ValueError("com, span, and alpha can not be used "
+                                 "with times")
+            if not adjust:
+                raise NotImplementedError("times is not supported with "
+                                          "adjust=False")
+            self.com = None
+            self.halflife = halflife
+
+            # the kernels decay by 1/2 for each elapsed halflife, which
+            # is a center of mass of 1
+            self._com = 1.
+            self._deltas = (np.diff(self._times.asi8) /
+                            float(Timedelta(halflife).value))
+        else:
+            if isinstance(halflife, (compat.string_types, timedelta,
+                                     np.timedelta64)):
+                raise ValueError("halflife can only be a timedelta "
+                                 "convertible argument if times is not None")
+            self.times = None
+            self.com = _get_center_of_mass(com, span, halflife, alpha)
+            self.halflife = None
+            self._com = self.com
+            self._deltas = None
+
+    @property
+    def _on(self):
+        if self.on is None:
+            return self.obj.index
+        from pandas import Index
+        return Index(self.obj[self.on])
+
+    def _validate_times(self, times, halflife):
+        """ validate & return the times as a DatetimeIndex """
+        from pandas import DatetimeIndex
+
+        if isinstance(times, compat.string_types):
+            if not isinstance(self.obj, ABCDataFrame):
+                raise ValueError("times can only be a column name for "
+                                 "DataFrames")
+            times = self.obj[times]
+        if self.axis != 0:
+            raise NotImplementedError("times is only implemented along "
+                                      "the rows")
+        if not is_datetime64_any_dtype(times):
+            raise ValueError("times must be datetime64[ns] dtype")
+        if len(times) != len(self.obj):
+            raise ValueError("times must be the same length as the object")
+
+        times = DatetimeIndex(times)
+        if times.hasnans:
+            raise ValueError("times can not contain NaT")
+        if not times.is_monotonic_increasing:
+            raise ValueError("times must be monotonically increasing")
+
+        if not isinstance(halflife, (compat.string_types, timedelta,
+                                     np.timedelta64)):
+            raise ValueError("halflife must be a string or timedelta "
+                             "when times is specified")
+        if Timedelta(halflife).value <= 0:
+            raise ValueError("halflife must satisfy: halflife > 0")
+        return times
+
     @property
     def _constructor(self):
         return EWM
@@ -2256,8 +2785,9 @@ class EWM(_Rolling):
                                      "in _window.{0}".format(func))
 
                 def func(arg):
-                    return cfunc(arg, self.com, int(self.adjust),
-                                 int(self.ignore_na), int(self.min_periods))
+                    return cfunc(arg, self._com, int(self.adjust),
+                                 int(self.ignore_na), int(self.min_periods),
+                                 deltas=self._deltas)
 
             results.append(np.apply_along_axis(func, self.axis, values))
 
@@ -2288,9 +2818,9 @@ class EWM(_Rolling):
         nv.validate_window_func('var', args, kwargs)
 
         def f(arg):
-            return _window.ewmcov(arg, arg, self.com, int(self.adjust),
+            return _window.ewmcov(arg, arg, self._com, int(self.adjust),
                                   int(self.ignore_na), int(self.min_periods),
-                                  int(bias))
+                                  int(bias), deltas=self._deltas)
 
         return self._apply(f, **kwargs)
 
@@ -2308,9 +2838,10 @@ class EWM(_Rolling):
         def _get_cov(X, Y):
             X = self._shallow_copy(X)
             Y = self._shallow_copy(Y)
-            cov = _window.ewmcov(X._prep_values(), Y._prep_values(), self.com,
-                                 int(self.adjust), int(self.ignore_na),
-                                 int(self.min_periods), int(bias))
+            cov = _window.ewmcov(X._prep_values(), Y._prep_values(),
+                                 self._com, int(self.adjust),
+                                 int(self.ignore_na), int(self.min_periods),
+                                 int(bias), deltas=self._deltas)
             return X._wrap_result(cov)
 
         return _flex_binary_moment(self._selected_obj, other._selected_obj,
@@ -2332,10 +2863,10 @@ class EWM(_Rolling):
             Y = self._shallow_copy(Y)
 
             def _cov(x, y):
-                return _window.ewmcov(x, y, self.com, int(self.adjust),
+                return _window.ewmcov(x, y, self._com, int(self.adjust),
                                       int(self.ignore_na),
                                       int(self.min_periods),
-                                      1)
+                                      1, deltas=self._deltas)
 
             x_values = X._prep_values()
             y_values = Y._prep_values()
@@ -2349,10 +2880,234 @@ class EWM(_Rolling):
         return _flex_binary_moment(self._selected_obj, other._selected_obj,
                                    _get_corr, pairwise=bool(pairwise))
 
+    def online(self):
+        """
+        Return an OnlineEWM of the mean, with the state of the rows of this
+        object, to be updated with the rows appended to it
+
+        .. versionadded:: 0.24.0
+
+        Returns
+        -------
+        OnlineEWM
+        """
+        if self.axis != 0 or self.times is not None:
+            raise NotImplementedError("online is only implemented "
+                                      "along the rows, without times")
+        online = OnlineEWM(com=self.com, min_periods=self.min_periods,
+                           adjust=self.adjust, ignore_na=self.ignore_na)
+        online.update(self._selected_obj)
+        return online
+
+
+class _OnlineWindow(object):
+    """
+    Base class of the window aggregations which are updated with the rows
+    appended to an object, keeping the state of the cython kernels between
+    the updates
+    """
+
+    def __init__(self):
+        self._states = None
+        self._columns = None
+
+    def _make_state(self):
+        raise com.AbstractMethodError(self)
+
+    def _finalize(self, result):
+        return result
+
+    def _prep_values(self, values):
+        if needs_i8_conversion(values.dtype):
+            raise NotImplementedError("ops for {action} for this "
+                                      "dtype {dtype} are not "
+                                      "implemented".format(
+                                          action=type(self).__name__,
+                                          dtype=values.dtype))
+        try:
+            values = ensure_float64(values).copy()
+        except (ValueError, TypeError):
+            raise TypeError("cannot handle this type -> {0}"
+                            "".format(values.dtype))
+
+        values[np.isinf(values)] = np.NaN
+        return values
+
+    def _update(self, state, values):
+        return self._finalize(state.update(self._prep_values(values)))
+
+    def update(self, obj):
+        """
+        Add the rows of ``obj`` to the windows
+
+        Parameters
+        ----------
+        obj : Series or DataFrame
+            the rows appended to the object, with the same columns for
+            every update
+
+        Returns
+        -------
+        same type as input, the aggregation of the windows ending at each
+        of its rows
+        """
+        from pandas import Series, DataFrame
+
+        if isinstance(obj, ABCSeries):
+            columns = None
+        elif isinstance(obj, ABCDataFrame):
+            columns = obj.columns
+        else:
+            raise TypeError('invalid type: %s' % type(obj))
+
+        if self._states is None:
+            self._columns = columns
+            nstates = 1 if columns is None else len(columns)
+            self._states = [self._make_state() for _ in range(nstates)]
+        elif ((columns is None) != (self._columns is None) or
+              columns is not None and not columns.equals(self._columns)):
+            raise ValueError("the updates must have the same columns "
+                             "as the first one")
+
+        if columns is None:
+            result = self._update(self._states[0], obj.values)
+            return Series(result, index=obj.index, name=obj.name)
+
+        result = np.empty(obj.shape, dtype=float)
+        for i, state in enumerate(self._states):
+            result[:, i] = self._update(state, obj.iloc[:, i].values)
+        return DataFrame(result, index=obj.index, columns=columns)
+
+
+class OnlineRolling(_OnlineWindow):
+    """
+    Rolling aggregation over a fixed window, updated with the rows
+    appended to an object.
+
+    The state of the window (its observations, and the running sums, the
+    moments or the skiplist of the aggregation) is kept between updates,
+    so that each update costs O(rows added) instead of a computation over
+    the whole object. The object can be pickled to save the state.
+
+    .. versionadded:: 0.24.0
+
+    Parameters
+    ----------
+    window : int
+        Size of the moving window.
+    func : {'sum', 'mean', 'var', 'std', 'median'}
+        The aggregation of the windows.
+    min_periods : int, default None
+        Minimum number of observations in window required to have a value
+        (otherwise result is NA), defaults to the window size.
+    ddof : int, default 1
+        Delta Degrees of Freedom of 'var' and 'std'.
+
+    Examples
+    --------
+    >>> s = pd.Series(np.arange(10.))
+    >>> online = s.rolling(3).online('mean')
+    >>> online.update(pd.Series([10., 11.], index=[10, 11]))
+    10     9.0
+    11    10.0
+    dtype: float64
+
+    See Also
+    --------
+    Rolling.online : OnlineRolling seeded with the rows of an object
+    """
+
+    _funcs = ['sum', 'mean', 'var', 'std', 'median']
+
+    def __init__(self, window, func, min_periods=None, ddof=1):
+        super(OnlineRolling, self).__init__()
+        if not is_integer(window) or window <= 0:
+            raise ValueError("window must be a positive integer")
+        if func not in self._funcs:
+            raise ValueError("func must be one of "
+                             "{0}".format(', '.join(self._funcs)))
+        if min_periods is not None and not is_integer(min_periods):
+            raise ValueError("min_periods must be an integer")
+
+        self.window = window
+        self.func = func
+        self.min_periods = min_periods
+        self.ddof = ddof
+
+    def __repr__(self):
+        return "{klass} [window={window},func={func}]".format(
+            klass=type(self).__name__, window=self.window, func=self.func)
+
+    def _make_state(self):
+        if self.func in ['var', 'std']:
+            minp = _require_min_periods(1)(self.min_periods, self.window)
+            return _window.RollingState(self.window, minp, 'var', self.ddof)
+        minp = _use_window(self.min_periods, self.window)
+        return _window.RollingState(self.window, minp, self.func)
+
+    def _finalize(self, result):
+        if self.func == 'std':
+            return _zsqrt(result)
+        return result
+
+
+class OnlineEWM(_OnlineWindow):
+    """
+    Exponentially weighted moving average, updated with the rows appended
+    to an object.
+
+    The running average and weights are kept between updates, so that each
+    update costs O(rows added) instead of a computation over the whole
+    object. The object can be pickled to save the state.
+
+    .. versionadded:: 0.24.0
+
+    Parameters
+    ----------
+    com, span, halflife, alpha, min_periods, adjust, ignore_na
+        As for :meth:`DataFrame.ewm`.
+
+    Examples
+    --------
+    >>> s = pd.Series([1., 2., 3.])
+    >>> online = s.ewm(alpha=0.5, adjust=False).online()
+    >>> online.update(pd.Series([4.], index=[3]))
+    3    3.125
+    dtype: float64
+
+    See Also
+    --------
+    EWM.online : OnlineEWM seeded with the rows of an object
+    """
+
+    def __init__(self, com=None, span=None, halflife=None, alpha=None,
+                 min_periods=0, adjust=True, ignore_na=False):
+        super(OnlineEWM, self).__init__()
+        self.com = _get_center_of_mass(com, span, halflife, alpha)
+        self.min_periods = min_periods
+        self.adjust = adjust
+        self.ignore_na = ignore_na
+
+    def __repr__(self):
+        return "{klass} [com={com}]".format(klass=type(self).__name__,
+                                            com=self.com)
+
+    def _make_state(self):
+        return _window.EWMAState(self.com, int(self.adjust),
+                                 int(self.ignore_na), int(self.min_periods))
+
+
 # Helper Funcs
 
 
-def _flex_binary_moment(arg1, arg2, f, pairwise=False):
+def _flex_binary_moment(arg1, arg2, f, pairwise=False, f2d=None):
+    """
+    apply the binary moment function f to the columns of arg1 and arg2
+
+    f2d, if given, computes the pairwise moments of all of the columns of
+    two 2d float arrays at once, returning a 3d array of shape (rows,
+    arg2 columns, arg1 columns)
+    """
 
     if not (isinstance(arg1, (np.ndarray, ABCSeries, ABCDataFrame)) and
             isinstance(arg2, (np.ndarray, ABCSeries, ABCDataFrame))):
@@ -2399,20 +3154,38 @@ def _flex_binary_moment(arg1, arg2, f, pairwise=False):
                     return DataFrame(results, index=X.index,
                                      columns=res_columns)
             elif pairwise is True:
-                results = defaultdict(dict)
-                for i, k1 in enumerate(arg1.columns):
-                    for j, k2 in enumerate(arg2.columns):
-                        if j < i and arg2 is arg1:
-                            # Symmetric case
-                            results[i][j] = results[j][i]
-                        else:
-                            results[i][j] = f(*_prep_binary(arg1.iloc[:, i],
-                                                            arg2.iloc[:, j]))
-
                 from pandas import MultiIndex, concat
 
                 result_index = arg1.index.union(arg2.index)
-                if len(result_index):
+                if (f2d is not None and len(result_index) and
+                        arg1.index.equals(arg2.index) and
+                        arg2.columns.nlevels == 1):
+
+                    # all of the pairs in a single pass, as a (rows,
+                    # arg2 columns, arg1 columns) array which reshapes
+                    # to the frame without copying
+                    X = np.ascontiguousarray(arg1.astype('float64').values)
+                    Y = X
+                    if arg2 is not arg1:
+                        Y = np.ascontiguousarray(
+                            arg2.astype('float64').values)
+                    values = f2d(X, Y)
+                    result = DataFrame(
+                        values.reshape(-1, values.shape[2]),
+                        index=MultiIndex.from_product([result_index,
+                                                      arg2.columns]),
+                        columns=arg1.columns)
+
+                elif len(result_index):
+                    results = defaultdict(dict)
+                    for i, k1 in enumerate(arg1.columns):
+                        for j, k2 in enumerate(arg2.columns):
+                            if j < i and arg2 is arg1:
+                                # Symmetric case
+                                results[i][j] = results[j][i]
+                            else:
+                                results[i][j] = f(*_prep_binary(
+                                    arg1.iloc[:, i], arg2.iloc[:, j]))
 
                     # construct result frame
                     result = concat(
@@ -2496,6 +3269,27 @@ def _get_center_of_mass(comass, span, halflife, alpha):
     return float(comass)
 
 
+def _apply_rows(func, values, axis, nthreads=1):
+    """
+    Apply ``func`` to a 2D array holding one series per row, on
+    ``nthreads`` chunks of rows of ``values`` (one series per column if
+    ``axis`` is 0) in the thread pool shared by these calls.
+
+    ``func`` must map an (n, N) array to an (n, M) array and release the
+    GIL for the chunks to run concurrently.
+    """
+    arr = np.ascontiguousarray(values.T if axis == 0 else values)
+
+    nchunks = min(nthreads, len(arr))
+    if nchunks > 1:
+        chunks = np.array_split(arr, nchunks)
+        result = np.vstack(com.get_thread_pool(nthreads).map(func, chunks))
+    else:
+        result = func(arr)
+
+    return result.T if axis == 0 else result
+
+
 def _offset(window, center):
     if not is_integer(window):
         window = len(window)
@@ -302,6 +302,14 @@ memory_map : boolean, default False
     If a filepath is provided for `filepath_or_buffer`, map the file object
     directly onto memory and access the data directly from there. Using this
     option can improve performance because there is no longer any I/O overhead.
+nthreads : int, default 1
+    Number of threads used to convert the tokenized columns to their final
+    dtypes. The numeric conversions release the GIL, so values greater than
+    1 can considerably speed up parsing of wide files with many numeric
+    columns. Tokenization itself remains single-threaded.
+    (Only valid with C parser)
+
+    .. versionadded:: 0.24.0
 
 Returns
 -------
@@ -522,7 +530,8 @@ _c_parser_defaults = {
     'error_bad_lines': True,
     'warn_bad_lines': True,
     'tupleize_cols': False,
-    'float_precision': None
+    'float_precision': None,
+    'nthreads': 1
 }
 
 _fwf_defaults = {
@@ -534,6 +543,7 @@ _c_unsupported = {'skipfooter'}
 _python_unsupported = {
     'low_memory',
     'float_precision',
+    'nthreads',
 }
 
 _deprecated_defaults = {
@@ -617,7 +627,8 @@ def _make_parser_function(name, default_sep=','):
                  delim_whitespace=False,
                  low_memory=_c_parser_defaults['low_memory'],
                  memory_map=False,
-                 float_precision=None):
+                 float_precision=None,
+                 nthreads=1):
 
         # deprecate read_table GH21948
         if name == "read_table":
@@ -690,6 +701,7 @@ def _make_parser_function(name, default_sep=','):
                     squeeze=squeeze,
                     memory_map=memory_map,
                     float_precision=float_precision,
+                    nthreads=nthreads,
 
                     na_filter=na_filter,
                     delim_whitespace=delim_whitespace,
@@ -1812,6 +1824,12 @@ class CParserWrapper(ParserBase):
         except:
             pass
 
+    def __del__(self):
+        # stop the conversion threads of a reader which was not closed
+        reader = getattr(self, '_reader', None)
+        if reader is not None:
+            reader.close_pool()
+
     def _set_noconvert_columns(self):
         """
         Set the columns that should not undergo dtype conversions.
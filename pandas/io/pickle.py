@@ -5,7 +5,7 @@ import numpy as np
 from numpy.lib.format import read_array, write_array
 from pandas.compat import BytesIO, cPickle as pkl, pickle_compat as pc, PY3
 from pandas.core.dtypes.common import is_datetime64_dtype, _NS_DTYPE
-from pandas.io.common import _get_handle, _stringify_path
+from pandas.io.common import _get_handle, _stringify_path, BytesZipFile
 
 
 def to_pickle(obj, path, compression='infer', protocol=pkl.HIGHEST_PROTOCOL):
@@ -28,9 +28,10 @@ def to_pickle(obj, path, compression='infer', protocol=pkl.HIGHEST_PROTOCOL):
         default HIGHEST_PROTOCOL (see [1], paragraph 12.1.2). The possible
         values for this parameter depend on the version of Python. For Python
         2.x, possible values are 0, 1, 2. For Python>=3.0, 3 is a valid value.
-        For Python >= 3.4, 4 is a valid value. A negative value for the
-        protocol parameter is equivalent to setting its value to
-        HIGHEST_PROTOCOL.
+        For Python >= 3.4, 4 is a valid value. For Python >= 3.8, 5 is a
+        valid value, with which the data of the arrays is written without
+        intermediate copies. A negative value for the protocol parameter is
+        equivalent to setting its value to HIGHEST_PROTOCOL.
 
         .. [1] https://docs.python.org/3/library/pickle.html
         .. versionadded:: 0.21.0
@@ -73,7 +74,14 @@ def to_pickle(obj, path, compression='infer', protocol=pkl.HIGHEST_PROTOCOL):
     if protocol < 0:
         protocol = pkl.HIGHEST_PROTOCOL
     try:
-        f.write(pkl.dumps(obj, protocol=protocol))
+        if isinstance(f, BytesZipFile):
+            # each write is a member of the archive
+            f.write(pkl.dumps(obj, protocol=protocol))
+        else:
+            # write to the file directly, with protocol 5 the buffers of the
+            # arrays are written without first copying them into a bytes
+            # object
+            pkl.dump(obj, f, protocol=protocol)
     finally:
         for _f in fh:
             _f.close()
@@ -0,0 +1,186 @@
+""" DataFrames in shared memory, for zero-copy hand-off between processes """
+
+import os
+import tempfile
+
+import numpy as np
+
+from pandas.core.index import (Int64Index, UInt64Index, Float64Index,
+                               DatetimeIndex, TimedeltaIndex)
+from pandas.io.common import _stringify_path
+
+# offsets of the arrays in the mapped file are aligned to this many bytes
+_ALIGNMENT = 64
+
+# the index types whose values are placed in shared memory, the other ones
+# are pickled with the handle
+_SHARED_INDEX_TYPES = (Int64Index, UInt64Index, Float64Index, DatetimeIndex,
+                       TimedeltaIndex)
+
+
+def _default_dir():
+    # a tmpfs keeps the mapped pages in memory only
+    if os.path.isdir('/dev/shm'):
+        return '/dev/shm'
+    return None
+
+
+def _can_share(values):
+    return isinstance(values, np.ndarray) and values.dtype.kind in 'biufcmM'
+
+
+class SharedMemoryHandle(object):
+    """
+    Picklable description of a DataFrame placed in shared memory by
+    :meth:`DataFrame.to_shared_memory`
+
+    Pass it to another process, e.g. as an argument of a ``multiprocessing``
+    task, and reconstruct the DataFrame there with
+    :meth:`DataFrame.from_shared_memory`. Pickling the handle only copies
+    the data that could not be placed in shared memory.
+
+    Attributes
+    ----------
+    path : str or None
+        The memory-mapped file holding the data, None if nothing is shared.
+    """
+
+    def __init__(self, path, blocks, axes):
+        self.path = path
+        self.blocks = blocks
+        self.axes = axes
+
+    def __repr__(self):
+        return '{klass}(path={path!r})'.format(klass=type(self).__name__,
+                                                path=self.path)
+
+    def unlink(self):
+        """
+        Remove the memory-mapped file.
+
+        The DataFrames already reconstructed from the handle keep their data,
+        which is released when the last of them is garbage collected.
+        """
+        if self.path is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _plan(arrays):
+    """ return the aligned offsets of the arrays and the total size """
+    offsets = []
+    size = 0
+    for values in arrays:
+        if values is None:
+            offsets.append(None)
+            continue
+        size += -size % _ALIGNMENT
+        offsets.append(size)
+        size += values.nbytes
+    return offsets, size
+
+
+def to_shared_memory(df, path=None):
+    """
+    Place the values of the blocks and the index arrays of a DataFrame in a
+    memory-mapped file.
+
+    Parameters
+    ----------
+    df : DataFrame
+    path : str, optional
+        The file to create, by default a new temporary file, in ``/dev/shm``
+        where available.
+
+    Returns
+    -------
+    SharedMemoryHandle
+    """
+    mgr = df._data
+    blocks = [(blk.values if _can_share(blk.values) else None, blk)
+              for blk in mgr.blocks]
+    axes = [(ax.values if type(ax) in _SHARED_INDEX_TYPES and
+             _can_share(ax.values) else None, ax)
+            for ax in mgr.axes]
+
+    offsets, size = _plan([values for values, _ in blocks + axes])
+
+    if size:
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix='pandas-', suffix='.shm',
+                                        dir=_default_dir())
+            os.close(fd)
+        path = _stringify_path(path)
+        mm = np.memmap(path, dtype=np.uint8, mode='w+', shape=(size,))
+        for (values, _), offset in zip(blocks + axes, offsets):
+            if values is not None:
+                dest = np.ndarray(values.shape, dtype=values.dtype,
+                                  buffer=mm, offset=offset)
+                dest[...] = values
+        mm.flush()
+        del mm
+    else:
+        path = None
+
+    block_specs = []
+    for (values, blk), offset in zip(blocks, offsets):
+        placement = blk.mgr_locs.as_array
+        if values is None:
+            # pickled with the handle, a snapshot like the shared values
+            block_specs.append((placement, blk.values.copy(), None))
+        else:
+            block_specs.append((placement, (values.dtype.str, values.shape),
+                                offset))
+
+    axis_specs = []
+    for (values, ax), offset in zip(axes, offsets[len(blocks):]):
+        if values is None:
+            axis_specs.append((ax, None))
+        else:
+            # an empty index carries the type and attributes of the axis
+            axis_specs.append((ax[:0], (values.dtype.str, values.shape,
+                                        offset)))
+
+    return SharedMemoryHandle(path, block_specs, axis_specs)
+
+
+def from_shared_memory(handle):
+    """
+    Reconstruct a DataFrame from a SharedMemoryHandle without copying the
+    data in shared memory.
+
+    The arrays of the DataFrame map the file read-only: setting values in
+    them raises.
+
+    Parameters
+    ----------
+    handle : SharedMemoryHandle
+
+    Returns
+    -------
+    DataFrame
+    """
+    from pandas import DataFrame
+    from pandas.core.internals import BlockManager, make_block
+
+    mm = None
+    if handle.path is not None:
+        mm = np.memmap(handle.path, dtype=np.uint8, mode='r')
+
+    def view(dtype, shape, offset):
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=mm,
+                          offset=offset)
+
+    axes = []
+    for ax, spec in handle.axes:
+        if spec is not None:
+            ax = ax._shallow_copy(view(*spec))
+        axes.append(ax)
+
+    blocks = []
+    for placement, values, offset in handle.blocks:
+        if offset is not None:
+            values = view(values[0], values[1], offset)
+        blocks.append(make_block(values, placement=placement,
+                                 ndim=len(axes)))
+
+    return DataFrame(BlockManager(blocks, axes))
@@ -44,7 +44,8 @@ class TestPDApi(Base):
     classes = ['Categorical', 'CategoricalIndex', 'DataFrame', 'DateOffset',
                'DatetimeIndex', 'ExcelFile', 'ExcelWriter', 'Float64Index',
                'Grouper', 'HDFStore', 'Index', 'Int64Index', 'MultiIndex',
-               'Period', 'PeriodIndex', 'RangeIndex', 'UInt64Index',
+               'Period', 'PeriodIndex', 'PreparedGrouper', 'RangeIndex',
+               'UInt64Index',
                'Series', 'SparseArray', 'SparseDataFrame',
                'SparseSeries', 'Timedelta',
                'TimedeltaIndex', 'Timestamp', 'Interval', 'IntervalIndex']
@@ -61,7 +62,7 @@ class TestPDApi(Base):
     # top-level functions
     funcs = ['bdate_range', 'concat', 'crosstab', 'cut',
              'date_range', 'interval_range', 'eval',
-             'factorize', 'get_dummies',
+             'external_sort_values', 'factorize', 'get_dummies',
              'infer_freq', 'isna', 'isnull', 'lreshape',
              'melt', 'notna', 'notnull', 'offsets',
              'merge', 'merge_ordered', 'merge_asof',
@@ -109,7 +110,7 @@ class TestPDApi(Base):
 
 class TestApi(Base):
 
-    allowed = ['types', 'extensions']
+    allowed = ['types', 'extensions', 'indexers']
 
     def test_api(self):
 
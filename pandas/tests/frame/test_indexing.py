@@ -1743,6 +1743,38 @@ class TestDataFrameIndexing(TestData):
         with tm.assert_raises_regex(ValueError, 'same size'):
             self.frame.lookup(['a', 'b', 'c'], ['a'])
 
+    def test_lookup_mixed_dtypes(self):
+        df = DataFrame({'i': [1, 2, 3], 'f': [1.5, 2.5, 3.5],
+                        'o': ['x', 'y', 'z'],
+                        'd': pd.date_range('2018-01-01', periods=3),
+                        't': pd.date_range('2018-01-01', periods=3,
+                                           tz='US/Eastern'),
+                        'c': pd.Categorical(['u', 'v', 'u'])},
+                        index=[10, 20, 30])
+
+        # the dtype of the columns looked up is kept
+        result = df.lookup([30, 10, 20, 10], ['i', 'i', 'i', 'i'])
+        tm.assert_numpy_array_equal(result, np.array([3, 1, 2, 1]))
+
+        result = df.lookup([30, 10, 20], ['i', 'f', 'i'])
+        tm.assert_numpy_array_equal(result, np.array([3., 1.5, 2.]))
+
+        result = df.lookup([20, 30], ['d', 'd'])
+        tm.assert_numpy_array_equal(result, df['d'].values[[1, 2]])
+
+        rows = [20, 10, 30, 20, 30, 10]
+        cols = ['i', 'o', 'd', 't', 'c', 'f']
+        result = df.lookup(rows, cols)
+        expected = np.array([2, 'x', pd.Timestamp('2018-01-03'),
+                             pd.Timestamp('2018-01-02', tz='US/Eastern'),
+                             'u', 1.5], dtype=object)
+        tm.assert_numpy_array_equal(result, expected)
+        for r, c, value in zip(rows, cols, result):
+            assert value == df.at[r, c]
+
+        result = df.lookup([], [])
+        assert len(result) == 0
+
     def test_set_value(self):
         for idx in self.frame.index:
             for col in self.frame.columns:
@@ -215,3 +215,38 @@ def test_cython_with_timestamp_and_nat(op, data):
 
     result = df.groupby('a').aggregate(op)
     tm.assert_frame_equal(expected, result)
+
+
+@pytest.mark.parametrize('nthreads', [2, 3, 16])
+@pytest.mark.parametrize('op_name', [
+    'sum', 'prod', 'mean', 'median', 'var', 'min', 'max', 'first', 'last',
+    'ohlc'])
+def test_cython_agg_groupby_threads(op_name, nthreads):
+    df = DataFrame(np.random.randn(100, 10), columns=list('abcdefghij'))
+    df.iloc[::7, 3] = nan
+    df['ints'] = np.arange(100)
+    df['key'] = np.random.randint(0, 5, size=100)
+
+    grouped = df.groupby('key')
+    expected = getattr(grouped, op_name)()
+
+    with pd.option_context('compute.groupby_threads', nthreads):
+        result = getattr(grouped, op_name)()
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('nthreads', [2, 3])
+def test_cython_agg_groupby_threads_ohlc(nthreads):
+    df = DataFrame(np.random.randn(100, 5), columns=list('abcde'))
+    df.iloc[::7, 3] = nan
+    key = np.random.randint(0, 5, size=100)
+
+    with pd.option_context('compute.groupby_threads', nthreads):
+        result = df.groupby(key).ohlc()
+
+    assert list(result.columns) == [(col, field) for col in df.columns
+                                    for field in ['open', 'high', 'low',
+                                                  'close']]
+    for col in df.columns:
+        expected = df[col].groupby(key).ohlc()
+        tm.assert_frame_equal(result[col], expected)
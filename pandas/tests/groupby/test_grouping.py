@@ -807,3 +807,109 @@ class TestIteration():
         result = gr.grouper.groupings[0].__repr__()
         expected = "Grouping(('A', 'a'))"
         assert result == expected
+
+
+# prepared groupers
+# --------------------------------
+
+class TestPreparedGrouper():
+
+    def test_prepared_grouper(self, df):
+        pg = pd.PreparedGrouper(df, ['A', 'B'])
+        expected = df.groupby(['A', 'B'])
+
+        assert pg.ngroups == expected.ngroups
+        tm.assert_index_equal(pg.result_index, expected.grouper.result_index)
+        tm.assert_numpy_array_equal(pg.codes, expected.grouper.group_info[0])
+
+        assert_frame_equal(df.groupby(pg).sum(), expected.sum())
+        assert_frame_equal(df.groupby(pg).mean(), expected.mean())
+        assert_series_equal(df.groupby(pg)['C'].max(), expected['C'].max())
+        assert_series_equal(df['C'].groupby(pg).max(), expected['C'].max())
+        assert_frame_equal(df.groupby(pg, as_index=False).sum(),
+                           df.groupby(['A', 'B'], as_index=False).sum())
+        assert_frame_equal(df.groupby(pg).apply(lambda x: x.sum()),
+                           expected.apply(lambda x: x.sum()))
+
+        # the factorization is reused
+        assert df.groupby(pg).grouper is pg.grouper
+        assert df['C'].groupby(pg).grouper is pg.grouper
+
+    def test_prepared_grouper_sort_order(self, df):
+        pg = pd.PreparedGrouper(df, 'A')
+        result = df.take(pg.sort_order)['A']
+        assert result.is_monotonic_increasing
+
+    def test_prepared_grouper_level(self, mframe):
+        pg = pd.PreparedGrouper(mframe, level='first')
+        assert_frame_equal(mframe.groupby(pg).sum(),
+                           mframe.groupby(level='first').sum())
+
+    def test_prepared_grouper_modified_keys(self, df):
+        df = df.copy()
+        pg = pd.PreparedGrouper(df, ['A', 'B'])
+        df.groupby(pg).sum()
+        original = pg.grouper
+
+        # setting values outside of the key blocks keeps the factorization
+        df.loc[0, 'C'] = 100.
+        assert df.groupby(pg).grouper is original
+
+        # in-place modification of a key column
+        df.loc[0, 'A'] = 'baz'
+        result = df.groupby(pg).sum()
+        assert_frame_equal(result, df.groupby(['A', 'B']).sum())
+        assert pg.grouper is not original
+
+        # replaced key column
+        df['B'] = 'one'
+        result = df.groupby(pg).sum()
+        assert_frame_equal(result, df.groupby(['A', 'B']).sum())
+        assert pg.ngroups == 3
+
+    def test_prepared_grouper_chained_write(self, df):
+        df = df.copy()
+        pg = pd.PreparedGrouper(df, ['A', 'B'])
+        original = pg.grouper
+
+        # a write through the cached column, which holds a block of its own
+        with pd.option_context('mode.chained_assignment', None):
+            df['A'][0] = 'baz'
+        result = df.groupby(pg).sum()
+        assert_frame_equal(result, df.groupby(['A', 'B']).sum())
+        assert pg.grouper is not original
+
+        # a write straight to the numpy array
+        original = pg.grouper
+        df['B'].values[1] = 'four'
+        result = df.groupby(pg).sum()
+        assert_frame_equal(result, df.groupby(['A', 'B']).sum())
+        assert pg.grouper is not original
+
+        # values moved between rows
+        original = pg.grouper
+        df['B'].values[[2, 3]] = df['B'].values[[3, 2]]
+        result = df.groupby(pg).sum()
+        assert_frame_equal(result, df.groupby(['A', 'B']).sum())
+        assert pg.grouper is not original
+
+    def test_prepared_grouper_other_object(self, df):
+        pg = pd.PreparedGrouper(df, ['A', 'B'])
+        original = pg.grouper
+
+        # a different object with the keys is grouped without evicting
+        # the cached factorization
+        other = df.iloc[:5]
+        result = other.groupby(pg).sum()
+        assert_frame_equal(result, other.groupby(['A', 'B']).sum())
+        assert pg.grouper is original
+
+        with tm.assert_raises_regex(ValueError, 'does not match'):
+            df['C'].iloc[:5].groupby(pg)
+
+    def test_prepared_grouper_invalid(self, df):
+        with tm.assert_raises_regex(TypeError, "supply one of"):
+            pd.PreparedGrouper(df)
+
+        with pytest.raises(KeyError):
+            pd.PreparedGrouper(df, 'E')
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+""" test groupby reductions over a stream of chunks """
+
+import pytest
+
+import numpy as np
+import pandas as pd
+import pandas.util.testing as tm
+
+from pandas import DataFrame, read_csv
+from pandas.compat import StringIO, range
+from pandas.core.base import SpecificationError
+from pandas.core.groupby import StreamingGroupBy
+
+
+@pytest.fixture
+def frame():
+    n = 1000
+    df = DataFrame({'A': np.random.choice(['foo', 'bar', 'baz'], n),
+                    'B': np.random.randint(0, 4, n),
+                    'C': np.random.randn(n),
+                    'D': np.random.randint(0, 50, n),
+                    'E': pd.date_range('2018-01-01', periods=n, freq='h')})
+    df.loc[::7, 'C'] = np.nan
+    return df
+
+
+def _chunks(df, size):
+    for start in range(0, len(df), size):
+        yield df.iloc[start:start + size]
+
+
+@pytest.mark.parametrize('how', ['sum', 'count', 'mean', 'var', 'std',
+                                 'min', 'max', 'first', 'last'])
+@pytest.mark.parametrize('by', ['A', ['A', 'B']])
+@pytest.mark.parametrize('size', [1, 77, 1000])
+def test_streaming_reductions(frame, how, by, size):
+    sgb = StreamingGroupBy(by, how)
+    result = sgb.aggregate(_chunks(frame, size))
+    expected = getattr(frame.groupby(by), how)()
+    tm.assert_frame_equal(result, expected, check_dtype=False,
+                          check_like=True)
+
+
+@pytest.mark.parametrize('how', ['count', 'mean', 'sum'])
+def test_streaming_group_across_chunks(how):
+    # the group 'a' spans every chunk
+    df = DataFrame({'A': ['a', 'a', 'b', 'a', 'a', 'c', 'a', 'a', 'a'],
+                    'C': [1., 2., np.nan, 3., np.nan, 4., 5., 6., 7.]})
+    sgb = StreamingGroupBy('A', how)
+    result = sgb.aggregate(_chunks(df, 2))
+    expected = getattr(df.groupby('A'), how)()
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+
+    if how == 'count':
+        assert result.loc['a', 'C'] == 6
+
+
+def test_streaming_list_and_dict(frame):
+    sgb = StreamingGroupBy('A', ['sum', 'mean'])
+    result = sgb.aggregate(_chunks(frame[['A', 'C', 'D']], 100))
+    expected = frame[['A', 'C', 'D']].groupby('A').agg(['sum', 'mean'])
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+
+    func = {'C': ['min', 'var'], 'D': 'max'}
+    sgb = StreamingGroupBy(['A', 'B'], func)
+    result = sgb.aggregate(_chunks(frame, 100))
+    expected = frame.groupby(['A', 'B']).agg(func)
+    tm.assert_frame_equal(result, expected, check_dtype=False,
+                          check_like=True)
+
+
+def test_streaming_sort(frame):
+    chunks = list(_chunks(frame, 100))
+    result = StreamingGroupBy('A', 'sum', sort=False).aggregate(chunks)
+    expected = frame.groupby('A', sort=False).sum()
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_streaming_nunique(frame):
+    sgb = StreamingGroupBy('A', {'D': 'nunique'})
+    result = sgb.aggregate(_chunks(frame, 100))['D']
+    expected = frame.groupby('A')['D'].nunique()
+    tm.assert_index_equal(result.index, expected.index)
+
+    # the sketch is approximate, but very accurate at low cardinality
+    assert (abs(result - expected) <= 2).all()
+
+
+def test_streaming_merge(frame):
+    left = StreamingGroupBy('A', 'var')
+    for chunk in _chunks(frame[:400], 50):
+        left.update(chunk)
+    right = StreamingGroupBy('A', 'var').update(frame[400:])
+
+    result = left.merge(right).result()
+    expected = frame.groupby('A').var()
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+
+    with tm.assert_raises_regex(ValueError, 'can only merge'):
+        left.merge(StreamingGroupBy('A', 'sum'))
+
+
+def test_streaming_merge_into_empty(frame):
+    other = StreamingGroupBy('A', 'sum').update(frame[:400])
+    expected = other.result()
+
+    # merging into an empty instance must not share the states of other
+    result = StreamingGroupBy('A', 'sum').merge(other)
+    result.update(frame[400:])
+    result.merge(StreamingGroupBy('A', 'sum').update(frame[:10]))
+    tm.assert_frame_equal(other.result(), expected)
+    assert other._columns is not result._columns
+
+
+def test_streaming_read_csv(frame):
+    data = frame[['A', 'B', 'C']].to_csv(index=False)
+    reader = read_csv(StringIO(data), chunksize=128)
+    result = StreamingGroupBy('A', ['mean', 'max']).aggregate(reader)
+
+    expected = read_csv(StringIO(data)).groupby('A').agg(['mean', 'max'])
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_streaming_invalid(frame):
+    with tm.assert_raises_regex(ValueError, 'not a supported'):
+        StreamingGroupBy('A', 'median').update(frame)
+
+    with pytest.raises(SpecificationError):
+        StreamingGroupBy('A', {'A': 'sum'}).update(frame)
+
+    with pytest.raises(KeyError):
+        StreamingGroupBy('A', {'Z': 'sum'}).update(frame)
+
+    with tm.assert_raises_regex(ValueError, 'No chunks'):
+        StreamingGroupBy('A', 'sum').result()
+
+    with tm.assert_raises_regex(ValueError, 'precision'):
+        StreamingGroupBy('A', 'nunique', precision=2)
@@ -67,6 +67,19 @@ def test_isin_nan_not_pypy():
                                 np.array([False, False]))
 
 
+def test_isin_without_tuples():
+    idx = MultiIndex.from_product([['a', 'b'], [1, 2, 3]])
+    values = MultiIndex.from_arrays([['b', 'a', 'c', 'b'], [2, 3, 1, 4]])
+
+    result = idx.isin(values)
+    expected = np.array([False, False, True, False, True, False])
+    tm.assert_numpy_array_equal(result, expected)
+    assert idx._tuples is None
+    assert values._tuples is None
+
+    tm.assert_numpy_array_equal(idx.isin(list(values)), expected)
+
+
 def test_isin_level_kwarg():
     idx = MultiIndex.from_arrays([['qux', 'baz', 'foo', 'bar'], np.arange(
         4)])
@@ -37,6 +37,17 @@ def test_unique(names):
     tm.assert_index_equal(mi, res)
 
 
+def test_unique_without_tuples():
+    mi = MultiIndex.from_arrays([['b', 'a', 'b', 'a', 'c'],
+                                 [1, 2, 1, 2, np.nan]])
+    mi = mi[:4]
+    result = mi.unique()
+    expected = MultiIndex.from_arrays([['b', 'a'], [1., 2.]])
+    tm.assert_index_equal(result, expected)
+    assert list(result.levels[0]) == ['a', 'b']
+    assert mi._tuples is None
+
+
 def test_unique_datetimelike():
     idx1 = DatetimeIndex(['2015-01-01', '2015-01-01', '2015-01-01',
                           '2015-01-01', 'NaT', 'NaT'])
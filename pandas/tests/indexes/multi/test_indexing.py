@@ -174,6 +174,29 @@ def test_get_indexer():
         idx1.get_indexer(idx2)
 
 
+def test_get_indexer_without_tuples():
+    idx = MultiIndex.from_product([['a', 'b', 'c'], [1, 2]])
+    target = MultiIndex.from_arrays([['c', 'a', 'd', np.nan],
+                                     [2, 1, 1, 2]])
+
+    result = idx.get_indexer(target)
+    tm.assert_numpy_array_equal(result, np.array([5, 0, -1, -1],
+                                                 dtype=np.intp))
+    indexer, missing = idx.get_indexer_non_unique(target)
+    tm.assert_numpy_array_equal(indexer, np.array([5, 0, -1, -1],
+                                                  dtype=np.intp))
+    tm.assert_numpy_array_equal(missing, np.array([2, 3], dtype=np.intp))
+
+    # keys that are not full tuples match nothing
+    result = idx.get_indexer(Index(['a', ('b', 2), ('b', 2, 3), 1],
+                                   tupleize_cols=False))
+    tm.assert_numpy_array_equal(result, np.array([-1, 3, -1, -1],
+                                                 dtype=np.intp))
+
+    assert idx._tuples is None
+    assert target._tuples is None
+
+
 def test_get_indexer_nearest():
     midx = MultiIndex.from_tuples([('a', 1), ('b', 2)])
     with pytest.raises(NotImplementedError):
@@ -1025,6 +1025,83 @@ class TestIndex(Base):
         result = left.append(right)
         assert result.name == expected
 
+    @pytest.mark.parametrize('index', [
+        Int64Index([1, 3, 5, 7, 9]),
+        Int64Index([9, 7, 5, 3, 1]),
+        Int64Index([1, 3, 5, 2, 9]),
+        UInt64Index(2**63 + np.array([1, 3, 5, 7, 9], dtype='uint64')),
+        Float64Index([1.5, 2.5, 0.5, np.nan, 3.]),
+        Index(list('abcde')),
+        Index(list('abdce')),
+        date_range('2018-01-01', periods=5),
+        period_range('2018-01', periods=5, freq='M'),
+    ])
+    def test_append_extends_engine(self, index):
+        left, right = index[:3], index[3:]
+        # populate the mapping and check the monotonicity of left
+        assert left.is_unique
+        left.is_monotonic_increasing
+
+        result = left.append(right)
+        tm.assert_index_equal(result, index)
+        assert result._engine.is_mapping_populated
+        assert not left._engine.is_mapping_populated
+
+        assert result.is_unique
+        assert result.is_monotonic_increasing == index.is_monotonic_increasing
+        assert result.is_monotonic_decreasing == index.is_monotonic_decreasing
+        for i, key in enumerate(index):
+            assert result.get_loc(key) == i
+
+        # left repopulates its mapping
+        for i, key in enumerate(left):
+            assert left.get_loc(key) == i
+        assert index[-1] not in left
+
+    def test_append_extends_engine_duplicates(self):
+        left = Int64Index([1, 2, 3])
+        assert left.is_unique
+
+        result = left.append(Int64Index([4, 2]))
+        assert result._engine.is_mapping_populated
+        assert not result.is_unique
+        assert result.get_loc(4) == 3
+        tm.assert_numpy_array_equal(
+            result.get_loc(2), np.array([False, True, False, False, True]))
+
+        # a non-unique index stays non-unique
+        result = result.append(Int64Index([5]))
+        assert not result.is_unique
+        assert result.get_loc(5) == 5
+
+    def test_append_extends_engine_unhashable(self):
+        left = Index(['a', 'b', 'c'])
+        assert left.get_loc('b') == 1
+
+        # appending still works, and neither engine keeps a table with
+        # some of the appended values
+        right = Index(['d', {'x': 1}], dtype=object)
+        result = left.append(right)
+        tm.assert_index_equal(result,
+                              Index(['a', 'b', 'c', 'd', {'x': 1}],
+                                    dtype=object))
+        assert not result._engine.is_mapping_populated
+        assert not left._engine.is_mapping_populated
+
+        for i, key in enumerate(left):
+            assert left.get_loc(key) == i
+        assert 'd' not in left
+
+    def test_append_engine_other_type(self):
+        left = Int64Index([1, 2, 3])
+        assert left.is_unique
+
+        result = left.append(Float64Index([4.5]))
+        assert isinstance(result, Float64Index)
+        assert not result._engine.is_mapping_populated
+        assert left._engine.is_mapping_populated
+        assert result.get_loc(4.5) == 3
+
     def test_add_string(self):
         # from bug report
         index = Index(['a', 'b', 'c'])
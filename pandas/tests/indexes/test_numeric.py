@@ -1269,3 +1269,85 @@ class TestUInt64Index(NumericInt):
         tm.assert_index_equal(res, eres)
         tm.assert_numpy_array_equal(lidx, elidx)
         tm.assert_numpy_array_equal(ridx, eridx)
+
+
+class TestSortedEngine(object):
+
+    @pytest.fixture(autouse=True)
+    def sorted_engine(self):
+        with pd.option_context('compute.index_engine', 'sorted'):
+            yield
+
+    @pytest.mark.parametrize('index', [
+        Int64Index([5, -3, 8, 0, 12]),
+        UInt64Index(2**63 + np.array([5, 3, 8, 0, 12], dtype='uint64')),
+        Float64Index([5.5, -3., 8.25, 0., 12.]),
+        pd.to_datetime(['2018-01-03', '2018-01-01', '2018-01-05',
+                        '2018-01-02', '2018-01-04']),
+        pd.period_range('2018-01', periods=5, freq='M')[[2, 0, 4, 1, 3]],
+    ])
+    def test_lookups(self, index):
+        for i, key in enumerate(index):
+            assert index.get_loc(key) == i
+            assert key in index
+        assert type(index._engine.mapping).__name__.startswith('Sorted')
+
+        other = index[[3, 1, 4]].append(index[[0, 2]])
+        tm.assert_numpy_array_equal(index.get_indexer(other),
+                                    np.array([3, 1, 4, 0, 2], dtype=np.intp))
+        tm.assert_numpy_array_equal(index.get_indexer(index[::-1]),
+                                    np.arange(4, -1, -1, dtype=np.intp))
+
+    def test_missing(self):
+        index = Int64Index([5, -3, 8, 0, 12])
+        assert 1 not in index
+        assert 'a' not in index
+        assert 2**65 not in index
+        with pytest.raises(KeyError):
+            index.get_loc(1)
+        tm.assert_numpy_array_equal(index.get_indexer([12, 1, 13, -3]),
+                                    np.array([4, -1, -1, 1], dtype=np.intp))
+
+    def test_duplicates(self):
+        index = Int64Index([3, 1, 3, 2])
+        assert not index.is_unique
+        assert index._engine.mapping is not None
+        assert 1 in index
+        assert index.get_loc(1) == 1
+        tm.assert_numpy_array_equal(index.get_loc(3),
+                                    np.array([True, False, True, False]))
+
+    def test_nan(self):
+        index = Float64Index([2., np.nan, 1.])
+        assert np.nan in index
+        assert index.get_loc(np.nan) == 1
+        assert index.get_loc(1.) == 2
+        tm.assert_numpy_array_equal(index.get_indexer([np.nan, 2., 3.]),
+                                    np.array([1, 0, -1], dtype=np.intp))
+
+        index = Float64Index([2., 1.])
+        assert np.nan not in index
+        with pytest.raises(KeyError):
+            index.get_loc(np.nan)
+
+    def test_memory_usage(self):
+        values = np.random.permutation(1000)
+        index = Int64Index(values)
+        index.get_loc(0)
+        assert index._engine.sizeof() == 4 * len(values)
+        assert index.memory_usage() == values.nbytes + 4 * len(values)
+
+        with pd.option_context('compute.index_engine', 'hash'):
+            other = Int64Index(values)
+            other.get_loc(0)
+        assert other.memory_usage() > index.memory_usage()
+
+    def test_auto(self):
+        with pd.option_context('compute.index_engine', 'auto'):
+            index = Int64Index([3, 1, 2])
+            index.get_loc(1)
+            assert type(index._engine.mapping).__name__ == 'Int64HashTable'
+
+    def test_option_validation(self):
+        with pytest.raises(ValueError):
+            pd.set_option('compute.index_engine', 'tree')
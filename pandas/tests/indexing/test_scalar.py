@@ -4,6 +4,7 @@ import pytest
 
 import numpy as np
 
+import pandas as pd
 from pandas import (Series, DataFrame, Timestamp,
                     Timedelta, date_range)
 from pandas.util import testing as tm
@@ -170,3 +171,91 @@ class TestScalar(Base):
 
         result = df.at[0, 'date']
         assert result == expected
+
+
+class TestScalarFastPath(object):
+    # the cython lookups of at, iat and scalar loc and iloc
+
+    @pytest.fixture
+    def df(self):
+        return DataFrame({'a': [1, 2, 3], 'b': [1.5, 2.5, 3.5],
+                          'c': ['x', 'y', 'z'],
+                          'd': date_range('2018-01-01', periods=3),
+                          'e': pd.to_timedelta([1, 2, 3], unit='s'),
+                          'f': date_range('2018-01-01', periods=3,
+                                          tz='US/Eastern'),
+                          'g': pd.Categorical(['u', 'v', 'u'])},
+                         index=[10, 20, 30])
+
+    @pytest.mark.parametrize('col, expected', [
+        ('a', np.int64(2)), ('b', np.float64(2.5)), ('c', 'y'),
+        ('d', Timestamp('2018-01-02')), ('e', Timedelta(2, unit='s')),
+        ('f', Timestamp('2018-01-02', tz='US/Eastern')), ('g', 'v')])
+    def test_frame(self, df, col, expected):
+        j = df.columns.get_loc(col)
+        for result in [df.at[20, col], df.loc[20, col], df.iat[1, j],
+                       df.iloc[1, j], df.iat[-2, j - len(df.columns)],
+                       df[col].at[20], df[col].loc[20], df[col].iat[1],
+                       df[col].iloc[-2]]:
+            assert result == expected
+            assert type(result) == type(expected)
+
+    def test_nat(self):
+        df = DataFrame({'d': [Timestamp('2018-01-01'), pd.NaT],
+                        'e': [Timedelta(1), pd.NaT]})
+        assert df.at[1, 'd'] is pd.NaT
+        assert df.iat[1, 1] is pd.NaT
+        assert df['d'].at[1] is pd.NaT
+
+    def test_missing(self, df):
+        with pytest.raises(KeyError):
+            df.at[40, 'a']
+        with pytest.raises(KeyError):
+            df.at[20, 'h']
+        with pytest.raises(IndexError):
+            df.iat[3, 0]
+        with pytest.raises(IndexError):
+            df.iat[0, 7]
+        with pytest.raises(KeyError):
+            df['a'].at[40]
+        with pytest.raises(IndexError):
+            df['a'].iat[-4]
+
+    def test_duplicates(self):
+        df = DataFrame([[1, 2], [3, 4], [5, 6]], index=[0, 0, 1],
+                       columns=['a', 'a'])
+        assert df.iat[1, 1] == 4
+        assert df.iloc[2, 0] == 5
+
+        df.columns = ['a', 'b']
+        assert df.at[1, 'b'] == 6
+        assert df['b'].at[1] == 6
+        tm.assert_series_equal(df.loc[0, 'b'],
+                               Series([2, 4], index=[0, 0], name='b'))
+
+    def test_index_types(self):
+        s = Series([1., 2., 3.], index=date_range('2018-01-01', periods=3))
+        assert s.at['2018-01-02'] == 2.
+        assert s.at[Timestamp('2018-01-02')] == 2.
+        assert s.loc['2018-01-02'] == 2.
+
+        s = Series([1., 2., 3.], index=pd.CategoricalIndex([2, 0, 1]))
+        assert s.loc[0] == 2.
+
+        s = Series([1., 2., 3.], index=pd.period_range('2018-01',
+                                                       periods=3, freq='M'))
+        assert s.at[pd.Period('2018-02', freq='M')] == 2.
+
+        s = Series([1., 2., 3.], index=[1.5, 2.5, 3.5])
+        assert s.at[2.5] == 2.
+
+    def test_after_modification(self, df):
+        assert df.at[20, 'b'] == 2.5
+        df.at[20, 'b'] = 10.
+        assert df.at[20, 'b'] == 10.
+        df['b'] = ['p', 'q', 'r']
+        assert df.at[20, 'b'] == 'q'
+        assert df.iat[1, 1] == 'q'
+        df.insert(0, 'h', [7, 8, 9])
+        assert df.iat[1, 0] == 8
+        assert df.iat[1, 2] == 'q'
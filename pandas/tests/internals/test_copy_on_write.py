@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import pytest
+import numpy as np
+
+import pandas as pd
+from pandas import DataFrame, Series
+import pandas.util.testing as tm
+
+
+@pytest.fixture(autouse=True)
+def copy_on_write():
+    with pd.option_context('mode.copy_on_write', True):
+        yield
+
+
+def get_array(obj, col=None):
+    if col is None:
+        return obj._data._block.values
+    mgr = obj._data
+    loc = obj.columns.get_loc(col)
+    blk = mgr.blocks[mgr._blknos[loc]]
+    return blk.iget(mgr._blklocs[loc])
+
+
+@pytest.fixture
+def df():
+    return DataFrame({'a': [1., 2., 3.], 'b': [4., 5., 6.],
+                      'c': ['x', 'y', 'z']})
+
+
+@pytest.mark.parametrize('method', [
+    lambda df: df.copy(),
+    lambda df: df.copy(deep=False),
+    lambda df: df.rename(columns=str.upper),
+    lambda df: df.set_axis(['A', 'B', 'C'], axis=1, inplace=False),
+    lambda df: df[['a', 'b']].astype('float64'),
+    lambda df: df.reindex(df.index),
+    lambda df: df[['a', 'c']],
+], ids=['copy', 'shallow-copy', 'rename', 'set_axis', 'astype',
+        'reindex', 'getitem-list'])
+def test_derived_frame_shares_until_write(df, method):
+    expected = df.copy(deep=True)
+    result = method(df)
+    col = result.columns[0]
+    assert np.shares_memory(get_array(result, col), get_array(df, 'a'))
+
+    result.iloc[0, 0] = 100.
+    assert not np.shares_memory(get_array(result, col), get_array(df, 'a'))
+    assert result.iloc[0, 0] == 100.
+    tm.assert_frame_equal(df, expected)
+
+
+def test_write_to_parent_does_not_propagate(df):
+    result = df.copy()
+    df.loc[0, 'a'] = 100.
+    assert result.loc[0, 'a'] == 1.
+    assert df.loc[0, 'a'] == 100.
+
+
+def test_column_selection(df):
+    s = df['a']
+    assert np.shares_memory(get_array(s), get_array(df, 'a'))
+
+    s[0] = 100.
+    assert df.loc[0, 'a'] == 1.
+
+    df['a'] = 0.
+    tm.assert_series_equal(s, Series([100., 2., 3.], name='a'))
+
+
+def test_set_value(df):
+    s = df['a']
+    df.at[0, 'a'] = 100.
+    df.iat[1, 0] = 200.
+    assert s.tolist() == [1., 2., 3.]
+    assert df['a'].tolist() == [100., 200., 3.]
+
+
+def test_series_slice():
+    s = Series([1., 2., 3., 4.])
+    result = s[1:3]
+    assert np.shares_memory(get_array(result), get_array(s))
+
+    result.iloc[0] = 100.
+    assert s.tolist() == [1., 2., 3., 4.]
+    assert result.tolist() == [100., 3.]
+
+
+def test_fillna_inplace(df):
+    df.loc[1, 'b'] = np.nan
+    result = df.copy()
+    result.fillna(0., inplace=True)
+    assert np.isnan(df.loc[1, 'b'])
+    assert result.loc[1, 'b'] == 0.
+
+    result = df.copy()
+    result.fillna({'b': 0.}, inplace=True)
+    assert np.isnan(df.loc[1, 'b'])
+    assert result.loc[1, 'b'] == 0.
+
+
+def test_option_off():
+    with pd.option_context('mode.copy_on_write', False):
+        df = DataFrame({'a': [1., 2., 3.]})
+        result = df.copy()
+        assert not np.shares_memory(get_array(result, 'a'),
+                                    get_array(df, 'a'))
+
+
+def test_option_cached():
+    from pandas.core.internals import using_copy_on_write
+    assert using_copy_on_write()
+    with pd.option_context('mode.copy_on_write', False):
+        assert not using_copy_on_write()
+    assert using_copy_on_write()
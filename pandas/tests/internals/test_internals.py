@@ -14,7 +14,8 @@ from pandas import (Index, MultiIndex, DataFrame, DatetimeIndex,
                     Series, Categorical, TimedeltaIndex, SparseArray)
 from pandas.compat import OrderedDict, lrange
 from pandas.core.internals import (SingleBlockManager,
-                                   make_block, BlockManager)
+                                   make_block, BlockManager,
+                                   ColumnarBlockManager)
 import pandas.core.algorithms as algos
 import pandas.util.testing as tm
 import pandas as pd
@@ -1274,3 +1275,82 @@ def test_validate_ndim():
 
     with tm.assert_raises_regex(ValueError, msg):
         make_block(values, placement, ndim=2)
+
+
+class TestColumnarBlockManager(object):
+
+    @pytest.fixture
+    def df(self):
+        with pd.option_context('mode.data_manager', 'columnar'):
+            return DataFrame({'a': [1., 2., 3.], 'b': [4, 5, 6],
+                              'c': [7., 8., np.nan], 'd': list('xyz')})
+
+    def test_constructor(self, df):
+        mgr = df._data
+        assert isinstance(mgr, ColumnarBlockManager)
+        assert mgr.nblocks == 4
+        assert all(len(blk.mgr_locs) == 1 for blk in mgr.blocks)
+
+        expected = DataFrame({'a': [1., 2., 3.], 'b': [4, 5, 6],
+                              'c': [7., 8., np.nan], 'd': list('xyz')})
+        assert_frame_equal(df, expected)
+
+    def test_insert_does_not_consolidate(self, df):
+        for i in range(200):
+            df['x{}'.format(i)] = float(i)
+        assert df._data.nblocks == 204
+        assert all(len(blk.mgr_locs) == 1 for blk in df._data.blocks)
+        assert df['x150'].tolist() == [150.] * 3
+
+        df['c'] = list('uvw')
+        assert df._data.nblocks == 204
+        assert df['c'].tolist() == list('uvw')
+
+    def test_set_several_items(self, df):
+        # a duplicated item sets all of its locations with a single block
+        df.columns = ['a', 'b', 'a', 'd']
+        mgr = df._data
+        mgr.set('a', np.array([list('uwy'), list('vxz')], dtype=object))
+        assert mgr.nblocks == 4
+        assert all(len(blk.mgr_locs) == 1 for blk in mgr.blocks)
+        for i, blk in enumerate(mgr.blocks):
+            assert mgr._blknos[blk.mgr_locs.indexer] == i
+            assert mgr._blklocs[blk.mgr_locs.indexer] == 0
+
+        result = df.iloc[:, [0, 2]]
+        assert result.iloc[:, 0].tolist() == list('uwy')
+        assert result.iloc[:, 1].tolist() == list('vxz')
+        assert df['b'].tolist() == [4, 5, 6]
+
+    def test_derived_frames(self, df):
+        for result in [df.copy(), df[['a', 'c']], df.iloc[1:],
+                       df.reindex(columns=['a', 'c', 'e']),
+                       pd.concat([df, df])]:
+            assert isinstance(result._data, ColumnarBlockManager)
+            assert all(len(blk.mgr_locs) == 1 for blk in result._data.blocks)
+
+    @pytest.mark.parametrize('method', ['sum', 'mean', 'min', 'std'])
+    def test_reduce(self, df, method):
+        expected = getattr(df.as_manager('block'), method)(numeric_only=True)
+        result = getattr(df, method)(numeric_only=True)
+        assert_series_equal(result, expected)
+
+        numeric = df[['a', 'b', 'c']]
+        expected = getattr(numeric.as_manager('block'), method)()
+        result = getattr(numeric, method)()
+        assert_series_equal(result, expected)
+
+    def testas_manager(self, df):
+        result = df.as_manager('block')
+        assert type(result._data) is BlockManager
+        assert result._data.nblocks == 3
+        assert_frame_equal(result, df)
+
+        result = result.as_manager('columnar')
+        assert isinstance(result._data, ColumnarBlockManager)
+        assert result._data.nblocks == 4
+        assert_frame_equal(result, df)
+
+        assert df.as_manager('columnar') is df
+        with tm.assert_raises_regex(ValueError, "manager type"):
+            df.as_manager('array')
@@ -483,3 +483,42 @@ No,No,No"""
             ['x' * (1 << 20) for _ in range(2100)]))
         df = self.read_csv(csv, low_memory=False)
         assert not df.empty
+
+    @pytest.mark.parametrize('nthreads', [1, 2, 4])
+    def test_nthreads(self, nthreads):
+        df = DataFrame(np.random.randn(100, 6), columns=list('abcdef'))
+        df['ints'] = np.arange(100, dtype='int64')
+        df['strs'] = 'foo'
+        df['bools'] = np.arange(100) % 2 == 0
+        df.loc[::7, 'a'] = np.nan
+        data = df.to_csv(index=False)
+
+        expected = self.read_csv(StringIO(data))
+        result = self.read_csv(StringIO(data), nthreads=nthreads)
+        tm.assert_frame_equal(result, expected)
+
+        result = self.read_csv(StringIO(data), nthreads=nthreads,
+                               usecols=['b', 'ints', 'strs'],
+                               dtype={'b': 'float32'},
+                               converters={'strs': str.upper})
+        expected = self.read_csv(StringIO(data),
+                                 usecols=['b', 'ints', 'strs'],
+                                 dtype={'b': 'float32'},
+                                 converters={'strs': str.upper})
+        tm.assert_frame_equal(result, expected)
+
+    def test_nthreads_chunks(self):
+        df = DataFrame(np.random.randn(100, 3), columns=list('abc'))
+        df['ints'] = np.arange(100, dtype='int64')
+        data = df.to_csv(index=False)
+        expected = self.read_csv(StringIO(data))
+
+        reader = self.read_csv(StringIO(data), nthreads=2, chunksize=7)
+        result = pd.concat(list(reader))
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('nthreads', [0, -1])
+    def test_nthreads_invalid(self, nthreads):
+        data = 'a,b\n1,2'
+        with tm.assert_raises_regex(ValueError, 'nthreads'):
+            self.read_csv(StringIO(data), nthreads=nthreads)
@@ -17,10 +17,14 @@ import pytest
 from warnings import catch_warnings
 
 import os
+import pickle
 from distutils.version import LooseVersion
+import numpy as np
 import pandas as pd
 from pandas import Index
 from pandas.compat import is_platform_little_endian, PY3
+from pandas.compat.numpy import _np_version_under1p16
+from pandas.core.arrays import IntegerArray
 import pandas
 import pandas.util.testing as tm
 import pandas.util._test_decorators as td
@@ -478,3 +482,54 @@ class TestProtocol(object):
             with tm.ensure_clean(get_random_path) as path:
                 df = tm.makeDataFrame()
                 df.to_pickle(path, protocol=protocol)
+
+
+# ---------------------
+# test out-of-band buffers
+# ---------------------
+
+@pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5 or _np_version_under1p16,
+                    reason="pickle protocol 5 requires Python >= 3.8 and "
+                           "numpy >= 1.16")
+class TestOutOfBandBuffers(object):
+
+    @pytest.mark.parametrize('obj', [
+        pd.DataFrame(np.random.randn(100, 3), columns=list('abc'),
+                     index=pd.date_range('2018-01-01', periods=100)),
+        pd.DataFrame(np.random.randn(100, 3)).iloc[::2, :2],
+        pd.DataFrame({'a': np.arange(100), 'b': np.random.randn(100)},
+                     index=pd.MultiIndex.from_product([range(10),
+                                                       range(10)])),
+        pd.Series(np.arange(100), index=pd.Index(np.arange(100) * 2)),
+        pd.Series(pd.Categorical(np.arange(100) % 5)),
+        pd.Series(IntegerArray(np.arange(100))),
+        pd.Index(np.arange(100)),
+    ], ids=['frame', 'frame-view', 'multiindex', 'series', 'categorical',
+            'integer', 'index'])
+    def test_round_trip(self, obj):
+        buffers = []
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers)
+        assert len(data) < 2000
+
+        result = pickle.loads(data, buffers=buffers)
+        tm.assert_equal(result, obj)
+
+        # in-band
+        result = pickle.loads(pickle.dumps(obj, protocol=5))
+        tm.assert_equal(result, obj)
+
+    def test_zero_copy(self):
+        df = pd.DataFrame(np.random.randn(100, 3))
+        buffers = []
+        data = pickle.dumps(df, protocol=5, buffer_callback=buffers.append)
+        result = pickle.loads(data, buffers=buffers)
+        values = result._data.blocks[0].values
+        assert any(np.shares_memory(values, np.asarray(buf))
+                   for buf in buffers)
+
+    def test_to_pickle(self, get_random_path):
+        df = tm.makeDataFrame()
+        with tm.ensure_clean(get_random_path) as path:
+            df.to_pickle(path, protocol=5)
+            tm.assert_frame_equal(pd.read_pickle(path), df)
@@ -0,0 +1,107 @@
+""" test DataFrames in shared memory """
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+
+import pandas as pd
+from pandas import DataFrame, date_range
+import pandas.util.testing as tm
+from pandas.util.testing import assert_frame_equal, ensure_clean
+
+from pandas.io.shared_memory import SharedMemoryHandle
+
+
+@pytest.fixture
+def df():
+    return DataFrame({'a': np.arange(5), 'b': np.random.randn(5),
+                      'c': date_range('2018-01-01', periods=5),
+                      'd': list('abcde'),
+                      'e': pd.Categorical(list('xyxyx')),
+                      'f': date_range('2018-01-01', periods=5,
+                                      tz='US/Eastern')},
+                     index=date_range('2017-01-01', periods=5, name='t'))
+
+
+def _sum_column(handle):
+    return DataFrame.from_shared_memory(handle)['b'].sum()
+
+
+class TestSharedMemory(object):
+
+    def test_round_trip(self, df):
+        handle = df.to_shared_memory()
+        try:
+            assert isinstance(handle, SharedMemoryHandle)
+            assert os.path.exists(handle.path)
+            result = DataFrame.from_shared_memory(handle)
+            assert_frame_equal(result, df)
+        finally:
+            handle.unlink()
+        assert not os.path.exists(handle.path)
+
+        # the mapping outlives the file
+        assert_frame_equal(result, df)
+
+    def test_round_trip_path(self, df):
+        with ensure_clean() as path:
+            handle = df.to_shared_memory(path)
+            assert handle.path == path
+            assert_frame_equal(DataFrame.from_shared_memory(handle), df)
+
+    def test_zero_copy(self, df):
+        with ensure_clean() as path:
+            handle = df.to_shared_memory(path)
+            result = DataFrame.from_shared_memory(handle)
+            other = DataFrame.from_shared_memory(handle)
+
+            values = result._data.get('b').internal_values()
+            assert not values.flags.writeable
+            assert np.shares_memory(
+                values, other._data.get('b').internal_values())
+            assert np.shares_memory(result.index.values, other.index.values)
+
+            with pytest.raises(ValueError):
+                result.iloc[0, 1] = 1.
+            assert_frame_equal(result, df)
+
+            # a copy is writeable
+            result = result.copy()
+            result.iloc[0, 1] = 1.
+            assert result.iloc[0, 1] == 1.
+
+    def test_snapshot(self, df):
+        with ensure_clean() as path:
+            handle = df.to_shared_memory(path)
+            expected = df.copy()
+            df.iloc[0, 1] = 100.
+            df.iloc[0, 3] = 'z'
+            assert_frame_equal(DataFrame.from_shared_memory(handle),
+                               expected)
+
+    def test_nothing_shared(self):
+        df = DataFrame({'a': list('abc')})
+        handle = df.to_shared_memory()
+        assert handle.path is None
+        assert_frame_equal(DataFrame.from_shared_memory(handle), df)
+        handle.unlink()
+
+    def test_pickle_handle(self, df):
+        with ensure_clean() as path:
+            handle = df.to_shared_memory(path)
+            result = tm.round_trip_pickle(handle)
+            assert result.path == path
+            assert_frame_equal(DataFrame.from_shared_memory(result), df)
+
+    @pytest.mark.slow
+    def test_multiprocessing(self, df):
+        handle = df.to_shared_memory()
+        pool = multiprocessing.Pool(2)
+        try:
+            result = pool.map(_sum_column, [handle, handle])
+        finally:
+            pool.close()
+            pool.join()
+            handle.unlink()
+        assert result == [df['b'].sum()] * 2
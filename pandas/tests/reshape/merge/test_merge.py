@@ -20,7 +20,10 @@ from pandas.compat import lrange, lzip
 from pandas.core.dtypes.common import is_categorical_dtype, is_object_dtype
 from pandas.core.dtypes.dtypes import CategoricalDtype
 from pandas.core.reshape.concat import concat
-from pandas.core.reshape.merge import MergeError, merge
+from pandas.core.reshape.merge import (MergeError, merge,
+                                       _get_hash_join_indexers,
+                                       _get_join_indexers,
+                                       _get_monotonic_join_indexers)
 from pandas.util.testing import assert_frame_equal, assert_series_equal
 
 N = 50
@@ -883,6 +886,174 @@ class TestMerge(object):
         with np.errstate(divide='raise'):
             merge(a, a, on=('a', 'b'))
 
+    @pytest.mark.parametrize('how', ['inner', 'left'])
+    @pytest.mark.parametrize('validate', [None, 'm:1', '1:m', '1:1'])
+    @pytest.mark.parametrize('keys', [
+        np.array([3, 1, 3, 7, 2, 1, 9, 3], dtype=np.int64),
+        pd.date_range('2018', periods=10).values[[3, 1, 3, 7, 2, 1, 9, 3]],
+        np.array(['d', 'b', 'd', 'h', 'c', nan, 'b', 'j'], dtype=object)])
+    def test_hash_join_indexers(self, keys, how, validate):
+        # the single-pass hash join must give exactly the indexers of
+        # the factorizing join
+        uniques = pd.unique(keys[~pd.isna(keys)])[::-1]
+        lk, rk = keys, uniques[:-1]
+        if validate == '1:m':
+            lk, rk = rk, lk
+
+        result = _get_hash_join_indexers(lk, rk, how=how, validate=validate)
+        if validate == '1:m' and how == 'left':
+            assert result is None
+            return
+        expected = _get_join_indexers([lk], [rk], sort=False, how=how)
+        tm.assert_numpy_array_equal(result[0], expected[0])
+        tm.assert_numpy_array_equal(result[1], expected[1])
+
+    def test_hash_join_indexers_fallback(self):
+        lk = np.array([1, 2, 3], dtype=np.int64)
+
+        # duplicated build side
+        rk = np.array([1, 1], dtype=np.int64)
+        assert _get_hash_join_indexers(lk, rk, how='inner') is None
+
+        # larger undeclared build side
+        rk = np.array([1, 2, 3, 4], dtype=np.int64)
+        assert _get_hash_join_indexers(lk, rk, how='inner') is None
+        assert _get_hash_join_indexers(lk, rk, how='inner',
+                                       validate='m:1') is not None
+
+        # many-to-one with the smaller left side: the right side is hashed
+        lk = np.array([2, 2, 4], dtype=np.int64)
+        result = _get_hash_join_indexers(lk, rk, how='inner', validate='m:1')
+        expected = _get_join_indexers([lk], [rk], sort=False, how='inner')
+        tm.assert_numpy_array_equal(result[0], expected[0])
+        tm.assert_numpy_array_equal(result[1], expected[1])
+
+        # unsupported join types and dtypes
+        assert _get_hash_join_indexers(lk, lk, how='outer') is None
+        assert _get_hash_join_indexers(lk.astype(float), lk) is None
+        assert _get_hash_join_indexers(np.array(['a', nan], dtype=object),
+                                       np.array([nan], dtype=object)) is None
+
+    def test_merge_many_to_one_hash_join(self):
+        left = DataFrame({'key': ['b', 'a', 'c', 'b', 'd'],
+                          'lval': range(5)})
+        right = DataFrame({'key': ['c', 'b', 'a'], 'rval': [10, 20, 30]})
+
+        result = merge(left, right, on='key', how='left', validate='m:1')
+        expected = DataFrame({'key': ['b', 'a', 'c', 'b', 'd'],
+                              'lval': range(5),
+                              'rval': [20., 30., 10., 20., nan]})
+        assert_frame_equal(result, expected)
+
+        result = merge(left, right, on='key', how='inner')
+        expected = DataFrame({'key': ['b', 'b', 'a', 'c'],
+                              'lval': [0, 3, 1, 2],
+                              'rval': [20, 20, 30, 10]})
+        assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right', 'outer'])
+    @pytest.mark.parametrize('sort', [True, False])
+    @pytest.mark.parametrize('dtype', ['int64', 'uint64', 'float64',
+                                       'datetime64[ns]'])
+    @pytest.mark.parametrize('swap', [True, False])
+    def test_monotonic_join_indexers(self, how, sort, dtype, swap):
+        # the sorted-keys merge must give exactly the indexers of the
+        # factorizing join
+        lk = np.array([1, 2, 2, 2, 4, 5, 5, 7, 9], dtype=np.int64)
+        rk = np.array([0, 2, 3, 5, 6, 7, 10], dtype=np.int64)
+        if swap:
+            lk, rk = rk, lk
+        lk, rk = lk.astype(dtype), rk.astype(dtype)
+
+        result = _get_monotonic_join_indexers(lk, rk, sort=sort, how=how)
+        if how in ('right', 'outer') and not sort:
+            assert result is None
+            return
+        expected = _get_join_indexers([lk], [rk], sort=sort, how=how)
+        tm.assert_numpy_array_equal(result[0], expected[0])
+        tm.assert_numpy_array_equal(result[1], expected[1])
+
+    def test_monotonic_join_indexers_fallback(self):
+        lk = np.array([1, 2, 2, 3], dtype=np.int64)
+
+        # duplicates on both sides
+        assert _get_monotonic_join_indexers(lk, lk) is None
+
+        # not sorted
+        rk = np.array([3, 1, 2], dtype=np.int64)
+        assert _get_monotonic_join_indexers(lk, rk) is None
+
+        # NaN and NaT are not treated as monotonic
+        rk = np.array([1., 2., nan])
+        assert _get_monotonic_join_indexers(lk.astype(float), rk) is None
+        rk = np.array(['2018-01-01', 'NaT'], dtype='M8[ns]')
+        assert _get_monotonic_join_indexers(rk, rk[:1]) is None
+
+        # unsupported dtypes
+        assert _get_monotonic_join_indexers(lk, lk.astype(float)) is None
+        assert _get_monotonic_join_indexers(lk.astype(object),
+                                            lk.astype(object)) is None
+
+    def test_merge_sorted_keys(self):
+        left = DataFrame({'key': [1, 2, 2, 4], 'lval': list('abcd')})
+        right = DataFrame({'key': [0, 2, 4, 5], 'rval': [10, 20, 30, 40]})
+
+        result = merge(left, right, on='key', how='outer', sort=True)
+        expected = DataFrame({'key': [0, 1, 2, 2, 4, 5],
+                              'lval': [nan, 'a', 'b', 'c', 'd', nan],
+                              'rval': [10., nan, 20., 20., 30., 40.]})
+        assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right', 'outer'])
+    @pytest.mark.parametrize('sort', [True, False])
+    @pytest.mark.parametrize('keys', [
+        {'a': np.array([3, 1, 3, 7, 2, 1, 9, 3, 5, 1, 2, 8])},
+        {'a': np.array([0.5, -0.0, nan, 2.5, 0.0, nan,
+                        1.5, 0.5, 4.5, 2.5, 1.5, 3.5])},
+        {'a': np.array(['d', 'b', nan, 'h', 'c', 'b',
+                        None, 'j', 'b', 'c', 'a', 'd'], dtype=object)},
+        {'a': np.array([3, 1, 3, 1, 2, 1, 3, 3, 2, 1, 2, 1]),
+         'b': pd.date_range('2018', periods=3).values[
+            [0, 1, 1, 0, 2, 0, 0, 1, 2, 2, 0, 1]]}])
+    def test_merge_partitioned_engine(self, keys, how, sort):
+        on = sorted(keys)
+        left = DataFrame(keys).assign(lid=np.arange(12))
+        right = DataFrame({k: v[::-1][2:] for k, v in keys.items()})
+        right = right.assign(rid=np.arange(10))
+
+        result = merge(left, right, on=on, how=how, sort=sort,
+                       engine='partitioned', n_jobs=3)
+        expected = merge(left, right, on=on, how=how, sort=sort)
+
+        if not sort and how == 'right':
+            expected = expected.sort_values(['rid', 'lid'])
+        elif not sort and how != 'left':
+            # unspecified row order
+            expected = expected.sort_values(['lid', 'rid'])
+            result = result.sort_values(['lid', 'rid'])
+        assert_frame_equal(result.reset_index(drop=True),
+                           expected.reset_index(drop=True))
+
+    def test_merge_partitioned_engine_fallback(self):
+        # int and float keys hash differently, so do not partition
+        left = DataFrame({'a': [1, 2, 3], 'lval': [1, 2, 3]})
+        right = DataFrame({'a': [3., 1.], 'rval': [4, 5]})
+        result = merge(left, right, on='a', engine='partitioned', n_jobs=2)
+        expected = merge(left, right, on='a')
+        assert_frame_equal(result, expected)
+
+    def test_merge_partitioned_engine_raises(self):
+        left = DataFrame({'a': [1, 2, 3]})
+        with tm.assert_raises_regex(ValueError, 'engine must be'):
+            merge(left, left, on='a', engine='python')
+        for n_jobs in [0, 1.5]:
+            with tm.assert_raises_regex(ValueError, 'n_jobs must be'):
+                merge(left, left, on='a', engine='partitioned',
+                      n_jobs=n_jobs)
+
+        # n_jobs is only used by the partitioned engine
+        assert_frame_equal(merge(left, left, on='a', n_jobs=0), left)
+
 
 def _check_merge(x, y):
     for how in ['inner', 'left', 'outer']:
@@ -110,3 +110,10 @@ def test_standardize_mapping():
 
     dd = collections.defaultdict(list)
     assert isinstance(com.standardize_mapping(dd), partial)
+
+
+def test_get_thread_pool():
+    pool = com.get_thread_pool(2)
+    assert com.get_thread_pool(2) is pool
+    assert com.get_thread_pool(3) is not pool
+    assert pool.map(lambda x: x * 2, range(5)) == [0, 2, 4, 6, 8]
@@ -2,13 +2,15 @@ import pytest
 from itertools import product
 from collections import defaultdict
 import warnings
+import os
 from datetime import datetime
 
 import numpy as np
 from numpy import nan
 from pandas.core import common as com
-from pandas import (DataFrame, MultiIndex, merge, concat, Series, compat,
-                    _np_version_under1p10)
+from pandas import (Categorical, DataFrame, MultiIndex, merge, concat,
+                    Series, compat, _np_version_under1p10)
+from pandas.core.dtypes.common import is_categorical_dtype
 from pandas.util import testing as tm
 from pandas.util.testing import assert_frame_equal, assert_series_equal
 from pandas.core.sorting import (is_int64_overflow_possible,
@@ -16,7 +18,8 @@ from pandas.core.sorting import (is_int64_overflow_possible,
                                  get_group_index,
                                  nargsort,
                                  lexsort_indexer,
-                                 safe_sort)
+                                 safe_sort,
+                                 external_sort_values)
 
 
 class TestSorting(object):
@@ -122,6 +125,46 @@ class TestSorting(object):
         exp = list(range(5)) + list(range(105, 110)) + list(range(104, 4, -1))
         tm.assert_numpy_array_equal(result, np.array(exp, dtype=np.intp))
 
+    @pytest.mark.parametrize('orders', [True, False, [True, False, True]])
+    @pytest.mark.parametrize('na_position', ['first', 'last'])
+    @pytest.mark.parametrize('key', [
+        np.array([3, -1, 2, 3, 0, 2, -1, 0] * 5, dtype=np.int8),
+        np.array([True, False] * 20),
+        np.array([np.iinfo(np.int64).min, 5, -70000, np.iinfo(np.int64).max,
+                  0, 5, 123456789, -1] * 5),
+        np.array(['2018-01-02', 'NaT', '1970-01-01', '2018-01-02',
+                  'NaT', '2262-04-11', '1677-09-22', '2000-01-01'] * 5,
+                 dtype='M8[ns]'),
+        Categorical(['b', 'a', nan, 'c', 'b', nan, 'a', 'a'] * 5,
+                    categories=['c', 'b', 'a'])])
+    def test_lexsort_indexer_radix(self, key, orders, na_position):
+        # integer-like and categorical keys are radix sorted, which must
+        # match sorting the same values as objects
+        np.random.seed(1234)
+        other = np.random.randint(0, 3, len(key))
+        times = np.random.randint(0, 2 ** 40, len(key)).view('M8[ns]')
+        keys = [other, key, times]
+        result = lexsort_indexer(keys, orders=orders,
+                                 na_position=na_position)
+
+        def as_object(k):
+            if is_categorical_dtype(k):
+                return k
+            return Series(k).astype(object).values
+
+        expected = lexsort_indexer([as_object(k) for k in keys],
+                                   orders=orders, na_position=na_position)
+        tm.assert_numpy_array_equal(result, expected)
+
+    def test_lexsort_indexer_radix_empty(self):
+        keys = [np.array([], dtype=np.int64), Categorical([])]
+        result = lexsort_indexer(keys)
+        tm.assert_numpy_array_equal(result, np.array([], dtype=np.intp))
+
+        keys = [np.array(['NaT'] * 3, dtype='M8[ns]')]
+        result = lexsort_indexer(keys)
+        tm.assert_numpy_array_equal(result, np.arange(3, dtype=np.intp))
+
     def test_nargsort(self):
         # np.argsort(items) places NaNs last
         items = [nan] * 5 + list(range(100)) + [nan] * 5
@@ -435,3 +478,67 @@ class TestSafeSort(object):
         with tm.assert_raises_regex(ValueError,
                                     "values should be unique"):
             safe_sort(values=[0, 1, 2, 1], labels=[0, 1])
+
+
+class TestExternalSort(object):
+
+    @pytest.fixture
+    def chunks(self):
+        np.random.seed(1234)
+        n = 2000
+        df = DataFrame({'a': np.random.randint(0, 20, n).astype(float),
+                        'b': np.random.choice(list('xyz'), n),
+                        'c': np.arange(n)},
+                       index=np.random.permutation(n))
+        df.loc[df.index[::37], 'a'] = nan
+        return [df.iloc[i:i + 50] for i in range(0, n, 50)]
+
+    @pytest.mark.parametrize('by, ascending', [
+        ('a', True), ('a', False), (['b', 'a'], True),
+        (['a', 'b'], [False, True])])
+    @pytest.mark.parametrize('na_position', ['first', 'last'])
+    @pytest.mark.parametrize('memory_limit', [2 ** 40, 20000, 4000])
+    def test_external_sort_values(self, chunks, by, ascending, na_position,
+                                  memory_limit, tmpdir):
+        # 4000 bytes per run spills 40 runs and needs two merge passes
+        result = concat(external_sort_values(iter(chunks), by,
+                                             ascending=ascending,
+                                             na_position=na_position,
+                                             memory_limit=memory_limit,
+                                             tmpdir=str(tmpdir)))
+        expected = concat(chunks).sort_values(by, ascending=ascending,
+                                              na_position=na_position,
+                                              kind='mergesort')
+        assert_frame_equal(result, expected)
+        assert os.listdir(str(tmpdir)) == []
+
+    @pytest.mark.parametrize('ascending', [True, False])
+    def test_external_sort_values_ties(self, chunks, ascending, tmpdir):
+        # few distinct keys, the ties span every run
+        chunks = [chunk.assign(d=Categorical(chunk['b'],
+                                             categories=list('zyx')),
+                               e=1)
+                  for chunk in chunks]
+        for by in ['e', 'd', ['d', 'e']]:
+            result = concat(external_sort_values(
+                iter(chunks), by, ascending=ascending, memory_limit=4000,
+                tmpdir=str(tmpdir)))
+            expected = concat(chunks).sort_values(by, ascending=ascending,
+                                                  kind='mergesort')
+            assert_frame_equal(result, expected)
+
+    def test_external_sort_values_dataframe(self, chunks):
+        df = concat(chunks)
+        result = list(external_sort_values(df, 'c', ascending=False))
+        assert len(result) == 1
+        assert_frame_equal(result[0], df.sort_values('c', ascending=False))
+
+        assert list(external_sort_values([], 'c')) == []
+
+    def test_external_sort_values_raises(self, chunks):
+        with tm.assert_raises_regex(ValueError, 'Length of ascending'):
+            external_sort_values(chunks, ['a', 'b'], ascending=[True])
+        with tm.assert_raises_regex(ValueError, 'invalid na_position'):
+            external_sort_values(chunks, 'a', na_position='middle')
+        with tm.assert_raises_regex(ValueError, 'memory_limit'):
+            external_sort_values(chunks, 'a', memory_limit=0)
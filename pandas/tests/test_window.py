@@ -12,6 +12,7 @@ import pandas as pd
 from pandas import (Series, DataFrame, bdate_range,
                     isna, notna, concat, Timestamp, Index)
 import pandas.core.window as rwindow
+from pandas.core.window import OnlineRolling, OnlineEWM
 import pandas.tseries.offsets as offsets
 from pandas.core.base import SpecificationError
 from pandas.errors import UnsupportedFunctionCall
@@ -573,6 +574,38 @@ class TestRolling(Base):
         with pytest.raises(NotImplementedError):
             iter(obj.rolling(2))
 
+    @pytest.mark.parametrize('method', ['sum', 'mean', 'var', 'std', 'max',
+                                        'median', 'skew'])
+    @pytest.mark.parametrize('window', [5, '5D'])
+    @pytest.mark.parametrize('center', [True, False])
+    @pytest.mark.parametrize('nthreads', [1, 3])
+    def test_rolling_frame_matches_columns(self, method, window, center,
+                                           nthreads):
+        # 2D kernels and threaded column chunks must roll each column
+        # exactly like a Series
+        if center and not isinstance(window, int):
+            pytest.skip('center is not implemented for offset windows')
+        df = DataFrame(randn(50, 7), index=bdate_range('2018', periods=50))
+        df.iloc[10:15, 2] = np.nan
+        df[7] = np.arange(50)
+
+        expected = DataFrame({c: getattr(df[c].rolling(window, min_periods=2,
+                                                        center=center),
+                                         method)()
+                              for c in df.columns}, columns=df.columns)
+
+        with pd.option_context('compute.rolling_threads', nthreads):
+            result = getattr(df.rolling(window, min_periods=2,
+                                        center=center), method)()
+        tm.assert_frame_equal(result, expected)
+
+        if isinstance(window, int):
+            with pd.option_context('compute.rolling_threads', nthreads):
+                result = getattr(df.T.rolling(window, min_periods=2,
+                                              center=center, axis=1),
+                                 method)()
+            tm.assert_frame_equal(result.T, expected)
+
 
 class TestExpanding(Base):
 
@@ -1283,6 +1316,74 @@ class TestMoments(Base):
         with pytest.raises(TypeError):
             ser.rolling(3).quantile('foo')
 
+    @pytest.mark.parametrize('interpolation', ['linear', 'lower', 'higher',
+                                               'nearest', 'midpoint'])
+    @pytest.mark.parametrize('center', [True, False])
+    def test_rolling_quantile_list(self, interpolation, center):
+        quantiles = [0.0, 0.05, 0.25, 0.5, 0.75, 0.95, 1.0]
+        s = self.series.copy()
+        s[5:15] = np.NaN
+
+        r = s.rolling(20, min_periods=5, center=center)
+        result = r.quantile(quantiles, interpolation=interpolation)
+        expected = pd.concat([r.quantile(q, interpolation=interpolation)
+                              for q in quantiles], axis=1)
+        expected.columns = pd.Index(quantiles)
+        tm.assert_frame_equal(result, expected)
+
+        # expanding and time-based windows
+        result = s.expanding().quantile(quantiles)
+        expected = pd.concat([s.expanding().quantile(q) for q in quantiles],
+                             axis=1)
+        expected.columns = pd.Index(quantiles)
+        tm.assert_frame_equal(result, expected)
+
+        ts = s.copy()
+        ts.index = pd.date_range('20130101', periods=len(s), freq='s')
+        result = ts.rolling('10s').quantile(quantiles)
+        expected = pd.concat([ts.rolling('10s').quantile(q)
+                              for q in quantiles], axis=1)
+        expected.columns = pd.Index(quantiles)
+        tm.assert_frame_equal(result, expected)
+
+    def test_rolling_quantile_list_frame(self):
+        quantiles = [0.1, 0.5, 0.9]
+        df = DataFrame({'A': np.random.randn(50),
+                        'B': np.arange(50)},
+                       columns=['B', 'A'])
+
+        result = df.rolling(10).quantile(quantiles)
+        expected = pd.concat([df[c].rolling(10).quantile(quantiles)
+                              for c in df.columns], axis=1,
+                             keys=df.columns)
+        expected.columns = pd.MultiIndex.from_product([df.columns,
+                                                       quantiles])
+        tm.assert_frame_equal(result, expected)
+
+        # groupby applies to each group
+        g = df.groupby(np.arange(50) % 3)
+        result = g.rolling(5).quantile(quantiles)
+        expected = g.apply(lambda x: x.rolling(5).quantile(quantiles))
+        tm.assert_frame_equal(result, expected)
+
+        with pytest.raises(ValueError):
+            df.rolling(10).quantile([0.5, 1.5])
+
+    def test_rolling_quantile_list_duplicate_columns(self):
+        quantiles = [0.1, 0.5, 0.9]
+        df = DataFrame({'A': np.random.randn(50),
+                        'B': np.arange(50),
+                        'C': np.random.randn(50)},
+                       columns=['A', 'B', 'C'])
+        df.columns = ['X', 'Y', 'X']
+
+        result = df.rolling(10).quantile(quantiles)
+        expected = pd.concat([df.iloc[:, i].rolling(10).quantile(quantiles)
+                              for i in range(3)], axis=1)
+        expected.columns = pd.MultiIndex.from_product([df.columns,
+                                                       quantiles])
+        tm.assert_frame_equal(result, expected)
+
     def test_rolling_apply(self, raw):
         # suppress warnings about empty slices, as we are deliberately testing
         # with a 0-length Series
@@ -1654,6 +1755,78 @@ class TestMoments(Base):
         with pytest.raises(ValueError):
             self.series.ewm().mean()
 
+    @pytest.mark.parametrize('method', ['mean', 'var', 'std'])
+    def test_times(self, method):
+        # irregular times give the same results as the observations
+        # resampled to a regular frequency
+        days = [0, 2, 3, 9, 14, 16, 17, 30]
+        index = pd.Timestamp('20130101') + pd.to_timedelta(days, unit='D')
+        s = Series([1., 4., np.nan, 2., 8., 5., np.nan, 3.])
+
+        result = getattr(s.ewm(halflife='4 days', times=index), method)()
+        resampled = Series(s.values, index=index).resample('D').asfreq()
+        expected = getattr(resampled.ewm(halflife=4), method)()
+        expected = Series(expected.reindex(index).values)
+        tm.assert_series_equal(result, expected)
+
+        # the weights follow the times whether or not missing values are
+        # ignored
+        result = getattr(s.ewm(halflife='4 days', times=index,
+                               ignore_na=True), method)()
+        valid = s.notna().values
+        expected = getattr(s[valid].ewm(halflife='4 days',
+                                        times=index[valid]), method)()
+        tm.assert_series_equal(result[valid], expected)
+
+    def test_times_cov(self):
+        index = pd.Timestamp('20130101') + pd.to_timedelta(
+            np.sort(np.random.randint(0, 1000, 50)), unit='s')
+        df = DataFrame(np.random.randn(50, 2), columns=['A', 'B'])
+        e = df.ewm(halflife='20s', times=index)
+
+        result = e.cov(pairwise=True).loc[(slice(None), 'A'), 'B']
+        expected = df['A'].ewm(halflife='20s', times=index).cov(df['B'])
+        tm.assert_numpy_array_equal(result.values, expected.values)
+
+        result = e.corr()
+        assert np.allclose(result.loc[(slice(None), 'A'), 'A'].dropna(), 1)
+
+        # times as a column
+        df['time'] = index
+        result = df.ewm(halflife='20s', times='time').mean()
+        expected = e.mean()
+        expected['time'] = index
+        tm.assert_frame_equal(result, expected)
+
+        # the times column stays out of a selection
+        e = df.ewm(halflife='20s', times='time')
+        assert 'times=time' in repr(e)
+        tm.assert_frame_equal(e[['A', 'time']].mean(), expected[['A', 'time']])
+        tm.assert_series_equal(e['B'].mean(), expected['B'])
+
+    def test_times_raises(self):
+        s = Series(range(5))
+        times = pd.date_range('20130101', periods=5)
+
+        with pytest.raises(ValueError, match="must be the same length"):
+            s.ewm(halflife='1 day', times=times[:-1])
+        with pytest.raises(ValueError, match="datetime64"):
+            s.ewm(halflife='1 day', times=np.arange(5))
+        with pytest.raises(ValueError, match="monotonically increasing"):
+            s.ewm(halflife='1 day', times=times[::-1])
+        with pytest.raises(ValueError, match="NaT"):
+            s.ewm(halflife='1 day', times=times.insert(0, pd.NaT)[:-1])
+        with pytest.raises(ValueError, match="halflife must be a string"):
+            s.ewm(halflife=1, times=times)
+        with pytest.raises(ValueError, match="halflife > 0"):
+            s.ewm(halflife='0 days', times=times)
+        with pytest.raises(ValueError, match="can not be used with times"):
+            s.ewm(com=1, halflife='1 day', times=times)
+        with pytest.raises(ValueError, match="timedelta convertible"):
+            s.ewm(halflife='1 day')
+        with pytest.raises(NotImplementedError):
+            s.ewm(halflife='1 day', times=times, adjust=False)
+
     def test_ewma_halflife_arg(self):
         A = self.series.ewm(com=13.932726172912965).mean()
         B = self.series.ewm(halflife=10.0).mean()
@@ -1933,6 +2106,79 @@ class TestPairwise(object):
             if i > 0:
                 self.compare(result, results[0])
 
+    @pytest.mark.parametrize(
+        'f', [lambda x, y: x.cov(y, pairwise=True),
+              lambda x, y: x.cov(y, pairwise=True, ddof=0),
+              lambda x, y: x.corr(y, pairwise=True)])
+    @pytest.mark.parametrize(
+        'window', [lambda x: x.rolling(window=5, min_periods=2),
+                   lambda x: x.rolling(window=5, center=True),
+                   lambda x: x.rolling('3s', min_periods=2),
+                   lambda x: x.expanding()])
+    def test_pairwise_all_columns(self, f, window):
+
+        # all of the pairs are computed at once, this must match
+        # computing each pair on its own
+        index = pd.date_range('20130101', periods=30, freq='s')
+        df = DataFrame(np.random.randn(30, 3), index=index,
+                       columns=['A', 'B', 'C'])
+        df.iloc[3:6, 0] = np.nan
+        df.iloc[10, 1] = np.nan
+        other = DataFrame(np.random.randn(30, 2), index=index,
+                          columns=['X', 'Y'])
+        other.iloc[20:22, 1] = np.nan
+
+        for arg2 in [None, other]:
+            result = f(window(df), arg2)
+
+            if arg2 is None:
+                arg2 = df
+            expected = DataFrame(
+                {c1: pd.concat([f(window(df[c1]), arg2[c2])
+                                for c2 in arg2.columns],
+                               keys=arg2.columns).swaplevel().sort_index()
+                 for c1 in df.columns},
+                columns=df.columns)
+            tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('corr', [False, True])
+    def test_roll_pairwise_upper(self, corr):
+
+        # the 3d (rows, columns, columns) array, with only the upper
+        # triangle of each window filled
+        X = np.random.randn(20, 3)
+        X[5, 1] = np.nan
+        r = DataFrame(X).rolling(window=5, min_periods=2)
+        full = r._roll_pairwise(X, X, 5, corr=corr)
+        result = r._roll_pairwise(X, X, 5, corr=corr, upper=True)
+        assert result.shape == (20, 3, 3)
+
+        upper = np.triu(np.ones((3, 3), dtype=bool))
+        tm.assert_numpy_array_equal(result[:, upper], full[:, upper])
+        assert np.isnan(result[:, ~upper]).all()
+
+    @pytest.mark.parametrize(
+        'f', [lambda x, y: x.cov(y, pairwise=True),
+              lambda x, y: x.corr(y, pairwise=True)])
+    def test_pairwise_all_columns_inf(self, f):
+
+        # +/-inf is treated as NaN, as when computing each pair on its own
+        df = DataFrame(np.random.randn(20, 3), columns=['A', 'B', 'C'])
+        df.iloc[4, 0] = np.inf
+        df.iloc[12, 1] = -np.inf
+        result = f(df.rolling(window=5, min_periods=2), None)
+
+        expected = DataFrame(
+            {c1: pd.concat([f(df[c1].rolling(window=5, min_periods=2),
+                              df[c2])
+                            for c2 in df.columns],
+                           keys=df.columns).swaplevel().sort_index()
+             for c1 in df.columns},
+            columns=df.columns)
+        tm.assert_frame_equal(result, expected)
+        assert result.loc[(19, 'B'), 'A'] == result.loc[(19, 'A'), 'B']
+        assert not np.isnan(result.loc[19, 'A']).any()
+
 
 # create the data only once as we are not setting it
 def _create_consistency_data():
@@ -3213,6 +3459,54 @@ class TestGrouperGrouping(object):
         expected = g.apply(lambda x: x.rolling(4).quantile(0.5))
         tm.assert_frame_equal(result, expected)
 
+    @pytest.mark.parametrize('f', ['sum', 'mean', 'var', 'std',
+                                   'skew', 'kurt'])
+    @pytest.mark.parametrize('center', [True, False])
+    def test_rolling_unsorted_groups(self, f, center):
+        # groups interleaved, with missing keys and values
+        df = DataFrame({'A': np.random.randint(0, 4, 100).astype(float),
+                        'B': np.random.randint(0, 2, 100),
+                        'C': np.random.randn(100)},
+                       index=np.random.permutation(100))
+        df.iloc[::7, 0] = np.nan
+        df.iloc[::5, 2] = np.nan
+
+        for keys in ['A', ['A', 'B']]:
+            g = df.groupby(keys)
+            r = g.rolling(window=5, min_periods=2, center=center)
+
+            result = getattr(r, f)()
+            expected = g.apply(lambda x: getattr(
+                x.rolling(5, min_periods=2, center=center), f)())
+            tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('closed', ['right', 'left', 'both', 'neither'])
+    def test_rolling_unsorted_groups_time(self, closed):
+        df = DataFrame({'A': list('abcb') * 15,
+                        'B': np.random.randn(60)},
+                       index=pd.date_range('20130101', periods=60,
+                                           freq='s'))
+        g = df.groupby('A')
+        r = g.rolling('5s', closed=closed)
+
+        for f in ['sum', 'mean', 'std', 'var']:
+            result = getattr(r, f)()
+            expected = g.apply(lambda x: getattr(
+                x.rolling('5s', closed=closed), f)())
+            tm.assert_frame_equal(result, expected)
+
+    def test_expanding_unsorted_groups(self):
+        df = DataFrame({'A': [3, 1, 2, 1, 3, 2, 1, np.nan, 3, 1],
+                        'B': np.arange(10.)})
+        g = df.groupby('A', sort=False)
+        r = g.expanding(min_periods=2)
+
+        for f in ['sum', 'mean', 'var', 'std']:
+            result = getattr(r, f)()
+            expected = g.apply(lambda x: getattr(
+                x.expanding(min_periods=2), f)())
+            tm.assert_frame_equal(result, expected)
+
     def test_rolling_corr_cov(self):
         g = self.frame.groupby('A')
         r = g.rolling(window=4)
@@ -3958,3 +4252,206 @@ class TestRollingTS(object):
 
         expected2 = ss.rolling(3, min_periods=1).cov()
         tm.assert_series_equal(result, expected2)
+
+
+class TestBaseIndexer(object):
+
+    def setup_method(self, method):
+        arr = randn(51)
+        arr[::7] = np.nan
+        self.series = Series(arr)
+
+    class ForwardIndexer(rwindow.BaseIndexer):
+        def get_window_bounds(self, num_values=0, min_periods=None,
+                              center=None, closed=None):
+            start = np.arange(num_values, dtype='int64')
+            end = np.minimum(start + self.window_size, num_values)
+            return start, end
+
+    class FixedIndexer(rwindow.BaseIndexer):
+        def get_window_bounds(self, num_values=0, min_periods=None,
+                              center=None, closed=None):
+            end = np.arange(1, num_values + 1, dtype='int64')
+            start = np.maximum(end - self.window_size, 0)
+            return start, end
+
+    def test_public_api(self):
+        assert pd.api.indexers.BaseIndexer is rwindow.BaseIndexer
+
+    @pytest.mark.parametrize('func', ['sum', 'mean', 'max', 'min', 'median',
+                                      'std', 'var', 'skew', 'kurt'])
+    def test_fixed_window(self, func):
+        indexer = self.FixedIndexer(window_size=5)
+        result = getattr(self.series.rolling(indexer), func)()
+        expected = getattr(self.series.rolling(5, min_periods=1), func)()
+        tm.assert_series_equal(result, expected)
+
+        frame = DataFrame({'A': self.series, 'B': self.series * 2})
+        result = getattr(frame.rolling(indexer, min_periods=3), func)()
+        expected = getattr(frame.rolling(5, min_periods=3), func)()
+        tm.assert_frame_equal(result, expected)
+
+    @pytest.mark.parametrize('func', ['sum', 'mean', 'max', 'min', 'median',
+                                      'std', 'var', 'skew', 'kurt'])
+    def test_forward_window(self, func):
+        indexer = self.ForwardIndexer(window_size=5)
+        result = getattr(self.series.rolling(indexer), func)()
+        expected = getattr(self.series[::-1].rolling(5, min_periods=1),
+                           func)()[::-1]
+        tm.assert_series_equal(result, expected)
+
+    def test_forward_window_apply_quantile(self, raw):
+        indexer = self.ForwardIndexer(window_size=3)
+        reverse = self.series[::-1].rolling(3, min_periods=1)
+
+        result = self.series.rolling(indexer).apply(np.nansum, raw=raw)
+        expected = reverse.apply(np.nansum, raw=raw)[::-1]
+        tm.assert_series_equal(result, expected)
+
+        result = self.series.rolling(indexer).quantile(0.3)
+        expected = reverse.quantile(0.3)[::-1]
+        tm.assert_series_equal(result, expected)
+
+        result = self.series.rolling(indexer).count()
+        expected = reverse.count()[::-1]
+        tm.assert_series_equal(result, expected)
+
+    def test_non_overlapping_windows(self):
+        # windows that skip ahead of the previous one
+        class EveryOther(rwindow.BaseIndexer):
+            def get_window_bounds(self, num_values=0, min_periods=None,
+                                  center=None, closed=None):
+                start = np.arange(num_values, dtype='int64') // 2 * 2
+                end = np.minimum(start + 2, num_values)
+                return start, end
+
+        s = Series([1., 2., 10., 20., 100., 200., np.nan])
+        r = s.rolling(EveryOther())
+        tm.assert_series_equal(r.sum(), Series([3., 3., 30., 30., 300., 300.,
+                                                np.nan]))
+        tm.assert_series_equal(r.max(), Series([2., 2., 20., 20., 200., 200.,
+                                                np.nan]))
+        tm.assert_series_equal(r.median(), Series([1.5, 1.5, 15., 15., 150.,
+                                                   150., np.nan]))
+
+    def test_closed_passed(self):
+        class ClosedIndexer(rwindow.BaseIndexer):
+            def get_window_bounds(self, num_values=0, min_periods=None,
+                                  center=None, closed=None):
+                end = np.arange(num_values, dtype='int64')
+                if closed == 'both':
+                    end += 1
+                return np.zeros(num_values, dtype='int64'), end
+
+        s = Series([1., 2., 3.])
+        result = s.rolling(ClosedIndexer(), closed='both').sum()
+        tm.assert_series_equal(result, Series([1., 3., 6.]))
+        result = s.rolling(ClosedIndexer(), closed='left').sum()
+        tm.assert_series_equal(result, Series([np.nan, 1., 3.]))
+
+    def test_invalid_bounds(self):
+        class Bounds(rwindow.BaseIndexer):
+            def get_window_bounds(self, num_values=0, min_periods=None,
+                                  center=None, closed=None):
+                return np.array(self.start), np.array(self.end)
+
+        s = Series([1., 2., 3.])
+        with pytest.raises(NotImplementedError):
+            s.rolling(rwindow.BaseIndexer()).sum()
+        with tm.assert_raises_regex(ValueError, "of length 3"):
+            s.rolling(Bounds(start=[0, 0], end=[1, 2])).sum()
+        with tm.assert_raises_regex(ValueError, "between 0 and 3"):
+            s.rolling(Bounds(start=[0, 0, 0], end=[1, 2, 4])).sum()
+        with tm.assert_raises_regex(ValueError, "<= its end"):
+            s.rolling(Bounds(start=[0, 2, 2], end=[1, 1, 3])).sum()
+        with tm.assert_raises_regex(ValueError, "monotonic"):
+            s.rolling(Bounds(start=[1, 0, 0], end=[2, 2, 3])).sum()
+
+
+class TestOnline(object):
+
+    def setup_method(self, method):
+        arr = randn(100)
+        arr[::9] = np.nan
+        arr[5:15] = np.nan
+        self.series = Series(arr)
+
+    def _chunks(self, obj, sizes=(7, 1, 20, 33)):
+        start = 40
+        for size in sizes:
+            yield obj.iloc[start:start + size]
+            start += size
+        yield obj.iloc[start:]
+
+    @pytest.mark.parametrize('func', ['sum', 'mean', 'var', 'std',
+                                      'median'])
+    @pytest.mark.parametrize('min_periods', [None, 0, 3])
+    def test_rolling(self, func, min_periods):
+        if min_periods == 0 and func in ['var', 'std']:
+            min_periods = 1
+        r = self.series.rolling(10, min_periods=min_periods)
+        expected = getattr(r, func)()
+
+        online = self.series.iloc[:40].rolling(
+            10, min_periods=min_periods).online(func)
+        result = pd.concat([online.update(chunk)
+                            for chunk in self._chunks(self.series)])
+        tm.assert_series_equal(result, expected.iloc[40:])
+
+    def test_rolling_frame(self):
+        df = DataFrame({'A': self.series, 'B': self.series[::-1].values,
+                        'C': np.arange(100)})
+        expected = df.rolling(5).var(ddof=0)
+
+        online = df.iloc[:40].rolling(5).online('var', ddof=0)
+        result = pd.concat([online.update(chunk)
+                            for chunk in self._chunks(df)])
+        tm.assert_frame_equal(result, expected.iloc[40:])
+
+        with tm.assert_raises_regex(ValueError, "same columns"):
+            online.update(df[['A', 'B']])
+        with tm.assert_raises_regex(ValueError, "same columns"):
+            online.update(df['A'])
+
+    @pytest.mark.parametrize('func', ['mean', 'median'])
+    def test_rolling_pickle(self, func):
+        expected = getattr(self.series.rolling(10), func)()
+
+        online = OnlineRolling(10, func)
+        first = online.update(self.series.iloc[:50])
+        online = tm.round_trip_pickle(online)
+        second = online.update(self.series.iloc[50:])
+        tm.assert_series_equal(pd.concat([first, second]), expected)
+
+    @pytest.mark.parametrize('adjust', [True, False])
+    @pytest.mark.parametrize('ignore_na', [True, False])
+    def test_ewm(self, adjust, ignore_na):
+        kwargs = dict(com=3., min_periods=2, adjust=adjust,
+                      ignore_na=ignore_na)
+        expected = self.series.ewm(**kwargs).mean()
+
+        online = self.series.iloc[:40].ewm(**kwargs).online()
+        result = pd.concat([online.update(chunk)
+                            for chunk in self._chunks(self.series)])
+        tm.assert_series_equal(result, expected.iloc[40:])
+
+        online = OnlineEWM(**kwargs)
+        first = online.update(self.series.iloc[:50])
+        online = tm.round_trip_pickle(online)
+        second = online.update(self.series.iloc[50:])
+        tm.assert_series_equal(pd.concat([first, second]), expected)
+
+    def test_raises(self):
+        s = Series(range(5), index=pd.date_range('20130101', periods=5))
+        for r in [s.rolling('2D'), s.rolling(2, center=True)]:
+            with pytest.raises(NotImplementedError):
+                r.online('sum')
+
+        with tm.assert_raises_regex(ValueError, "func must be one of"):
+            OnlineRolling(3, 'max')
+        with tm.assert_raises_regex(ValueError, "positive integer"):
+            OnlineRolling(0, 'sum')
+        with tm.assert_raises_regex(ValueError, "min_periods"):
+            OnlineRolling(3, 'sum', min_periods=4).update(s)
+        with tm.assert_raises_regex(TypeError, "invalid type"):
+            OnlineRolling(3, 'sum').update(s.values)